@@ -5,6 +5,7 @@ import logging
 
 from django.apps import AppConfig
 
+from lamb.conf import refresh_lamb_settings
 from lamb.utils import inject_app_defaults, inject_date_format
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,8 @@ class LambAppConfig(AppConfig):
         inject_app_defaults(__name__)
         inject_date_format()
         logger.debug(f"<{self.__class__.__name__}>. Lamb default settings injected")
+        refresh_lamb_settings()
+        logger.debug(f"<{self.__class__.__name__}>. Lamb settings snapshot built")
 
 
 default_app_config = "lamb.LambAppConfig"
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from lamb import settings as lamb_defaults
+from lamb.exc import ImproperlyConfiguredError
+
+__all__ = ["LambSettings", "get_lamb_settings", "on_lamb_settings_refresh", "refresh_lamb_settings"]
+
+logger = logging.getLogger(__name__)
+
+
+def _setting(name: str) -> Any:
+    return getattr(settings, name, getattr(lamb_defaults, name, None))
+
+
+def _failed_import(path: str, error: Exception, *args, **kwargs):
+    raise ImproperlyConfiguredError(f"Could not import {path}") from error
+
+
+def _import_setting(name: str, fallback_none: bool = False) -> Any:
+    """Object imported from dotted name stored in setting
+
+    Failed import does not break snapshot - returned callable raises `ImproperlyConfiguredError` on use, so error
+    surfaces at the same place as with import on demand. With `fallback_none` failed import is replaced with None.
+    """
+    # lamb.utils imports this module - load lazily to omit cycle loading
+    from lamb.utils.core import import_by_name
+
+    path = _setting(name)
+    if path is None or not isinstance(path, str):
+        return path
+    try:
+        return import_by_name(path)
+    except Exception as e:
+        logger.exception(f"{name}: could not import {path}")
+        if fallback_none:
+            return None
+        return functools.partial(_failed_import, path, e)
+
+
+@dataclasses.dataclass(frozen=True)
+class LambSettings:
+    """Frozen snapshot of lamb settings used on hot paths
+
+    Snapshot is built once after application defaults injected and invalidated on `setting_changed` signal for any
+    `LAMB_*` setting (`override_settings` and others), values resolved from dotted names are stored pre-imported.
+
+    Usage::
+
+        from lamb.conf import get_lamb_settings
+
+        lamb_settings = get_lamb_settings()
+        limit = params.get(lamb_settings.pagination_key_limit)
+
+    """
+
+    # response
+    response_apply_to_apps: frozenset[str]
+    response_compression_skip_apps: frozenset[str]
+    response_json_indent: int | None
+    response_json_engine: str | None
+    response_date_format: str
+    response_encoder_class: type
+    response_datetime_transformer: Callable
+    response_exception_serializer: Callable | None
+    error_override_processor: Callable | None
+
+    # pagination
+    pagination_limit_default: int
+    pagination_limit_max: int
+    pagination_key_offset: str
+    pagination_key_limit: str
+    pagination_key_omit_total: str
+    pagination_key_cursor: str
+    pagination_key_next_cursor: str
+    pagination_key_items: str
+    pagination_key_items_extended: str
+    pagination_key_total: str
+    pagination_key_total_exact: str
+    pagination_total_strategy: str
+    pagination_estimate_threshold: int
+    pagination_total_cache_prefix: str
+    pagination_total_cache_ttl: int | None
+
+    # compression
+    response_compression_min_size: int
+    response_compression_levels: dict[str, int]
+
+    # sorting and fields
+    sorting_key: str
+    sorting_index_aware: str | None
+    response_fields_key: str
+
+    # device info
+    device_info_class: type
+
+    @classmethod
+    def from_settings(cls) -> LambSettings:
+        return cls(
+            response_apply_to_apps=frozenset(_setting("LAMB_RESPONSE_APPLY_TO_APPS") or []),
+            response_compression_skip_apps=frozenset(_setting("LAMB_RESPONSE_COMPRESSION_SKIP_APPS") or []),
+            response_json_indent=_setting("LAMB_RESPONSE_JSON_INDENT"),
+            response_json_engine=_setting("LAMB_RESPONSE_JSON_ENGINE"),
+            response_date_format=_setting("LAMB_RESPONSE_DATE_FORMAT"),
+            response_encoder_class=_import_setting("LAMB_RESPONSE_ENCODER"),
+            response_datetime_transformer=_import_setting("LAMB_RESPONSE_DATETIME_TRANSFORMER"),
+            response_exception_serializer=_import_setting("LAMB_RESPONSE_EXCEPTION_SERIALIZER", fallback_none=True),
+            error_override_processor=_import_setting("LAMB_ERROR_OVERRIDE_PROCESSOR"),
+            pagination_limit_default=_setting("LAMB_PAGINATION_LIMIT_DEFAULT"),
+            pagination_limit_max=_setting("LAMB_PAGINATION_LIMIT_MAX"),
+            pagination_key_offset=_setting("LAMB_PAGINATION_KEY_OFFSET"),
+            pagination_key_limit=_setting("LAMB_PAGINATION_KEY_LIMIT"),
+            pagination_key_omit_total=_setting("LAMB_PAGINATION_KEY_OMIT_TOTAL"),
+            pagination_key_cursor=_setting("LAMB_PAGINATION_KEY_CURSOR"),
+            pagination_key_next_cursor=_setting("LAMB_PAGINATION_KEY_NEXT_CURSOR"),
+            pagination_key_items=_setting("LAMB_PAGINATION_KEY_ITEMS"),
+            pagination_key_items_extended=_setting("LAMB_PAGINATION_KEY_ITEMS_EXTENDED"),
+            pagination_key_total=_setting("LAMB_PAGINATION_KEY_TOTAL"),
+            pagination_key_total_exact=_setting("LAMB_PAGINATION_KEY_TOTAL_EXACT"),
+            pagination_total_strategy=_setting("LAMB_PAGINATION_TOTAL_STRATEGY"),
+            pagination_estimate_threshold=_setting("LAMB_PAGINATION_ESTIMATE_THRESHOLD"),
+            pagination_total_cache_prefix=_setting("LAMB_PAGINATION_TOTAL_CACHE_PREFIX"),
+            pagination_total_cache_ttl=_setting("LAMB_PAGINATION_TOTAL_CACHE_TTL"),
+            response_compression_min_size=_setting("LAMB_RESPONSE_COMPRESSION_MIN_SIZE"),
+            response_compression_levels=dict(_setting("LAMB_RESPONSE_COMPRESSION_LEVELS") or {}),
+            sorting_key=_setting("LAMB_SORTING_KEY"),
+            sorting_index_aware=_setting("LAMB_SORTING_INDEX_AWARE"),
+            response_fields_key=_setting("LAMB_RESPONSE_FIELDS_KEY"),
+            device_info_class=_import_setting("LAMB_DEVICE_INFO_CLASS"),
+        )
+
+
+_snapshot: LambSettings | None = None
+_refresh_callbacks: list[Callable[[], None]] = []
+
+
+def on_lamb_settings_refresh(func: Callable[[], None]) -> Callable[[], None]:
+    """Register callback dropping module level caches derived from settings, called on snapshot invalidation
+
+    Usage::
+
+        @on_lamb_settings_refresh
+        def _reset_codecs():
+            global _codecs_cache
+            _codecs_cache = None
+
+    """
+    _refresh_callbacks.append(func)
+    return func
+
+
+def _invalidate():
+    global _snapshot
+
+    _snapshot = None
+    for callback in _refresh_callbacks:
+        callback()
+
+
+def get_lamb_settings() -> LambSettings:
+    """Current settings snapshot, built on first access after invalidation"""
+    global _snapshot
+
+    result = _snapshot
+    if result is None:
+        result = _snapshot = LambSettings.from_settings()
+        logger.debug(f"lamb settings snapshot built: {result}")
+    return result
+
+
+def refresh_lamb_settings() -> LambSettings:
+    """Drop current snapshot with derived caches and build new one"""
+    _invalidate()
+    return get_lamb_settings()
+
+
+@receiver(setting_changed)
+def _on_setting_changed(setting: str, **kwargs):
+    if setting.startswith("LAMB_"):
+        _invalidate()
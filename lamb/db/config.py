@@ -12,7 +12,13 @@ from lamb.exc import ImproperlyConfiguredError, ServerError
 from lamb.utils import get_settings_value
 from lamb.utils.core import compact, masked_url
 
-__all__ = ["Config", "parse_django_config"]
+__all__ = [
+    "REPLICA_STRATEGY_LEAST_CONNECTIONS",
+    "REPLICA_STRATEGY_WEIGHTED",
+    "Config",
+    "ReplicaConfig",
+    "parse_django_config",
+]
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +29,25 @@ class InvalidDatabaseConfigError(ImproperlyConfiguredError):
 
 auto = object()
 
+REPLICA_STRATEGY_WEIGHTED = "weighted"
+REPLICA_STRATEGY_LEAST_CONNECTIONS = "least_connections"
+
+
+@dataclasses.dataclass(frozen=True)
+class ReplicaConfig:
+    """Read replica endpoint, omitted connection params are taken from primary config"""
+
+    host: str | None = None
+    port: int | None = None
+    weight: float = 1
+    username: str | None = None
+    password: str | None = None
+    db_name: str | None = None
+
+    def __post_init__(self):
+        if self.weight <= 0:
+            raise InvalidDatabaseConfigError(f"Replica weight should be positive: {self.weight}")
+
 
 @dataclasses.dataclass(frozen=True)
 class Config:
@@ -43,6 +68,13 @@ class Config:
     asession_options: Callable | dict[str, Any] | None = None
     aengine_options: Callable | dict[str, Any] | None = None
 
+    # read replicas
+    replicas: list[ReplicaConfig | dict[str, Any]] | None = None
+    replica_strategy: str = REPLICA_STRATEGY_WEIGHTED
+    replica_max_lag: float | None = None
+    replica_lag_check_interval: float = 5
+    replica_lag_query: str | None = None
+
     def __post_init__(self):
         # TODO: check only for postrgesql
         if isinstance(self.host, list) and len(self.host) == 1:
@@ -55,11 +87,30 @@ class Config:
             app_name = get_settings_value("LAMB_APP_NAME", default=None)
             object.__setattr__(self, "app_name", app_name)
 
+        if self.replicas is not None:
+            replicas = tuple(r if isinstance(r, ReplicaConfig) else ReplicaConfig(**r) for r in self.replicas)
+            object.__setattr__(self, "replicas", replicas or None)
+        if self.replica_strategy not in (REPLICA_STRATEGY_WEIGHTED, REPLICA_STRATEGY_LEAST_CONNECTIONS):
+            raise InvalidDatabaseConfigError(f"Unknown replica strategy: {self.replica_strategy}")
+
     # properties
     @property
     def multi_host(self) -> bool:
         return isinstance(self.host, list) and len(self.host) > 1
 
+    def replica_(self, index: int) -> Config:
+        """Config of replica endpoint - primary config with replica connection params"""
+        replica = self.replicas[index]
+        return dataclasses.replace(
+            self,
+            host=replica.host if replica.host is not None else self.host,
+            port=replica.port if replica.port is not None else self.port,
+            username=replica.username if replica.username is not None else self.username,
+            password=replica.password if replica.password is not None else self.password,
+            db_name=replica.db_name if replica.db_name is not None else self.db_name,
+            replicas=None,
+        )
+
     # connection string
     def connection_string_(self, sync: bool, pooled: bool) -> str:
         _driver = self.driver if sync else self.async_driver
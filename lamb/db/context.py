@@ -1,13 +1,17 @@
+import asyncio
+import contextlib
 import logging
+from collections.abc import Iterable, Iterator, Mapping
 
+from sqlalchemy.ext.asyncio import AsyncSession as SAAsyncSession
 from sqlalchemy.orm.session import Session as SASession
 
-from .session import lamb_db_session_maker
+from .session import get_replica_router, get_session_maker, lamb_db_session_maker
 
 logger = logging.getLogger(__name__)
 
 
-__all__ = ["lamb_db_context"]
+__all__ = ["LazySessionMap", "lamb_db_context"]
 
 
 class lamb_db_context:
@@ -43,3 +47,98 @@ class lamb_db_context:
             f"<{self.__class__.__name__}>. exit lamb database context (async): db_key={self._db_key}, sync={self._pooled}"
         )
         await self.db_session.close()
+
+
+class LazySessionMap(Mapping):
+    """Mapping of database key to session that creates session on first access
+
+    Only created sessions are closed with `close`/`aclose`, so databases that are not touched while processing
+    request cost nothing. Read sessions bound to read replicas are available with `read(db_key)` - for databases
+    without replicas it is the same session as primary one.
+
+    Usage::
+
+        session_map = LazySessionMap(settings.LAMB_DB_CONFIG, sync=True)
+        try:
+            session_map["default"].execute(...)
+        finally:
+            session_map.close()
+
+    """
+
+    def __init__(self, db_keys: Iterable[str], sync: bool = True, pooled: bool = True):
+        self._db_keys = tuple(db_keys)
+        self._sync = sync
+        self._pooled = pooled
+        self._sessions: dict[str, SASession | SAAsyncSession] = {}
+        self._read_sessions: dict[str, SASession | SAAsyncSession] = {}
+
+    def __getitem__(self, db_key: str) -> SASession | SAAsyncSession:
+        try:
+            return self._sessions[db_key]
+        except KeyError:
+            if db_key not in self._db_keys:
+                raise
+        logger.debug(
+            f"<{self.__class__.__name__}>. create session: db_key={db_key}, pooled={self._pooled}, sync={self._sync}"
+        )
+        result = self._sessions[db_key] = lamb_db_session_maker(pooled=self._pooled, db_key=db_key, sync=self._sync)
+        return result
+
+    def read(self, db_key: str = "default") -> SASession | SAAsyncSession:
+        """Read only session for database - bound to replica chosen on first access"""
+        try:
+            return self._read_sessions[db_key]
+        except KeyError:
+            if db_key not in self._db_keys:
+                raise
+        router = get_replica_router(db_key=db_key, pooled=self._pooled, sync=self._sync)
+        replica = router.choose() if router is not None else None
+        if replica is None:
+            # no healthy replica - share primary session instead of opening another primary connection
+            result = self[db_key]
+        else:
+            logger.debug(
+                f"<{self.__class__.__name__}>. create read session: db_key={db_key}, replica={replica}, sync={self._sync}"
+            )
+            result = get_session_maker(db_key=db_key, pooled=self._pooled, sync=self._sync, replica=replica)()
+        self._read_sessions[db_key] = result
+        return result
+
+    def __contains__(self, db_key: object) -> bool:
+        return db_key in self._db_keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._db_keys)
+
+    def __len__(self) -> int:
+        return len(self._db_keys)
+
+    @property
+    def created_keys(self) -> tuple[str, ...]:
+        """Keys of sessions created so far"""
+        return tuple(self._sessions)
+
+    def _pop_sessions(self) -> list[tuple[str, SASession | SAAsyncSession]]:
+        result = list(self._sessions.items()) + [
+            (db_key, db_session)
+            for db_key, db_session in self._read_sessions.items()
+            if db_session is not self._sessions.get(db_key)
+        ]
+        self._sessions, self._read_sessions = {}, {}
+        return result
+
+    def close(self):
+        # all sessions closed even if some close fails, error re-raised after
+        with contextlib.ExitStack() as stack:
+            for db_key, db_session in self._pop_sessions():
+                logger.debug(f"<{self.__class__.__name__}>. close session (sync): db_key={db_key}")
+                stack.callback(db_session.close)
+
+    async def aclose(self):
+        sessions = self._pop_sessions()
+        logger.debug(f"<{self.__class__.__name__}>. close sessions (async): db_keys={[k for k, _ in sessions]}")
+        await asyncio.gather(*(db_session.close() for _, db_session in sessions))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: keys={list(self._db_keys)}, created={list(self._sessions)}>"
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import math
+import random
+import threading
+import time
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from lamb.db.config import REPLICA_STRATEGY_LEAST_CONNECTIONS, Config
+
+__all__ = ["ReplicaRouter"]
+
+logger = logging.getLogger(__name__)
+
+
+_POSTGRESQL_LAG_QUERY = (
+    "SELECT CASE WHEN pg_is_in_recovery() "
+    "THEN COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) ELSE 0 END"
+)
+
+
+class ReplicaRouter:
+    """Chooses read replica engine for new read session
+
+    - `weighted` strategy - random choice proportional to replica weights
+    - `least_connections` strategy - replica with minimal checked out connections count relative to weight
+    - replication lag guard - with `Config.replica_max_lag` replicas lagging behind more than limit (or failed on lag
+      check) are skipped, if no replica left primary is used. Lag is checked not often than
+      `Config.replica_lag_check_interval` seconds off request path - in background thread (sync mode) or task (async
+      mode), one check per replica at a time. Replica is not used while check hangs longer than interval.
+
+    NB: with lag guard replicas are out of rotation until their first lag check finished - first read sessions after
+    start (and all read sessions in async mode created outside running event loop) use primary.
+    """
+
+    def __init__(self, config: Config, engines: Sequence[Engine | AsyncEngine], sync: bool):
+        self._config = config
+        self._engines = tuple(engines)
+        self._weights = tuple(r.weight for r in config.replicas)
+        self._sync = sync
+        self._lock = threading.Lock()
+
+        # connections tracking
+        self._active = [0] * len(self._engines)
+        for index, engine in enumerate(self._engines):
+            self._listen_connections(index, engine.sync_engine if isinstance(engine, AsyncEngine) else engine)
+
+        # lag guard
+        self._lag: list[float | None] = [None] * len(self._engines)
+        self._lag_checked_at = [-math.inf] * len(self._engines)
+        self._lag_checks: dict[int, threading.Thread | asyncio.Task] = {}
+        self._lag_query = config.replica_lag_query
+        if config.replica_max_lag is not None and self._lag_query is None:
+            dialect_name = self._engines[0].dialect.name if self._engines else None
+            if dialect_name == "postgresql":
+                self._lag_query = _POSTGRESQL_LAG_QUERY
+            else:
+                logger.warning(
+                    f"<{self.__class__.__name__}>. replication lag guard disabled - "
+                    f"no lag query for dialect: {dialect_name}"
+                )
+
+    def _listen_connections(self, index: int, engine: Engine):
+        def _checkout(*_):
+            with self._lock:
+                self._active[index] += 1
+
+        def _checkin(*_):
+            with self._lock:
+                self._active[index] = max(self._active[index] - 1, 0)
+
+        event.listen(engine, "checkout", _checkout)
+        event.listen(engine, "checkin", _checkin)
+
+    # lag guard
+    @property
+    def _lag_guard(self) -> bool:
+        return self._config.replica_max_lag is not None and self._lag_query is not None
+
+    def _store_lag(self, index: int, lag: float | None):
+        if lag is None:
+            lag = math.inf
+        self._lag[index] = lag
+        if lag > self._config.replica_max_lag:
+            logger.warning(f"<{self.__class__.__name__}>. replica [{index}] lag exceeded: {lag}")
+
+    def _check_lag(self, index: int):
+        try:
+            with self._engines[index].connect() as connection:
+                lag = connection.execute(sa.text(self._lag_query)).scalar()
+        except (SQLAlchemyError, OSError) as e:
+            logger.error(f"<{self.__class__.__name__}>. replica [{index}] lag check failed: {e!r}")
+            lag = None
+        except Exception:
+            logger.exception(f"<{self.__class__.__name__}>. replica [{index}] lag check failed")
+            lag = None
+        self._store_lag(index, lag)
+        self._finish_lag_check(index)
+
+    async def _acheck_lag(self, index: int):
+        try:
+            async with self._engines[index].connect() as connection:
+                lag = (await connection.execute(sa.text(self._lag_query))).scalar()
+        except (SQLAlchemyError, OSError) as e:
+            logger.error(f"<{self.__class__.__name__}>. replica [{index}] lag check failed: {e!r}")
+            lag = None
+        except Exception:
+            logger.exception(f"<{self.__class__.__name__}>. replica [{index}] lag check failed")
+            lag = None
+        self._store_lag(index, lag)
+
+    def _finish_lag_check(self, index: int, *_):
+        with self._lock:
+            self._lag_checks.pop(index, None)
+
+    def _start_lag_check(self, index: int) -> threading.Thread | asyncio.Task | None:
+        if self._sync:
+            result = threading.Thread(
+                target=self._check_lag, args=(index,), name=f"lamb-replica-lag-{index}", daemon=True
+            )
+            result.start()
+            return result
+        try:
+            result = asyncio.get_running_loop().create_task(self._acheck_lag(index))
+        except RuntimeError:
+            return None
+        result.add_done_callback(functools.partial(self._finish_lag_check, index))
+        return result
+
+    def _refresh_lag(self) -> float:
+        now = time.monotonic()
+        interval = self._config.replica_lag_check_interval
+        for index in range(len(self._engines)):
+            # fast path without lock
+            if index in self._lag_checks or now - self._lag_checked_at[index] < interval:
+                continue
+            with self._lock:
+                if index in self._lag_checks or now - self._lag_checked_at[index] < interval:
+                    continue
+                self._lag_checked_at[index] = now
+                # check unregisters itself under the same lock, so registration always comes first
+                check = self._start_lag_check(index)
+                if check is None:
+                    self._lag_checked_at[index] = -math.inf
+                else:
+                    self._lag_checks[index] = check
+        return now
+
+    def healthy(self) -> list[int]:
+        """Indexes of replicas available for reads"""
+        if not self._lag_guard:
+            return list(range(len(self._engines)))
+        now = self._refresh_lag()
+        interval = self._config.replica_lag_check_interval
+        return [
+            index
+            for index, lag in enumerate(self._lag)
+            if lag is not None
+            and lag <= self._config.replica_max_lag
+            and not (index in self._lag_checks and now - self._lag_checked_at[index] > interval)
+        ]
+
+    # selection
+    def choose(self) -> int | None:
+        """Index of replica to be used or None for primary"""
+        candidates = self.healthy()
+        if not candidates:
+            logger.debug(f"<{self.__class__.__name__}>. no healthy replica - fallback to primary")
+            return None
+        if len(candidates) == 1:
+            return candidates[0]
+        if self._config.replica_strategy == REPLICA_STRATEGY_LEAST_CONNECTIONS:
+            with self._lock:
+                return min(candidates, key=lambda i: (self._active[i] / self._weights[i], -self._weights[i]))
+        return random.choices(candidates, weights=[self._weights[i] for i in candidates])[0]
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}: strategy={self._config.replica_strategy}, "
+            f"replicas={len(self._engines)}, active={self._active}, lag={self._lag}>"
+        )
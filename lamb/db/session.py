@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from sqlalchemy.pool import NullPool
 
 from lamb.db.config import Config, parse_django_config
+from lamb.db.replica import ReplicaRouter
 from lamb.exc import ServerError
 from lamb.utils import get_settings_value
 
@@ -22,6 +23,7 @@ __all__ = [
     "create_engine",
     "create_async_engine",
     "get_engine",
+    "get_replica_router",
     "get_declarative_base",
     "get_metadata",
 ]
@@ -49,11 +51,12 @@ else:
             _configs_registry[_db_key] = Config(**raw_config)
 
 # engines registry
-_engines_registry: dict[tuple[str, bool, bool], Engine | AsyncEngine] = {}
+_engines_registry: dict[tuple[str, bool, bool, int | None], Engine | AsyncEngine] = {}
 
 
-def get_engine(db_key: str, pooled: bool, sync: bool) -> Engine | AsyncEngine:
-    registry_key = (db_key, pooled, sync)
+def get_engine(db_key: str, pooled: bool, sync: bool, replica: int | None = None) -> Engine | AsyncEngine:
+    """Engine of database primary or of read replica with index `replica`"""
+    registry_key = (db_key, pooled, sync, replica)
     if registry_key in _engines_registry:
         return _engines_registry[registry_key]
 
@@ -62,6 +65,8 @@ def get_engine(db_key: str, pooled: bool, sync: bool) -> Engine | AsyncEngine:
         raise ServerError("Database session constructor failed to get database params")
 
     db_config: Config = _configs_registry[db_key]
+    if replica is not None:
+        db_config = db_config.replica_(replica)
     connection_string = db_config.connection_string_(sync=sync, pooled=pooled)
     engine_options = db_config.engine_options_(sync=sync, pooled=pooled)
 
@@ -78,17 +83,39 @@ def get_engine(db_key: str, pooled: bool, sync: bool) -> Engine | AsyncEngine:
     return result
 
 
-# session makers
-_maker_registry: dict[tuple[str, bool, bool], sessionmaker] = {}
+# replica routers
+_routers_registry: dict[tuple[str, bool, bool], ReplicaRouter | None] = {}
 
 
-def get_session_maker(db_key: str = "default", pooled: bool = True, sync: bool = True):
+def get_replica_router(db_key: str, pooled: bool, sync: bool) -> ReplicaRouter | None:
+    """Read replicas router of database, None if database has no replicas configured"""
     key = (db_key, pooled, sync)
+    if key in _routers_registry:
+        return _routers_registry[key]
+
+    database_config: Config = _configs_registry[db_key]
+    if database_config.replicas is None:
+        result = None
+    else:
+        engines = [get_engine(db_key, pooled, sync, replica=i) for i in range(len(database_config.replicas))]
+        result = ReplicaRouter(database_config, engines, sync=sync)
+        logger.debug(f"replica router constructed: {db_key=}, {pooled=}, {sync=} -> {result}")
+
+    _routers_registry[key] = result
+    return result
+
+
+# session makers
+_maker_registry: dict[tuple[str, bool, bool, int | None], sessionmaker] = {}
+
+
+def get_session_maker(db_key: str = "default", pooled: bool = True, sync: bool = True, replica: int | None = None):
+    key = (db_key, pooled, sync, replica)
     if key in _maker_registry:
         return _maker_registry[key]
 
     database_config: Config = _configs_registry[db_key]
-    engine = get_engine(db_key, pooled, sync)
+    engine = get_engine(db_key, pooled, sync, replica=replica)
     session_options = database_config.session_options_(sync=sync, pooled=pooled)
 
     if sync:
@@ -127,7 +154,17 @@ DeclarativeBase = get_declarative_base("default", True, True)
 metadata = DeclarativeBase.metadata
 
 
-def lamb_db_session_maker(pooled: bool = True, db_key: str = "default", sync: bool = True) -> Session | AsyncSession:
-    """Constructor for database sqlalchemy sessions"""
-    maker = get_session_maker(db_key=db_key, pooled=pooled, sync=sync)
+def lamb_db_session_maker(
+    pooled: bool = True, db_key: str = "default", sync: bool = True, read_only: bool = False
+) -> Session | AsyncSession:
+    """Constructor for database sqlalchemy sessions
+
+    :param read_only: Session for reads - bound to read replica chosen by `ReplicaRouter`, primary is used if database
+        has no replicas or all of them are lagging behind
+    """
+    replica = None
+    if read_only and (router := get_replica_router(db_key=db_key, pooled=pooled, sync=sync)) is not None:
+        replica = router.choose()
+        logger.debug(f"read session replica chosen: {db_key=} -> {replica}")
+    maker = get_session_maker(db_key=db_key, pooled=pooled, sync=sync, replica=replica)
     return maker()
@@ -1,2 +1,3 @@
+from lamb.json.binary import BinaryResponse
 from lamb.json.encoder import JsonEncoder
-from lamb.json.response import JsonResponse
+from lamb.json.response import JsonResponse, StreamingJsonResponse
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import lazy_object_proxy
+from django.conf import settings
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import patch_vary_headers
+
+from lamb.conf import get_lamb_settings, on_lamb_settings_refresh
+from lamb.exc import ImproperlyConfiguredError, InvalidParamTypeError, ProgrammingError
+from lamb.json.encoder import JsonEncoder
+from lamb.json.response import JsonResponse
+from lamb.utils import CONTENT_ENCODING_CBOR, CONTENT_ENCODING_MSGPACK, get_request_accept_encoding
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+__all__ = [
+    "BinaryEncoding",
+    "BinaryResponse",
+    "CborEncoding",
+    "MsgPackEncoding",
+    "negotiate_binary_encoding",
+    "patch_vary_accept",
+    "register_binary_encoding",
+]
+
+logger = logging.getLogger(__name__)
+
+_CBOR_PLAIN_TYPES = (str, bytes, int, float, type(None))
+
+
+class BinaryEncoding:
+    """Abstract binary response encoding
+
+    Types not supported by format natively are converted with the same `JsonEncoder` type dispatch as JSON
+    responses use, so `ResponseEncodableMixin`, dataclasses and registered handlers work for binary formats too.
+    """
+
+    name: str
+    content_type: str
+    module: Any = None
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return cls.module is not None
+
+    def dumps(self, data: Any, encoder: JsonEncoder) -> bytes:
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.content_type}>"
+
+
+class MsgPackEncoding(BinaryEncoding):
+    name = "msgpack"
+    content_type = CONTENT_ENCODING_MSGPACK
+    module = msgpack
+
+    def dumps(self, data: Any, encoder: JsonEncoder) -> bytes:
+        return msgpack.packb(data, default=encoder.default, use_bin_type=True)
+
+
+class CborEncoding(BinaryEncoding):
+    """CBOR encoding
+
+    NB: `datetime`, `Decimal`, `UUID` and other types with native CBOR tags are converted with `JsonEncoder` before
+    encoding, so values follow LAMB_RESPONSE_DATETIME_TRANSFORMER and match JSON representation.
+    """
+
+    name = "cbor"
+    content_type = CONTENT_ENCODING_CBOR
+    module = cbor2
+
+    def _prepare(self, value: Any, encoder: JsonEncoder) -> Any:
+        if isinstance(value, _CBOR_PLAIN_TYPES):
+            return value
+        if isinstance(value, dict):
+            return {key: self._prepare(item, encoder) for key, item in value.items()}
+        if isinstance(value, list | tuple):
+            return [self._prepare(item, encoder) for item in value]
+        return self._prepare(encoder.default(value), encoder)
+
+    def dumps(self, data: Any, encoder: JsonEncoder) -> bytes:
+        return cbor2.dumps(self._prepare(data, encoder))
+
+
+_ENCODING_CLASSES: dict[str, type[BinaryEncoding]] = {
+    MsgPackEncoding.name: MsgPackEncoding,
+    CborEncoding.name: CborEncoding,
+}
+
+
+def register_binary_encoding(encoding_class: type[BinaryEncoding]):
+    """Register custom binary encoding to be enabled by name in LAMB_RESPONSE_BINARY_ENCODINGS"""
+    if not isinstance(encoding_class, type) or not issubclass(encoding_class, BinaryEncoding):
+        raise ProgrammingError(f"Invalid binary encoding class: {encoding_class}")
+    _ENCODING_CLASSES[encoding_class.name] = encoding_class
+
+
+def _get_binary_encodings() -> dict[str, BinaryEncoding]:
+    result = {}
+    for name in settings.LAMB_RESPONSE_BINARY_ENCODINGS or []:
+        if name not in _ENCODING_CLASSES:
+            raise ImproperlyConfiguredError(f"Unknown LAMB_RESPONSE_BINARY_ENCODINGS encoding: {name}")
+        encoding_class = _ENCODING_CLASSES[name]
+        if not encoding_class.is_available():
+            logger.info(f"LAMB_RESPONSE_BINARY_ENCODINGS: encoding {name} skipped - module not installed")
+            continue
+        result[encoding_class.content_type] = encoding_class()
+    logger.debug(f"LAMB_RESPONSE_BINARY_ENCODINGS: encodings would be used -> {list(result.values())}")
+    return result
+
+
+_BINARY_ENCODINGS = lazy_object_proxy.Proxy(_get_binary_encodings)
+
+
+@on_lamb_settings_refresh
+def _reset_binary_encodings():
+    del _BINARY_ENCODINGS.__wrapped__
+
+
+def negotiate_binary_encoding(request: HttpRequest) -> BinaryEncoding | None:
+    """Binary encoding requested with Accept header if enabled, None for JSON"""
+    if not _BINARY_ENCODINGS:
+        return None
+    try:
+        accept_encoding = get_request_accept_encoding(request)
+    except InvalidParamTypeError:
+        return None
+    return _BINARY_ENCODINGS.get(accept_encoding)
+
+
+def patch_vary_accept(response: HttpResponseBase) -> HttpResponseBase:
+    """Add Accept to Vary header if binary encodings enabled - response representation depends on Accept header"""
+    if _BINARY_ENCODINGS:
+        patch_vary_headers(response, ("Accept",))
+    return response
+
+
+class BinaryResponse(JsonResponse):
+    """Binary encoded response
+
+    Behaves like JsonResponse (including ETag support) but encodes data with binary encoding. Encoding name is
+    appended to caller provided version ETag, so representations in different encodings are not mixed up by caches.
+
+    Usage::
+
+        def get(self, request):
+            return BinaryResponse(data, request=request, encoding=MsgPackEncoding())
+
+    """
+
+    def __init__(self, data=None, status=200, callback=None, request=None, encoding: BinaryEncoding = None, **kwargs):
+        if encoding is None:
+            encoding = MsgPackEncoding()
+        if not encoding.is_available():
+            raise ImproperlyConfiguredError(f"Binary encoding {encoding.name} module not installed")
+        self._encoding = encoding
+        super().__init__(data=data, status=status, callback=callback, request=request, **kwargs)
+        patch_vary_headers(self, ("Accept",))
+
+    @property
+    def _response_content_type(self) -> str:
+        return self._encoding.content_type
+
+    def _version_etag(self, etag: str) -> str:
+        etag = super()._version_etag(etag)
+        return f'{etag[:-1]}-{self._encoding.name}"'
+
+    def _dump(self, data, callback, request) -> bytes:
+        return self._encoding.dumps(data, get_lamb_settings().response_encoder_class(callback, request))
@@ -3,14 +3,15 @@ import datetime
 import json
 import logging
 import uuid
+from collections.abc import Callable
 from decimal import Decimal
+from typing import Any, ClassVar
 
-import lazy_object_proxy
-from django.conf import settings
 from sqlalchemy_utils import PhoneNumber
 
+from lamb.conf import get_lamb_settings
+from lamb.exc import ProgrammingError
 from lamb.json.mixins import ResponseConformProtocol
-from lamb.utils.core import import_by_name
 
 __all__ = ["JsonEncoder"]
 
@@ -18,42 +19,118 @@ logger = logging.getLogger(__name__)
 
 
 # utils
-def _get_transformer():
-    result = import_by_name(settings.LAMB_RESPONSE_DATETIME_TRANSFORMER)
-    logger.debug(f"LAMB_RESPONSE_DATETIME_TRANSFORMER: {result}")
+def _encode_datetime(obj: datetime.datetime, _) -> Any:
+    return get_lamb_settings().response_datetime_transformer(obj)
+
+
+def _encode_date(obj: datetime.date, _) -> Any:
+    return obj.strftime(get_lamb_settings().response_date_format)
+
+
+def _encode_phone_number(obj: PhoneNumber, _) -> Any:
+    result = obj.e164
+    if obj._phone_number.extension is not None:
+        result += f"(ext. {obj._phone_number.extension})"
     return result
 
 
-_JSON_DATETIME_TRANSFORMER = lazy_object_proxy.Proxy(_get_transformer)
+def _encode_response_conform(obj: ResponseConformProtocol, request) -> Any:
+    return obj.response_encode(request)
+
+
+def _encode_dataclass(obj: Any, _) -> Any:
+    return dataclasses.asdict(obj)
+
+
+EncodeHandler = Callable[[Any, Any], Any]
 
 
 # main
 class JsonEncoder(json.JSONEncoder):
+    """Lamb JSON encoder
+
+    Non-native objects are encoded with handlers registered by exact type. Subclasses of registered types are resolved
+    over MRO, structural checks (`ResponseConformProtocol`, dataclasses) performed once per type - results are cached.
+
+    Usage::
+
+        from lamb.json import JsonEncoder
+
+        JsonEncoder.register(Money, lambda obj, request: str(obj.amount))
+
+    """
+
+    _registry: ClassVar[dict[type, EncodeHandler]] = {
+        datetime.datetime: _encode_datetime,
+        datetime.date: _encode_date,
+        Decimal: lambda obj, _: float(obj),
+        uuid.UUID: lambda obj, _: str(obj),
+        set: lambda obj, _: list(obj),
+        PhoneNumber: _encode_phone_number,
+    }
+    _dispatch_cache: ClassVar[dict[type, EncodeHandler | None]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._registry = dict(cls._registry)
+        cls._dispatch_cache = {}
+
     def __init__(self, callback=None, request=None, **kwargs):
         super().__init__(**kwargs)
         self.callback = callback
         self.request = request
 
+    @classmethod
+    def register(cls, type_: type, fn: EncodeHandler):
+        """Register encoding handler for type and its subclasses
+
+        :param type_: Class of objects to be encoded
+        :param fn: Callable accepting object and request, returns JSON compatible representation
+        """
+        if not isinstance(type_, type) or not callable(fn):
+            logger.warning(f"Invalid encoder registration: {type_, fn}")
+            raise ProgrammingError("Invalid JsonEncoder handler registration")
+
+        cls._registry[type_] = fn
+        cls._dispatch_cache.clear()
+
+        # propagate to subclasses without own handler and invalidate resolved dispatch
+        stack = cls.__subclasses__()
+        while stack:
+            _cls = stack.pop()
+            _cls._registry.setdefault(type_, fn)
+            _cls._dispatch_cache.clear()
+            stack.extend(_cls.__subclasses__())
+
+    @classmethod
+    def _resolve_handler(cls, obj_type: type) -> EncodeHandler | None:
+        registry = cls._registry
+        for _type in obj_type.__mro__:
+            if _type in registry:
+                result = registry[_type]
+                break
+        else:
+            if issubclass(obj_type, ResponseConformProtocol):
+                result = _encode_response_conform
+            elif dataclasses.is_dataclass(obj_type):
+                result = _encode_dataclass
+            else:
+                result = None
+
+        logger.debug(f"<{cls.__name__}>. handler resolved: {obj_type} -> {result}")
+        cls._dispatch_cache[obj_type] = result
+        return result
+
     def default(self, obj):
         # general encoding
-        if isinstance(obj, datetime.datetime):
-            result = _JSON_DATETIME_TRANSFORMER(obj)
-        elif isinstance(obj, datetime.date):
-            result = obj.strftime(settings.LAMB_RESPONSE_DATE_FORMAT)
-        elif isinstance(obj, Decimal):
-            result = float(obj)
-        elif isinstance(obj, uuid.UUID):
-            result = str(obj)
-        elif isinstance(obj, set):
-            result = list(obj)
-        elif isinstance(obj, PhoneNumber):
-            result = obj.e164
-            if obj._phone_number.extension is not None:
-                result += f"(ext. {obj._phone_number.extension})"
-        elif dataclasses.is_dataclass(obj) and not isinstance(obj, ResponseConformProtocol):
-            result = dataclasses.asdict(obj)
-        elif isinstance(obj, ResponseConformProtocol):
-            result = obj.response_encode(self.request)
+        obj_type = obj.__class__
+        try:
+            handler = self._dispatch_cache[obj_type]
+        except KeyError:
+            handler = self._resolve_handler(obj_type)
+
+        if handler is not None:
+            result = handler(obj, self.request)
         else:
             result = json.JSONEncoder.default(self, obj)
 
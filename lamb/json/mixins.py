@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import functools
 import logging
+from collections.abc import Callable, Iterable
+from operator import attrgetter
 from typing import Any, Protocol, runtime_checkable
 
 from sqlalchemy import Column, inspect
@@ -20,12 +23,13 @@ except ImportError:
     CassandraModel = object()
 
 
-__all__ = ["ResponseEncodableMixin", "ResponseConformProtocol"]
+__all__ = ["ResponseConformProtocol", "ResponseEncodableMixin", "parse_response_fields"]
 
 logger = logging.getLogger(__name__)
 
 
 _DEFAULT_ATTRIBUTE_NAMES_REGISTRY = {}
+_ENCODERS_REGISTRY: dict[type, Callable[[Any], dict[str, Any]]] = {}
 
 
 @runtime_checkable
@@ -38,6 +42,142 @@ class ResponseConformProtocol(Protocol):
         pass
 
 
+def _get_response_attribute_names(cls: type) -> list[str]:
+    """Discover and cache names of attributes to be encoded for class"""
+    if cls in _DEFAULT_ATTRIBUTE_NAMES_REGISTRY:
+        return _DEFAULT_ATTRIBUTE_NAMES_REGISTRY[cls]
+
+    # check possibility to process
+    response_attributes = cls.response_attributes()
+    _declarative = isinstance(cls, DeclarativeMeta)
+    _attributes_provided = response_attributes is not None
+    if not _declarative and not _attributes_provided:
+        raise NotImplementedError(
+            "ResponseEncodableMixin subclass should implement non empty: "
+            "classmethod:response_attributes() or to be subclass of DeclarativeMeta to "
+            "use default encoder. In other case implement custom method "
+            "response_encode()"
+        )
+
+    # extract attribute names
+    if response_attributes is None:
+        # for DeclarativeMeta support auto descriptors discovery
+        response_attributes = []
+        ins = inspect(cls)
+
+        # append plain columns
+        response_attributes.extend(ins.mapper.column_attrs.values())
+
+        # append synonyms
+        response_attributes.extend(ins.mapper.synonyms.values())
+
+        # append hybrid properties
+        response_attributes.extend(
+            # [ormd for ormd in ins.all_orm_descriptors if type(ormd) == hybrid_property]  # noqa: E721
+            [ormd for ormd in ins.all_orm_descriptors if isinstance(ormd, hybrid_property)]
+        )
+
+    # parse names
+    response_attribute_names = []
+    for orm_descriptor in response_attributes:
+        if isinstance(orm_descriptor, str):
+            orm_attr_name = orm_descriptor
+        elif isinstance(orm_descriptor, Column):
+            orm_attr_name = orm_descriptor.name
+        elif isinstance(orm_descriptor, ColumnProperty | RelationshipProperty | QueryableAttribute | SynonymProperty):
+            orm_attr_name = orm_descriptor.key
+        elif isinstance(orm_descriptor, hybrid_property):
+            orm_attr_name = orm_descriptor.__name__
+        elif isinstance(orm_descriptor, property):
+            orm_attr_name = orm_descriptor.fget.__name__
+        else:
+            logger.critical(f"Unsupported orm_descriptor type: {orm_descriptor, orm_descriptor.__class__}")
+            raise exc.ProgrammingError("Could not serialize data")
+        response_attribute_names.append(orm_attr_name)
+    logger.debug(f"caching response attribute keys: {cls.__name__} -> {response_attribute_names}")
+    _DEFAULT_ATTRIBUTE_NAMES_REGISTRY[cls] = response_attribute_names
+    return response_attribute_names
+
+
+def _build_encoder(names: tuple[str, ...]) -> Callable[[Any], dict[str, Any]]:
+    if len(names) == 0:
+
+        def result(_):
+            return {}
+
+    elif len(names) == 1:
+        (_name,) = names
+
+        def result(obj):
+            return {_name: getattr(obj, _name)}
+
+    else:
+        _getter = attrgetter(*names)
+
+        def result(obj):
+            return dict(zip(names, _getter(obj)))
+
+    return result
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_projected_encoder(names: tuple[str, ...]) -> Callable[[Any], dict[str, Any]]:
+    """Encoder for fields selection: depends only on names, bounded as selections are client controlled"""
+    return _build_encoder(names)
+
+
+def _compile_response_encoder(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """Construct encoder function for class: built once and reused for all instances"""
+    # Cassandra model is dict compatible,
+    # return it as dict
+    if cassandra and issubclass(cls, CassandraModel):
+        result = dict
+    else:
+        result = _build_encoder(tuple(_get_response_attribute_names(cls)))
+
+    logger.debug(f"compiled response encoder: {cls.__name__} -> {result}")
+    _ENCODERS_REGISTRY[cls] = result
+    return result
+
+
+def _get_response_encoder(cls: type, request: LambRequest | None) -> Callable[[Any], dict[str, Any]]:
+    # fields selected for request
+    if request is not None and (fields := getattr(request, "lamb_response_fields", None)) and cls in fields:
+        return _compile_projected_encoder(fields[cls])
+
+    try:
+        return _ENCODERS_REGISTRY[cls]
+    except KeyError:
+        return _compile_response_encoder(cls)
+
+
+def parse_response_fields(cls: type, raw_fields: str | None) -> tuple[str, ...] | None:
+    """Parse and validate comma separated list of attribute names against response attributes of class
+
+    :param cls: ResponseEncodableMixin subclass
+    :param raw_fields: Comma separated field names
+    :return: Selected field names in order of response attributes or None if selection is not provided
+    :raises InvalidParamValueError: In case of unknown field names
+    """
+    if raw_fields is None:
+        return None
+
+    requested = {f.strip() for f in raw_fields.split(",")}
+    requested.discard("")
+    if not requested:
+        return None
+
+    names = _get_response_attribute_names(cls)
+    unknown = requested.difference(names)
+    if unknown:
+        raise exc.InvalidParamValueError(
+            "Invalid fields value. Not found in model",
+            error_details={"key_path": "fields", "fields": sorted(unknown)},
+        )
+
+    return tuple(n for n in names if n in requested)
+
+
 class ResponseEncodableMixin:
     # default implementation
     @classmethod
@@ -47,69 +187,29 @@ class ResponseEncodableMixin:
     def response_encode(self, request: LambRequest | None = None) -> Any:
         """Mixin to mark object support JSON serialization with JsonEncoder class
 
+        Respects fields selection attached to request with `lamb.utils.response_projected`
+
         :return: Encoded representation of object
         """
+        return _get_response_encoder(self.__class__, request)(self)
+
+    @classmethod
+    def response_encode_many(cls, items: Iterable[Any], request: LambRequest | None = None) -> list[Any]:
+        """Bulk version of response_encode for list of instances
+
+        Encoder lookup performed once per run of same class instances, custom `response_encode` overrides
+        are respected.
 
-        # Cassandra model is dict compatible,
-        # return it as dict
-        if cassandra and isinstance(self, CassandraModel):
-            return dict(self)
-
-        # cache
-        if self.__class__ not in _DEFAULT_ATTRIBUTE_NAMES_REGISTRY:
-            # check possibility to process
-            _declarative = isinstance(self.__class__, DeclarativeMeta)
-            _attributes_provided = self.response_attributes() is not None
-            if not _declarative and not _attributes_provided:
-                raise NotImplementedError(
-                    "ResponseEncodableMixin subclass should implement non empty: "
-                    "classmethod:response_attributes() or to be subclass of DeclarativeMeta to "
-                    "use default encoder. In other case implement custom method "
-                    "response_encode()"
-                )
-
-            # extract attribute names
-            response_attributes = self.response_attributes()
-            if response_attributes is None:
-                # for DeclarativeMeta support auto descriptors discovery
-                response_attributes = []
-                ins = inspect(self.__class__)
-
-                # append plain columns
-                response_attributes.extend(ins.mapper.column_attrs.values())
-
-                # append synonyms
-                response_attributes.extend(ins.mapper.synonyms.values())
-
-                # append hybrid properties
-                response_attributes.extend(
-                    # [ormd for ormd in ins.all_orm_descriptors if type(ormd) == hybrid_property]  # noqa: E721
-                    [ormd for ormd in ins.all_orm_descriptors if isinstance(ormd, hybrid_property)]
-                )
-
-            # parse names
-            response_attribute_names = []
-            for orm_descriptor in response_attributes:
-                if isinstance(orm_descriptor, str):
-                    orm_attr_name = orm_descriptor
-                elif isinstance(orm_descriptor, Column):
-                    orm_attr_name = orm_descriptor.name
-                elif isinstance(
-                    orm_descriptor, ColumnProperty | RelationshipProperty | QueryableAttribute | SynonymProperty
-                ):
-                    orm_attr_name = orm_descriptor.key
-                elif isinstance(orm_descriptor, hybrid_property):
-                    orm_attr_name = orm_descriptor.__name__
-                elif isinstance(orm_descriptor, property):
-                    orm_attr_name = orm_descriptor.fget.__name__
+        :return: List of encoded representations
+        """
+        result = []
+        item_cls, encoder = None, None
+        for item in items:
+            if item.__class__ is not item_cls:
+                item_cls = item.__class__
+                if item_cls.response_encode is ResponseEncodableMixin.response_encode:
+                    encoder = _get_response_encoder(item_cls, request)
                 else:
-                    logger.critical(f"Unsupported orm_descriptor type: {orm_descriptor, orm_descriptor.__class__}")
-                    raise exc.ProgrammingError("Could not serialize data")
-                response_attribute_names.append(orm_attr_name)
-            logger.debug(f"caching response attribute keys: {self.__class__.__name__} -> {response_attribute_names}")
-            _DEFAULT_ATTRIBUTE_NAMES_REGISTRY[self.__class__] = response_attribute_names
-
-        # encode data
-        response_attribute_names = _DEFAULT_ATTRIBUTE_NAMES_REGISTRY[self.__class__]
-        result = {orm_attr: getattr(self, orm_attr) for orm_attr in response_attribute_names}
+                    encoder = None
+            result.append(encoder(item) if encoder is not None else item.response_encode(request))
         return result
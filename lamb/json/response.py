@@ -1,38 +1,36 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterator
 from typing import Any
 
 import lazy_object_proxy
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.http import parse_etags, quote_etag
 
 try:
     import ujson
 except ImportError:
     ujson = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 from lamb import exc
-from lamb.utils import dpath_value
-from lamb.utils.core import import_by_name
+from lamb.conf import get_lamb_settings, on_lamb_settings_refresh
 
-__all__ = ["JsonResponse"]
+__all__ = ["JsonResponse", "StreamingJsonResponse"]
 
 logger = logging.getLogger(__name__)
 
 
-# TODO: вполне вероятно в питоне 3.10 это все вот нахер не нужно - он и в стандартном модуле нормально оптимизируется
 # utils and choose engine
-def _get_encoder_class():
-    class_module_path = settings.LAMB_RESPONSE_ENCODER
-    result = import_by_name(class_module_path)
-    logger.debug(f"LAMB_RESPONSE_ENCODER: encoder would be used {class_module_path} -> {result}")
-    return result
-
-
 def _impl_json(data: Any, encoder: json.JSONEncoder, indent: int | None) -> Any:
     if indent is not None:
         return json.dumps(
@@ -52,39 +50,78 @@ def _impl_json(data: Any, encoder: json.JSONEncoder, indent: int | None) -> Any:
 
 
 def _impl_ujson(data: Any, encoder: json.JSONEncoder, indent: int | None) -> Any:
-    if indent is not None:
-        return json.dumps(
-            data,
-            indent=indent,
-            ensure_ascii=False,
-            default=encoder.default,
-            sort_keys=False,
-        )
+    return ujson.dumps(
+        data,
+        indent=indent or 0,
+        ensure_ascii=False,
+        escape_forward_slashes=False,
+        default=encoder.default,
+        sort_keys=False,
+    )
+
+
+def _get_orjson_options() -> int:
+    """Base orjson options respecting lamb response settings
+
+    - dataclasses always passed to encoder: `ResponseConformProtocol` dataclasses (DeviceInfo and others) hide fields
+    - datetime/date/time encoded natively only if LAMB_RESPONSE_DATETIME_TRANSFORMER and LAMB_RESPONSE_DATE_FORMAT
+      produce exactly the same output as orjson does, otherwise passed to encoder
+    """
+    from lamb.utils.transformers import transform_datetime_iso_auto, transform_datetime_iso_auto_zulu
+
+    result = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    lamb_settings = get_lamb_settings()
+    transformer = lamb_settings.response_datetime_transformer
+    date_native = lamb_settings.response_date_format in ("%Y-%m-%d", "%4Y-%m-%d")
+
+    if date_native and transformer is transform_datetime_iso_auto:
+        pass
+    elif date_native and transformer is transform_datetime_iso_auto_zulu:
+        result = result | orjson.OPT_UTC_Z
     else:
-        return json.dumps(
-            data,
-            ensure_ascii=False,
-            default=encoder.default,
-            sort_keys=False,
-        )
+        result = result | orjson.OPT_PASSTHROUGH_DATETIME
+
+    logger.debug(f"LAMB_RESPONSE_JSON_ENGINE: orjson options -> {result}")
+    return result
+
+
+def _impl_orjson(data: Any, encoder: json.JSONEncoder, indent: int | None) -> Any:
+    # NB: NaN and Infinity floats encoded as `null` (valid JSON), stdlib and ujson engines produce `NaN`/`Infinity`
+    # orjson supports only 2 spaces indent and could not notify callback on natively encoded types
+    if (indent is not None and indent != 2) or getattr(encoder, "callback", None) is not None:
+        return _impl_json(data=data, encoder=encoder, indent=indent)
+
+    option = int(_ORJSON_OPTIONS)
+    if indent is not None:
+        option = option | orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(data, default=encoder.default, option=option)
+    except orjson.JSONEncodeError as e:
+        # out of range integers and other edge cases - let stdlib engine decide
+        logger.debug(f"LAMB_RESPONSE_JSON_ENGINE: orjson failed, fall-down to json: {e}")
+        return _impl_json(data=data, encoder=encoder, indent=indent)
 
 
 def _get_dump_engine() -> Callable[[Any, json.JSONEncoder, int | None], Any]:
-    settings_engine: str | None = dpath_value(
-        settings,
-        "LAMB_RESPONSE_JSON_ENGINE",
-        str,
-        allow_none=True,
-    )
+    settings_engine = get_lamb_settings().response_json_engine
     logger.debug(f"LAMB_RESPONSE_JSON_ENGINE: settings value -> {settings_engine}")
 
     if settings_engine is None:
-        result = _impl_ujson if ujson is not None else _impl_json
+        if orjson is not None:
+            result = _impl_orjson
+        elif ujson is not None:
+            result = _impl_ujson
+        else:
+            result = _impl_json
     else:
         try:
             # settings enforced
             settings_engine = settings_engine.lower()
-            if settings_engine == "ujson":
+            if settings_engine == "orjson":
+                result = _impl_orjson
+                module = orjson
+            elif settings_engine == "ujson":
                 result = _impl_ujson
                 module = ujson
             elif settings_engine == "json":
@@ -107,35 +144,248 @@ def _get_dump_engine() -> Callable[[Any, json.JSONEncoder, int | None], Any]:
 
 
 # constants
-_JSON_ENCODER_CLASS = lazy_object_proxy.Proxy(_get_encoder_class)
 _JSON_DUMP_IMPL = lazy_object_proxy.Proxy(_get_dump_engine)
+_ORJSON_OPTIONS = lazy_object_proxy.Proxy(_get_orjson_options)
+
+
+@on_lamb_settings_refresh
+def _reset_engine():
+    del _JSON_DUMP_IMPL.__wrapped__
+    del _ORJSON_OPTIONS.__wrapped__
+
+
 _JSON_CONTENT_TYPE = "application/json; charset=utf8"
 
 
+def _etag_matches(request, etag: str) -> bool:
+    """Weak comparison of ETag against If-None-Match request header"""
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    if "*" in etags:
+        return True
+    target = etag.removeprefix("W/")
+    return any(e.removeprefix("W/") == target for e in etags)
+
+
 class JsonResponse(HttpResponse):
-    def __init__(self, data=None, status=200, callback=None, request=None, **kwargs):
+    """JSON encoded response
+
+    Conditional GET support with `etag` param:
+
+    - `etag=True` - strong ETag calculated from encoded content
+    - `etag="<version>"` - caller provided version token, used as is without content encoding
+
+    If `request` provided and its If-None-Match header matches ETag - response converted to 304 Not Modified
+    without body, in case of version token content would not be encoded at all.
+
+    Usage::
+
+        def get(self, request):
+            # content hash
+            return JsonResponse(get_configs(), request=request, etag=True)
+
+
+        def get(self, request):
+            # cached data with known version
+            version, handbooks = get_cached_handbooks()
+            return JsonResponse(handbooks, request=request, etag=f"handbooks-{version}")
+
+    """
+
+    _response_content_type = _JSON_CONTENT_TYPE
+
+    def __init__(self, data=None, status=200, callback=None, request=None, etag: bool | str | None = None, **kwargs):
         # determine content_type
-        super().__init__(content_type=_JSON_CONTENT_TYPE, status=status, **kwargs)
+        super().__init__(content_type=self._response_content_type, status=status, **kwargs)
+        conditional = request is not None and status == 200 and request.method in ("GET", "HEAD")
+
+        # caller provided version - check before encoding
+        if isinstance(etag, str):
+            self.headers["ETag"] = self._version_etag(etag)
+            if conditional and _etag_matches(request, self.headers["ETag"]):
+                self._not_modified()
+                return
 
         if data is not None:
-            # encode response in form of json
-            encoder = _JSON_ENCODER_CLASS(callback, request)
+            self.content = self._dump(data, callback, request)
 
-            content = _JSON_DUMP_IMPL(
-                data=data,
-                encoder=encoder,
-                indent=settings.LAMB_RESPONSE_JSON_INDENT,
-            )
+        # content based version
+        if etag is True:
+            self.headers["ETag"] = f'"{hashlib.blake2b(self.content, digest_size=16).hexdigest()}"'
+            if conditional and _etag_matches(request, self.headers["ETag"]):
+                self._not_modified()
 
-            # return result
-            self.content = content
+    def _version_etag(self, etag: str) -> str:
+        return quote_etag(etag)
+
+    def _dump(self, data, callback, request):
+        # encode response in form of json
+        lamb_settings = get_lamb_settings()
+        encoder = lamb_settings.response_encoder_class(callback, request)
+        return _JSON_DUMP_IMPL(
+            data=data,
+            encoder=encoder,
+            indent=lamb_settings.response_json_indent,
+        )
+
+    def _not_modified(self):
+        self.status_code = 304
+        self.content = b""
+        del self.headers["Content-Type"]
 
     @staticmethod
     def encode_object(obj, callback: Callable | None = None, request: object | None = None, **kwargs):
-        encoder = _JSON_ENCODER_CLASS(callback, request, **kwargs)
+        lamb_settings = get_lamb_settings()
+        encoder = lamb_settings.response_encoder_class(callback, request, **kwargs)
         result = _JSON_DUMP_IMPL(
             data=obj,
             encoder=encoder,
-            indent=settings.LAMB_RESPONSE_JSON_INDENT,
+            indent=lamb_settings.response_json_indent,
         )
+        # keep str result for all engines (orjson produces bytes)
+        if isinstance(result, bytes):
+            result = result.decode("utf-8")
+        return result
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """Streaming version of JsonResponse
+
+    Iterators (generators, SQLAlchemy `yield_per` results) and async iterators (SQLAlchemy `stream_scalars` results)
+    are encoded as JSON arrays in batches of `LAMB_RESPONSE_STREAMING_BATCH_SIZE` items without collecting whole
+    collection in memory. Iterators could be nested as values of dict, for example as items of pagination result.
+    All other values encoded in the same way as JsonResponse does.
+
+    Usage::
+
+        @a_rest_allowed_http_methods(["GET"])
+        class BookListView(RestView):
+            async def get(self, request: LambRequest):
+                return StreamingJsonResponse(await self.db_session.stream_scalars(select(Book)), request=request)
+
+    """
+
+    _flush_size = 4096
+
+    def __init__(self, data=None, status=200, callback=None, request=None, batch_size: int | None = None, **kwargs):
+        self._encoder = get_lamb_settings().response_encoder_class(callback, request)
+        self._batch_size = batch_size or settings.LAMB_RESPONSE_STREAMING_BATCH_SIZE
+        if self._contains_async(data):
+            content = self._acoalesce(self._aiter_value(data))
+        else:
+            content = self._coalesce(self._iter_value(data))
+        super().__init__(content, content_type=_JSON_CONTENT_TYPE, status=status, **kwargs)
+
+    @classmethod
+    def is_streamable(cls, data: Any) -> bool:
+        """Check data contains iterators to be streamed"""
+        if isinstance(data, Iterator | AsyncIterator):
+            return True
+        if isinstance(data, dict):
+            return any(isinstance(v, Iterator | AsyncIterator) for v in data.values())
+        return False
+
+    @classmethod
+    def _contains_async(cls, data: Any) -> bool:
+        if isinstance(data, AsyncIterator):
+            return True
+        if isinstance(data, dict):
+            return any(isinstance(v, AsyncIterator) for v in data.values())
+        return False
+
+    # encoding
+    def _dump(self, data: Any) -> bytes:
+        result = _JSON_DUMP_IMPL(data=data, encoder=self._encoder, indent=None)
+        if isinstance(result, str):
+            result = result.encode("utf-8")
         return result
+
+    def _dump_batch(self, batch: list[Any], first: bool) -> bytes:
+        # encode batch as one array and strip brackets - single encoder call per batch
+        result = self._dump(batch)[1:-1]
+        return result if first else b"," + result
+
+    def _dump_key(self, key: Any, first: bool) -> bytes:
+        result = self._dump(str(key)) + b":"
+        return result if first else b"," + result
+
+    def _iter_value(self, value: Any) -> Iterator[bytes]:
+        if isinstance(value, Iterator):
+            yield b"["
+            batch, first = [], True
+            for item in value:
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    yield self._dump_batch(batch, first)
+                    batch, first = [], False
+            if batch:
+                yield self._dump_batch(batch, first)
+            yield b"]"
+        elif isinstance(value, dict) and self.is_streamable(value):
+            yield b"{"
+            for index, (k, v) in enumerate(value.items()):
+                yield self._dump_key(k, index == 0)
+                yield from self._iter_value(v)
+            yield b"}"
+        else:
+            yield self._dump(value)
+
+    async def _aiter_value(self, value: Any) -> AsyncIterator[bytes]:
+        if isinstance(value, AsyncIterator):
+            yield b"["
+            batch, first = [], True
+            async for item in value:
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    yield self._dump_batch(batch, first)
+                    batch, first = [], False
+            if batch:
+                yield self._dump_batch(batch, first)
+            yield b"]"
+        elif isinstance(value, dict) and self.is_streamable(value):
+            yield b"{"
+            for index, (k, v) in enumerate(value.items()):
+                yield self._dump_key(k, index == 0)
+                async for chunk in self._aiter_value(v):
+                    yield chunk
+            yield b"}"
+        else:
+            for chunk in self._iter_value(value):
+                yield chunk
+
+    # chunks
+    def _coalesce(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Join small structural chunks with following data"""
+        buffer = []
+        size = 0
+        try:
+            for chunk in chunks:
+                buffer.append(chunk)
+                size += len(chunk)
+                if size >= self._flush_size:
+                    yield b"".join(buffer)
+                    buffer, size = [], 0
+        except Exception:
+            logger.exception(f"<{self.__class__.__name__}>. streaming failed")
+            raise
+        if buffer:
+            yield b"".join(buffer)
+
+    async def _acoalesce(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """Join small structural chunks with following data"""
+        buffer = []
+        size = 0
+        try:
+            async for chunk in chunks:
+                buffer.append(chunk)
+                size += len(chunk)
+                if size >= self._flush_size:
+                    yield b"".join(buffer)
+                    buffer, size = [], 0
+        except Exception:
+            logger.exception(f"<{self.__class__.__name__}>. streaming failed")
+            raise
+        if buffer:
+            yield b"".join(buffer)
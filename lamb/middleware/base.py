@@ -36,8 +36,9 @@ class LambMiddlewareMixin:
         for m in ["process_request", "process_response", "process_view"]:
             if hasattr(self, m):
                 raise ValueError(
-                    f"<{self.__class__.__name__}>: could not be used with old style middlewares. "
-                    f"Use django.utils.deprecation.MiddlewareMixin instead"
+                    f"<{self.__class__.__name__}>: could not be used with old style middlewares, "
+                    f"found {m}(). Move logic to before_request()/after_response() "
+                    f"or use django.utils.deprecation.MiddlewareMixin instead"
                 )
 
         super().__init__()
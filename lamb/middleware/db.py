@@ -1,10 +1,10 @@
-import contextlib
 import logging
+from collections.abc import Awaitable, Callable
 
+import lazy_object_proxy
 from django.conf import settings
 
-from lamb.db.context import lamb_db_context
-from lamb.db.session import lamb_db_session_maker
+from lamb.db.context import LazySessionMap
 from lamb.middleware.base import LambMiddlewareMixin
 from lamb.utils import LambRequest
 
@@ -14,31 +14,68 @@ logger = logging.getLogger(__name__)
 __all__ = ["LambSQLAlchemyMiddleware"]
 
 
+def _closing_content(content, close: Callable[[], None]):
+    try:
+        yield from content
+    finally:
+        close()
+
+
+async def _aclosing_content(content, aclose: Callable[[], Awaitable[None]]):
+    try:
+        async for chunk in content:
+            yield chunk
+    finally:
+        await aclose()
+
+
 class LambSQLAlchemyMiddleware(LambMiddlewareMixin):
+    """Attaches database sessions to request
+
+    `request.lamb_db_session_map` is lazy mapping - session for database key is created on first access and only
+    created sessions are closed on response. `request.lamb_db_session` is lazy proxy of `default` database session,
+    `request.lamb_db_read_session` - of `default` database read replica session (see `Config.replicas`).
+    """
+
+    @staticmethod
+    def _attach(request: LambRequest, sync: bool) -> LazySessionMap:
+        db_sessions = LazySessionMap(settings.LAMB_DB_CONFIG, sync=sync, pooled=True)
+        request.lamb_db_session_map = db_sessions
+        if "default" in db_sessions:
+            request.lamb_db_session = lazy_object_proxy.Proxy(lambda: db_sessions["default"])
+            request.lamb_db_read_session = lazy_object_proxy.Proxy(lambda: db_sessions.read("default"))
+        return db_sessions
+
     def __call__(self, request: LambRequest):
         if self.async_mode:
             return self.__acall__(request)
-        with contextlib.ExitStack() as stack:
-            db_sessions = {}
-            for db_key in settings.LAMB_DB_CONFIG:
-                db_session = stack.enter_context(lamb_db_context(db_key=db_key, pooled=True))
-                db_sessions[db_key] = db_session
-                if db_key == "default":
-                    request.lamb_db_session = db_session
-
-            request.lamb_db_session_map = db_sessions
-            logger.debug(f"<{self.__class__.__name__}>: Attaching DB session_maker - sync")
-            return self.get_response(request)
+        db_sessions = self._attach(request, sync=True)
+        logger.debug(f"<{self.__class__.__name__}>: Attaching DB session_maker - sync")
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            db_sessions.close()
+            raise
+
+        # streaming response could query database while iterating - keep sessions until finished
+        if response.streaming:
+            response.streaming_content = _closing_content(response.streaming_content, db_sessions.close)
+        else:
+            db_sessions.close()
+        return response
 
     async def __acall__(self, request: LambRequest):
-        async with contextlib.AsyncExitStack() as stack:
-            db_sessions = {}
-            for db_key in settings.LAMB_DB_CONFIG:
-                db_session = await stack.enter_async_context(lamb_db_context(db_key=db_key, pooled=True))
-                db_sessions[db_key] = db_session
-                if db_key == "default":
-                    request.lamb_db_session = db_session
-
-            request.lamb_db_session_map = db_sessions
-            logger.debug(f"<{self.__class__.__name__}>: Attaching DB session contexts - async")
-            return await self.get_response(request)
+        db_sessions = self._attach(request, sync=False)
+        logger.debug(f"<{self.__class__.__name__}>: Attaching DB session contexts - async")
+        try:
+            response = await self.get_response(request)
+        except BaseException:
+            await db_sessions.aclose()
+            raise
+
+        # streaming response could query database while iterating - keep sessions until finished
+        if response.streaming and response.is_async:
+            response.streaming_content = _aclosing_content(response.streaming_content, db_sessions.aclose)
+        else:
+            await db_sessions.aclose()
+        return response
@@ -1,30 +1,65 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import datetime
 import logging
 
 from django.conf import settings
 from django.http import HttpResponse
-from django.urls import resolve
-from django.utils.deprecation import MiddlewareMixin
+from django.urls import Resolver404, resolve
+from sqlalchemy.exc import SQLAlchemyError
 
 from lamb.db.context import lamb_db_context
 from lamb.execution_time import ExecutionTimeMeter
 from lamb.execution_time.model import LambExecutionTimeMarker, LambExecutionTimeMetric
+from lamb.middleware.base import LambMiddlewareMixin
 from lamb.utils import LambRequest, dpath_value
 from lamb.utils.core import lazy_default_ro
 from lamb.utils.transformers import tf_list_string, transform_boolean
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["LambExecutionTimeMiddleware"]
+__all__ = ["LambExecutionTimeMiddleware", "a_flush_execution_time_metrics"]
 
 # TODO: modify to act like StatsD daemon
-# TODO: migrate to async/sync version
 
+# strong references to pending metric store tasks - event loop keeps only weak ones
+_store_tasks: set[asyncio.Task] = set()
+
+
+async def a_flush_execution_time_metrics(timeout: float | None = None):
+    """Waits background metric stores of current event loop, stores not finished in timeout are cancelled
+
+    Pending stores are lost with event loop, so call it on ASGI server shutdown.
+
+    Usage::
+
+        # asgi.py
+        async def lifespan_shutdown():
+            await a_flush_execution_time_metrics(timeout=5)
+
+    """
+    loop = asyncio.get_running_loop()
+    tasks = [task for task in _store_tasks if task.get_loop() is loop]
+    if not tasks:
+        return
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    if pending:
+        logger.warning(f"execution time metrics store cancelled on flush, count: {len(pending)}")
+        for task in pending:
+            task.cancel()
+        await asyncio.wait(pending)
+
+
+class LambExecutionTimeMiddleware(LambMiddlewareMixin):
+    """Collects request execution time metrics
+
+    Works natively in both sync and async modes. In async mode metric is stored in database by background task,
+    so response is returned without waiting for database commit - await `a_flush_execution_time_metrics` on shutdown
+    to not lose pending ones.
+    """
 
-class LambExecutionTimeMiddleware(MiddlewareMixin):
     @classmethod
     def append_mark(cls, request: LambRequest, message: str):
         """Appends new marker to request"""
@@ -88,8 +123,10 @@ class LambExecutionTimeMiddleware(MiddlewareMixin):
         """Appends metric object to request"""
         request.lamb_execution_meter = ExecutionTimeMeter()
 
-    def _finish(self, request: LambRequest, response: HttpResponse | None, exception: Exception | None):
-        """Stores collected data in database and logs"""
+    def _finish(
+        self, request: LambRequest, response: HttpResponse | None, exception: Exception | None
+    ) -> LambExecutionTimeMetric | None:
+        """Finalizes metric and logs, returns metric if it should be stored in database"""
         # prepare base container and record
         metric = LambExecutionTimeMetric()
         metric.http_method = request.method
@@ -103,7 +140,7 @@ class LambExecutionTimeMiddleware(MiddlewareMixin):
             resolved = resolve(request.path)
             metric.app_name = resolved.app_name
             metric.url_name = resolved.url_name
-        except Exception:
+        except Resolver404:
             pass
 
         # finalize meter, collect markers and append context
@@ -132,21 +169,10 @@ class LambExecutionTimeMiddleware(MiddlewareMixin):
                     marker.relative_interval = m[2]
                     marker.percentage = m[3]
                     metric.markers.append(marker)
+        except AttributeError:
+            logger.warning(f"<{self.__class__.__name__}>. Execution meter not attached to request")
         except Exception:
-            pass
-
-        # store: database
-        if request.method not in self._settings_skip_methods and self._settings_should_store:
-            try:
-                # logger.warning(f'analyze store rate: {self.store_rates}')
-                # database
-                with lamb_db_context(pooled=settings.LAMB_DB_CONTEXT_POOLED_METRICS) as db_session:
-                    # make in context to omit invalid commits under exceptions
-                    db_session.add(metric)
-                    db_session.commit()
-            except Exception as e:
-                logger.error(f"<{self.__class__.__name__}>. metrics store failed: {e}")
-                pass
+            logger.exception(f"<{self.__class__.__name__}>. Execution meter finalize failed")
 
         # store: logging
         if level_total := self._settings_log_total_level:
@@ -162,6 +188,8 @@ class LambExecutionTimeMiddleware(MiddlewareMixin):
                     "streaming": response.streaming,
                     "content_length": len(response.content) if not response.streaming else None,
                 }
+                if exception is not None:
+                    msg = f"{msg} {exception.__class__.__name__}"
             elif exception is not None:
                 msg = f"{msg} {exception.__class__.__name__}"
                 extra = {
@@ -176,16 +204,56 @@ class LambExecutionTimeMiddleware(MiddlewareMixin):
                 for index, m in enumerate(time_measure.get_log_list()):
                     logger.log(level_markers, f"<{self.__class__.__name__}>. [{index}] {m}")
 
+        # store: database
+        if request.method not in self._settings_skip_methods and self._settings_should_store:
+            return metric
+        return None
+
+    def _store(self, metric: LambExecutionTimeMetric):
+        try:
+            with lamb_db_context(pooled=settings.LAMB_DB_CONTEXT_POOLED_METRICS) as db_session:
+                # make in context to omit invalid commits under exceptions
+                db_session.add(metric)
+                db_session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"<{self.__class__.__name__}>. metrics store failed: {e}")
+        except Exception:
+            logger.exception(f"<{self.__class__.__name__}>. metrics store failed")
+
+    async def _astore(self, metric: LambExecutionTimeMetric):
+        try:
+            async with lamb_db_context(pooled=settings.LAMB_DB_CONTEXT_POOLED_METRICS) as db_session:
+                db_session.add(metric)
+                await db_session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"<{self.__class__.__name__}>. metrics store failed: {e}")
+        except Exception:
+            logger.exception(f"<{self.__class__.__name__}>. metrics store failed")
+
     # lifecycle
-    def process_request(self, request: LambRequest):
+    def __call__(self, request: LambRequest):
+        if self.async_mode:
+            return self.__acall__(request)
         logger.debug(f"<{self.__class__.__name__}>: Start - attaching etm")
         self._start(request=request)
+        response = self.get_response(request)
+        logger.debug(f"<{self.__class__.__name__}>: Finish on response")
+        if (metric := self._finish(request, response, getattr(request, "lamb_execution_exception", None))) is not None:
+            self._store(metric)
+        return response
 
-    def process_response(self, request: LambRequest, response: HttpResponse) -> HttpResponse:
+    async def __acall__(self, request: LambRequest):
+        logger.debug(f"<{self.__class__.__name__}>: Start - attaching etm")
+        self._start(request=request)
+        response = await self.get_response(request)
         logger.debug(f"<{self.__class__.__name__}>: Finish on response")
-        self._finish(request, response, None)
+        if (metric := self._finish(request, response, getattr(request, "lamb_execution_exception", None))) is not None:
+            task = asyncio.create_task(self._astore(metric))
+            _store_tasks.add(task)
+            task.add_done_callback(_store_tasks.discard)
         return response
 
     def process_exception(self, request: LambRequest, exception: Exception):
-        logger.debug(f"<{self.__class__.__name__}>: Finish on exception")
-        self._finish(request, None, exception)
+        """Remembers view exception - converted response would be processed on finish"""
+        logger.debug(f"<{self.__class__.__name__}>: Exception on request: {exception}")
+        request.lamb_execution_exception = exception
@@ -4,12 +4,11 @@ import logging
 from collections import OrderedDict
 from typing import Any
 
-from django.conf import settings
 from django.core.exceptions import RequestDataTooBig
 from django.http import HttpResponse, StreamingHttpResponse
-from django.utils.deprecation import MiddlewareMixin
 from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 
+from lamb.conf import get_lamb_settings
 from lamb.exc import (
     ApiError,
     DatabaseError,
@@ -17,9 +16,12 @@ from lamb.exc import (
     RequestBodyTooBigError,
     ServerError,
 )
-from lamb.json import JsonResponse
-from lamb.utils import LambRequest, dpath_value
-from lamb.utils.core import get_full_cls_instance_name, import_by_name
+from lamb.json import JsonResponse, StreamingJsonResponse
+from lamb.json.binary import BinaryResponse, negotiate_binary_encoding, patch_vary_accept
+from lamb.middleware.base import LambMiddlewareMixin
+from lamb.utils import LambRequest
+from lamb.utils.compression import compress_response
+from lamb.utils.core import get_full_cls_instance_name
 
 try:
     from cassandra import DriverException
@@ -29,27 +31,25 @@ try:
 except ImportError:
     _DB_EXCEPTIONS = (SQLAlchemyError, DBAPIError)
 
-# parse apps to apply
-_apply_to_apps = settings.LAMB_RESPONSE_APPLY_TO_APPS
-
-
 logger = logging.getLogger(__name__)
 
 
 __all__ = ["LambRestApiJsonMiddleware"]
 
 
-# TODO: migrate to async/sync version
-
-
-class LambRestApiJsonMiddleware(MiddlewareMixin):
+class LambRestApiJsonMiddleware(LambMiddlewareMixin):
     """Simple middleware that converts data to JSON.
 
     1. Looks for all exceptions and converts it to JSON representation
     2. For response that is not subclass of HttpResponse also try to create JsonResponse object
+    3. For response that is iterator or dict with iterator values creates StreamingJsonResponse object
+    4. For clients that accept enabled binary encoding (MessagePack, CBOR) creates BinaryResponse object
+    5. Compress response according to LAMB_RESPONSE_COMPRESSION and Accept-Encoding header
+
+    Works natively in both sync and async modes - response processing does not switch context.
     """
 
-    def process_response(self, request: LambRequest, response: HttpResponse):
+    def after_response(self, request: LambRequest, response: HttpResponse):
         logger.debug(f"<{self.__class__.__name__}>: Processing response")
 
         """ Process response handler. Also touch request.POST/FILES fields for proper work """
@@ -58,18 +58,32 @@ class LambRestApiJsonMiddleware(MiddlewareMixin):
         _ = request.FILES
 
         # early return
+        lamb_settings = get_lamb_settings()
+        apply_to_apps = lamb_settings.response_apply_to_apps
         if request.resolver_match is None or (
-            "*" not in _apply_to_apps and request.resolver_match.app_name not in _apply_to_apps
+            "*" not in apply_to_apps and request.resolver_match.app_name not in apply_to_apps
         ):
             return response
 
         # try to encode response
         if not isinstance(response, HttpResponse | StreamingHttpResponse):
             try:
-                response = JsonResponse(response, request=request)
+                if StreamingJsonResponse.is_streamable(response):
+                    response = StreamingJsonResponse(response, request=request)
+                elif (encoding := negotiate_binary_encoding(request)) is not None:
+                    response = BinaryResponse(response, request=request, encoding=encoding)
+                else:
+                    response = JsonResponse(response, request=request)
             except Exception as e:
                 response = self.process_exception(request=request, exception=e)
 
+        # representation depends on Accept header
+        patch_vary_accept(response)
+
+        # compress response
+        if request.resolver_match.app_name not in lamb_settings.response_compression_skip_apps:
+            response = compress_response(request, response)
+
         return response
 
     _exception_serializer = None
@@ -91,10 +105,12 @@ class LambRestApiJsonMiddleware(MiddlewareMixin):
         _ = request.FILES
 
         # early return
+        lamb_settings = get_lamb_settings()
+        apply_to_apps = lamb_settings.response_apply_to_apps
         if ignore_resolver:
             pass
         elif request.resolver_match is None or (
-            "*" not in _apply_to_apps and request.resolver_match.app_name not in _apply_to_apps
+            "*" not in apply_to_apps and request.resolver_match.app_name not in apply_to_apps
         ):
             return exception
 
@@ -116,34 +132,28 @@ class LambRestApiJsonMiddleware(MiddlewareMixin):
             logger.error(f"exception wrapped into: {exception!r}")
 
         # optional patch error
-        if settings.LAMB_ERROR_OVERRIDE_PROCESSOR is not None:
+        if lamb_settings.error_override_processor is not None:
             try:
-                _processor = import_by_name(settings.LAMB_ERROR_OVERRIDE_PROCESSOR)
-                exception = _processor(exception)
+                exception = lamb_settings.error_override_processor(exception)
             except Exception as e:
                 exception = ImproperlyConfiguredError()
                 logger.exception("Exception processor failed")
                 logger.error(f"Converting {e!r} -> {exception!r}")
 
         # envelope error
-        if cls._exception_serializer is None:
-            if serializer_path := dpath_value(settings, "LAMB_RESPONSE_EXCEPTION_SERIALIZER", str, default=None):
-                try:
-                    cls._exception_serializer = import_by_name(serializer_path)
-                except Exception as e:
-                    exception = ImproperlyConfiguredError()
-                    logger.exception("Failed to load dynamic serializer -> rolling back to default serializer")
-                    logger.error(f"Error occurred: {e!r} -> {exception!r}")
-                    cls._exception_serializer = cls._default_exception_serializer
-            else:
-                cls._exception_serializer = cls._default_exception_serializer
-
-        result, status_code = cls._exception_serializer(exception, request)
+        serializer = (
+            cls._exception_serializer
+            or lamb_settings.response_exception_serializer
+            or cls._default_exception_serializer
+        )
+        result, status_code = serializer(exception, request)
 
         if request.method == "HEAD":
             # HEAD requests should not contain any response body
             result = None
-        return JsonResponse(result, status=status_code, request=request)
+        if (encoding := negotiate_binary_encoding(request)) is not None:
+            return BinaryResponse(result, status=status_code, request=request, encoding=encoding)
+        return patch_vary_accept(JsonResponse(result, status=status_code, request=request))
 
     def process_exception(self, request: LambRequest, exception: Exception):
         """Process exception handler"""
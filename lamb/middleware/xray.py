@@ -2,8 +2,9 @@ import logging
 import uuid
 
 from lamb.middleware.base import LambMiddlewareMixin
-from lamb.utils import dpath_value, get_settings_value
-from lamb.utils.core import lazy_default_ro
+from lamb.utils import get_settings_value
+from lamb.utils.core import lazy_default_ro, lazy_ro
+from lamb.utils.dpath import ParamField, ParamsExtractor
 from lamb.utils.transformers import transform_uuid
 from lamb.utils.validators import validate_not_empty
 
@@ -64,21 +65,26 @@ class LambXRayMiddleware(LambMiddlewareMixin):
             logger.debug(f"<{self.__class__.__name__}>: telemetry replaced value: [e={e}] {value} -> {result}")
             return result
 
-    def before_request(self, request):
-        request.xray = dpath_value(
-            request.META,
-            self.settings_header_xray,
-            str,
-            transform=self._transform_uuid,
-            default=uuid.uuid4(),
-        )
-        request.xline = dpath_value(
-            request.META,
-            self.settings_header_xline,
-            str,
-            transform=self._transform_uuid,
-            default=None,
+    @lazy_ro
+    def _x_fields_extractor(self) -> ParamsExtractor:
+        return ParamsExtractor(
+            [
+                ParamField(
+                    "xray",
+                    self.settings_header_xray,
+                    str,
+                    transform=self._transform_uuid,
+                    default_factory=uuid.uuid4,
+                ),
+                ParamField("xline", self.settings_header_xline, str, transform=self._transform_uuid, default=None),
+            ],
+            name="XFields",
         )
+
+    def before_request(self, request):
+        x_fields = self._x_fields_extractor(request.META)
+        request.xray = x_fields.xray
+        request.xline = x_fields.xline
         logger.debug(
             f"<{self.__class__.__name__}>: Did attach x-fields to request: xray={request.xray}, xline={request.xline}"
         )
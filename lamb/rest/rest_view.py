@@ -104,6 +104,11 @@ class RestView:
     def db_session(self) -> SASession | SAAsyncSession:
         return self.request.lamb_db_session_map[self.__default_db__]
 
+    @lazy
+    def db_read_session(self) -> SASession | SAAsyncSession:
+        """Read replica session, the same as `db_session` if database has no replicas"""
+        return self.request.lamb_db_session_map.read(self.__default_db__)
+
     @staticmethod
     def http_method_not_realized(request, *args, **kwargs):
         # print 'Required HTTP method is not realized. Error request path = %s' % request.path_info
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+
+import sqlalchemy as sa
+from django.conf import settings
+from sqlalchemy import Select
+from sqlalchemy.engine import Dialect
+from sqlalchemy.sql.util import find_tables
+
+from lamb.conf import get_lamb_settings
+from lamb.json import JsonEncoder
+from lamb.service.redis.config import RedisConfig
+
+logger = logging.getLogger(__name__)
+
+
+__all__ = [
+    "a_get_cached_total",
+    "a_invalidate_cached_totals",
+    "a_set_cached_total",
+    "get_cached_total",
+    "invalidate_cached_totals",
+    "pagination_total_cache_key",
+    "set_cached_total",
+]
+
+
+_encoder = JsonEncoder()
+
+
+def _redis_conf() -> RedisConfig:
+    return settings.LAMB_REDIS_CONFIG[settings.LAMB_PAGINATION_TOTAL_CACHE_CONFIG]
+
+
+def _table_key(table_name: str) -> str:
+    return f"{get_lamb_settings().pagination_total_cache_prefix}:table:{table_name}"
+
+
+def _callable_name(func: Callable | None) -> str:
+    if func is None:
+        return ""
+    return f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+
+
+def pagination_total_cache_key(
+    statement: Select,
+    dialect: Dialect,
+    strategy: str,
+    db_key: str = "default",
+    count_expr: Callable | None = None,
+) -> tuple[str, list[str]]:
+    """Cache key of total count for statement and names of tables it depends on
+
+    Key is hash of database key, compiled SQL and bound params without sorting, offset and limit - so all pages of
+    collection share the same total. Custom count function is opaque, so its qualified name is hashed too.
+    """
+    statement = statement.order_by(None).limit(None).offset(None)
+    compiled = statement.compile(dialect=dialect, compile_kwargs={"render_postcompile": True})
+    params = json.dumps(compiled.params, sort_keys=True, default=_encoder.default)
+    digest = hashlib.sha256(
+        f"{db_key}\n{strategy}\n{_callable_name(count_expr)}\n{compiled}\n{params}".encode()
+    ).hexdigest()
+
+    table_names = []
+    for table in find_tables(statement, check_columns=True, include_aliases=True, include_joins=True):
+        if isinstance(table, sa.Table) and table.fullname not in table_names:
+            table_names.append(table.fullname)
+
+    return f"{get_lamb_settings().pagination_total_cache_prefix}:{digest}", table_names
+
+
+def _decode(value: bytes | str | None) -> tuple[int, bool] | None:
+    if value is None:
+        return None
+    total, exact = json.loads(value)
+    return total, exact
+
+
+def get_cached_total(key: str) -> tuple[int, bool] | None:
+    """Cached total and exact flag"""
+    result = _decode(_redis_conf().redis().get(key))
+    logger.debug(f"pagination total cache {'hit' if result is not None else 'miss'}: {key}")
+    return result
+
+
+async def a_get_cached_total(key: str) -> tuple[int, bool] | None:
+    r = await _redis_conf().aredis()
+    result = _decode(await r.get(key))
+    logger.debug(f"pagination total cache {'hit' if result is not None else 'miss'}: {key}")
+    return result
+
+
+def set_cached_total(key: str, table_names: list[str], total: int, exact: bool = True):
+    """Store total and register key for invalidation by each table"""
+    ttl = get_lamb_settings().pagination_total_cache_ttl
+    pipe = _redis_conf().redis().pipeline(transaction=False)
+    pipe.set(name=key, value=json.dumps([total, exact]), ex=ttl)
+    for table_name in table_names:
+        pipe.sadd(_table_key(table_name), key)
+        pipe.expire(_table_key(table_name), ttl)
+    pipe.execute()
+
+
+async def a_set_cached_total(key: str, table_names: list[str], total: int, exact: bool = True):
+    ttl = get_lamb_settings().pagination_total_cache_ttl
+    r = await _redis_conf().aredis()
+    pipe = r.pipeline(transaction=False)
+    pipe.set(name=key, value=json.dumps([total, exact]), ex=ttl)
+    for table_name in table_names:
+        pipe.sadd(_table_key(table_name), key)
+        pipe.expire(_table_key(table_name), ttl)
+    await pipe.execute()
+
+
+def invalidate_cached_totals(*table_names: str):
+    """Drop cached totals of all statements that depend on tables
+
+    Usage::
+
+        from lamb.service.redis.pagination import invalidate_cached_totals
+
+        db_session.add(book)
+        db_session.commit()
+        invalidate_cached_totals(Book.__table__.fullname)
+
+    """
+    r = _redis_conf().redis()
+    for table_name in table_names:
+        keys = r.smembers(_table_key(table_name))
+        # single key deletes - keys could live in different cluster slots
+        pipe = r.pipeline(transaction=False)
+        for key in [_table_key(table_name), *keys]:
+            pipe.delete(key)
+        pipe.execute()
+        logger.debug(f"pagination total cache invalidated: {table_name}, keys count: {len(keys)}")
+
+
+async def a_invalidate_cached_totals(*table_names: str):
+    r = await _redis_conf().aredis()
+    for table_name in table_names:
+        keys = await r.smembers(_table_key(table_name))
+        pipe = r.pipeline(transaction=False)
+        for key in [_table_key(table_name), *keys]:
+            pipe.delete(key)
+        await pipe.execute()
+        logger.debug(f"pagination total cache invalidated: {table_name}, keys count: {len(keys)}")
@@ -35,16 +35,34 @@ LAMB_PAGINATION_KEY_ITEMS = "items"
 LAMB_PAGINATION_KEY_ITEMS_EXTENDED = "items_extended"
 LAMB_PAGINATION_KEY_TOTAL = "total_count"
 LAMB_PAGINATION_KEY_OMIT_TOTAL = "total_omit"
+LAMB_PAGINATION_KEY_CURSOR = "cursor"
+LAMB_PAGINATION_KEY_NEXT_CURSOR = "next_cursor"
+LAMB_PAGINATION_KEY_TOTAL_EXACT = "total_exact"
+LAMB_PAGINATION_TOTAL_STRATEGY = "count"  # count - separate query, window - count(*) OVER () within page query,
+# estimate - planner estimation (PostgreSQL) with exact count below threshold
+LAMB_PAGINATION_ESTIMATE_THRESHOLD = 100000
+LAMB_PAGINATION_TOTAL_CACHE_CONFIG = "cache"  # LAMB_REDIS_CONFIG entry name
+LAMB_PAGINATION_TOTAL_CACHE_TTL = 60
+LAMB_PAGINATION_TOTAL_CACHE_PREFIX = "lamb:pagination:total"
 
 LAMB_SORTING_KEY = "sorting"
+LAMB_SORTING_INDEX_AWARE = None  # warn/strict - check client sorting fields to be backed by database index
+LAMB_FILTERS_ARRAY_IN = True  # multi value filters as `= ANY(:array)` on PostgreSQL, IN (...) on other dialects
+LAMB_RESPONSE_FIELDS_KEY = "fields"
 
-LAMB_RESPONSE_JSON_ENGINE = None
+LAMB_RESPONSE_JSON_ENGINE = None  # orjson/ujson/json, None - best available
 LAMB_RESPONSE_JSON_INDENT = None
 LAMB_RESPONSE_DATE_FORMAT = "%Y-%m-%d"
 LAMB_RESPONSE_APPLY_TO_APPS = ["*"]
 LAMB_RESPONSE_ENCODER = "lamb.json.encoder.JsonEncoder"
 LAMB_RESPONSE_EXCEPTION_SERIALIZER = None
 LAMB_RESPONSE_DATETIME_TRANSFORMER = "lamb.utils.transformers.transform_datetime_seconds_int"
+LAMB_RESPONSE_STREAMING_BATCH_SIZE = 500
+LAMB_RESPONSE_COMPRESSION = None  # codecs in preference order: ["zstd", "br", "gzip"], None - disabled
+LAMB_RESPONSE_COMPRESSION_MIN_SIZE = 1024
+LAMB_RESPONSE_COMPRESSION_LEVELS = {"gzip": 6, "br": 4, "zstd": 3}
+LAMB_RESPONSE_BINARY_ENCODINGS = []  # opt-in: ["msgpack", "cbor"] negotiated with Accept header if installed
+LAMB_RESPONSE_COMPRESSION_SKIP_APPS = []
 
 LAMB_ERROR_OVERRIDE_PROCESSOR = None
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import json
 import logging
-from functools import partial
 from typing import Any, TypeVar
 
 from django.conf import settings
@@ -12,12 +12,13 @@ from sqlalchemy import types
 from sqlalchemy.dialects.postgresql import JSONB
 
 from lamb import exc
+from lamb.conf import get_lamb_settings
 from lamb.ext.geoip import get_asn_info, get_city_info, get_country_info
 from lamb.json.encoder import JsonEncoder
 from lamb.json.mixins import ResponseEncodableMixin
 from lamb.types.locale_type import LambLocale
-from lamb.utils import LambRequest, dpath_value
-from lamb.utils.core import import_by_name
+from lamb.utils import LambRequest
+from lamb.utils.dpath import ParamField, ParamsExtractor
 from lamb.utils.validators import validate_length
 
 __all__ = ["DeviceInfo", "DeviceInfoType", "device_info_factory", "get_device_info_class"]
@@ -25,6 +26,24 @@ __all__ = ["DeviceInfo", "DeviceInfoType", "device_info_factory", "get_device_in
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _device_info_headers_extractor(*headers: str) -> ParamsExtractor:
+    family, platform, os_version, locale, app_version, app_build, app_id = headers
+    _transform = functools.partial(validate_length, allow_none=True, empty_as_none=True, trimming=True)
+    return ParamsExtractor(
+        [
+            ParamField("device_family", family, str, transform=_transform, default=None),
+            ParamField("device_platform", platform, str, transform=_transform, default=None),
+            ParamField("device_os_version", os_version, str, transform=_transform, default=None),
+            ParamField("device_locale", locale, str, transform=_transform, default=None),
+            ParamField("app_version", app_version, str, transform=_transform, default=None),
+            ParamField("app_build", app_build, int, default=None),
+            ParamField("app_id", app_id, str, default=None),
+        ],
+        name="DeviceInfoHeaders",
+    )
+
+
 # info class
 @dataclasses.dataclass()
 class DeviceInfo(ResponseEncodableMixin):
@@ -50,25 +69,17 @@ class DeviceInfo(ResponseEncodableMixin):
     def parse_request(cls, request: LambRequest) -> dict[str, Any]:
         try:
             # extract fields
-            _transform = partial(validate_length, allow_none=True, empty_as_none=True, trimming=True)
-
-            device_family = dpath_value(
-                request.META, settings.LAMB_DEVICE_INFO_HEADER_FAMILY, str, transform=_transform, default=None
-            )
-            device_platform = dpath_value(
-                request.META, settings.LAMB_DEVICE_INFO_HEADER_PLATFORM, str, transform=_transform, default=None
-            )
-            device_os_version = dpath_value(
-                request.META, settings.LAMB_DEVICE_INFO_HEADER_OS_VERSION, str, transform=_transform, default=None
-            )
-            device_locale = dpath_value(
-                request.META, settings.LAMB_DEVICE_INFO_HEADER_LOCALE, str, transform=_transform, default=None
-            )
-            app_version = dpath_value(
-                request.META, settings.LAMB_DEVICE_INFO_HEADER_APP_VERSION, str, transform=_transform, default=None
-            )
-            app_build = dpath_value(request.META, settings.LAMB_DEVICE_INFO_HEADER_APP_BUILD, int, default=None)
-            app_id = dpath_value(request.META, settings.LAMB_DEVICE_INFO_HEADER_APP_ID, str, default=None)
+            headers = _device_info_headers_extractor(
+                settings.LAMB_DEVICE_INFO_HEADER_FAMILY,
+                settings.LAMB_DEVICE_INFO_HEADER_PLATFORM,
+                settings.LAMB_DEVICE_INFO_HEADER_OS_VERSION,
+                settings.LAMB_DEVICE_INFO_HEADER_LOCALE,
+                settings.LAMB_DEVICE_INFO_HEADER_APP_VERSION,
+                settings.LAMB_DEVICE_INFO_HEADER_APP_BUILD,
+                settings.LAMB_DEVICE_INFO_HEADER_APP_ID,
+            )(request.META)
+            device_platform = headers.device_platform
+            device_locale = headers.device_locale
 
             # ip/geo fields
             if settings.LAMB_DEVICE_INFO_COLLECT_IP:
@@ -133,13 +144,13 @@ class DeviceInfo(ResponseEncodableMixin):
 
             # construct and store device info
             result = dict(
-                device_family=device_family,
+                device_family=headers.device_family,
                 device_platform=device_platform,
-                device_os=device_os_version,
+                device_os=headers.device_os_version,
                 device_locale=device_locale,
-                app_version=app_version,
-                app_build=app_build,
-                app_id=app_id,
+                app_version=headers.app_version,
+                app_build=headers.app_build,
+                app_id=headers.app_id,
                 ip_address=ip_address,
                 ip_routable=ip_routable,
                 geoip2_info=geoip2_info,
@@ -173,17 +184,9 @@ class DeviceInfo(ResponseEncodableMixin):
 # dynamic factory
 DT = TypeVar("DT", bound=DeviceInfo)
 
-_cached_device_info_class = None
-
 
 def get_device_info_class() -> type[DT]:
-    global _cached_device_info_class
-
-    if _cached_device_info_class is None:
-        _cached_device_info_class = import_by_name(settings.LAMB_DEVICE_INFO_CLASS)
-        logger.info(f"device info class would be used: {_cached_device_info_class}")
-
-    return _cached_device_info_class
+    return get_lamb_settings().device_info_class
 
 
 def device_info_factory(request: LambRequest) -> DeviceInfo:
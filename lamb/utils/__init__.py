@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import contextlib
 import dataclasses
 import enum
 import functools
@@ -12,11 +13,13 @@ import platform
 import re
 import sys
 import tempfile
+import uuid
 import warnings
 import zoneinfo
 from collections import OrderedDict
 from collections.abc import Callable
 from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
 from inspect import isclass
 from typing import Any, Awaitable, BinaryIO, TypedDict, TypeVar
 from urllib.parse import unquote
@@ -26,17 +29,21 @@ import requests
 import sqlalchemy
 from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core import signing
 from django.core.exceptions import RequestDataTooBig
 from django.core.files.uploadedfile import UploadedFile
 from django.http import HttpRequest
 from django.utils import timezone as d_timezone
 from PIL import Image as PILImage
 from sqlalchemy import Column, Select, asc, desc
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import ColumnProperty, Query
+from sqlalchemy.orm import ColumnProperty, Query, load_only
 from sqlalchemy.orm.attributes import InstrumentedAttribute, QueryableAttribute
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from lamb.utils.core import lazy
 
@@ -50,7 +57,9 @@ except ImportError:
 
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession as SAAsyncSession
+from sqlalchemy.orm import Session as SASession
 
+from lamb.conf import get_lamb_settings
 from lamb.exc import (
     ApiError,
     ExternalServiceError,
@@ -75,7 +84,7 @@ from lamb.utils.core import (
     random_string,
 )
 
-from .dpath import dpath_value
+from .dpath import ParamField, ParamsExtractor, dpath_value
 
 __all__ = [
     "DeprecationClassHelper",
@@ -94,12 +103,15 @@ __all__ = [
     "response_paginated",
     "response_sorted",
     "response_filtered",
+    "response_projected",
     "get_request_body_encoding",
     "get_request_accept_encoding",
     "get_current_request",
     "CONTENT_ENCODING_XML",
     "CONTENT_ENCODING_JSON",
     "CONTENT_ENCODING_MULTIPART",
+    "CONTENT_ENCODING_MSGPACK",
+    "CONTENT_ENCODING_CBOR",
     "dpath_value",
     "inject_app_defaults",
     "inject_date_format",
@@ -132,9 +144,12 @@ logger = logging.getLogger(__name__)
 
 class LambRequest(HttpRequest):
     """Class used only for proper type hinting in pycharm, does not guarantee that properties will exist
-    :type lamb_db_session_map: dict[str, sqlalchemy.orm.Session | sqlalchemy.ext.asyncio.AsyncSession] | None
+    :type lamb_db_session_map: lamb.db.context.LazySessionMap | None
     :type lamb_db_session: sqlalchemy.orm.Session | sqlalchemy.ext.asyncio.AsyncSession | None
+    :type lamb_db_read_session: sqlalchemy.orm.Session | sqlalchemy.ext.asyncio.AsyncSession | None
+    :type lamb_response_fields: dict[type, tuple[str, ...]] | None
     :type lamb_execution_meter: lamb.execution_time.ExecutionTimeMeter | None
+    :type lamb_execution_exception: Exception | None
     :type lamb_device_info: lamb.types.DeviceInfo | None
     :type lamb_locale: lamb.types.LambLocale | None
     :type xray: uuid.UUID | None
@@ -145,7 +160,10 @@ class LambRequest(HttpRequest):
         super().__init__()
         self.lamb_db_session_map = None
         self.lamb_db_session = None
+        self.lamb_db_read_session = None
+        self.lamb_response_fields = None
         self.lamb_execution_meter = None
+        self.lamb_execution_exception = None
         self.lamb_device_info = None
         self.lamb_locale = None
         self.xray = None
@@ -207,15 +225,38 @@ class PaginationResult(TypedDict):
     items: list[_T]
 
 
+@functools.lru_cache(maxsize=8)
+def _pagination_params_extractor(
+    key_omit_total: str, key_offset: str, key_limit: str, limit_default: int
+) -> ParamsExtractor:
+    from lamb.utils.transformers import transform_boolean
+
+    return ParamsExtractor(
+        [
+            ParamField("total_omit", key_omit_total, str, transform=transform_boolean, default=False),
+            ParamField("offset", key_offset, int, default=0),
+            ParamField("limit", key_limit, int, default=limit_default),
+        ],
+        name="PaginationRawParams",
+    )
+
+
+def _extract_pagination_params(params: dict):
+    lamb_settings = get_lamb_settings()
+    return _pagination_params_extractor(
+        lamb_settings.pagination_key_omit_total,
+        lamb_settings.pagination_key_offset,
+        lamb_settings.pagination_key_limit,
+        lamb_settings.pagination_limit_default,
+    )(params)
+
+
 def _response_pagination_params(
     request: LambRequest | None = None,
     params: dict | None = None,
     extend_include: bool = False,
 ) -> _PaginationParams:
-    # TODO: move outside of utils to omit cycle loading
-    from lamb.utils.transformers import transform_boolean
-    from lamb.utils.validators import validate_range
-
+    lamb_settings = get_lamb_settings()
     # extract params
     if request is None and params is None:
         logger.error("Either request or params should be provided")
@@ -223,33 +264,27 @@ def _response_pagination_params(
     if request is not None and params is None:
         params = request.GET
 
-    # total omit
-    total_omit = dpath_value(
-        params,
-        settings.LAMB_PAGINATION_KEY_OMIT_TOTAL,
-        str,
-        transform=transform_boolean,
-        default=False,
-    )
+    _raw = _extract_pagination_params(params)
+    total_omit = _raw.total_omit
 
     # offset
     # TODO: customize validators error raising to provide message and details within from dpath_value
-    offset = dpath_value(params, settings.LAMB_PAGINATION_KEY_OFFSET, int, default=0)
+    offset = _raw.offset
     if offset < 0:
         raise InvalidParamValueError(
-            "Invalid offset value for pagination", error_details={"key": settings.LAMB_PAGINATION_KEY_OFFSET}
+            "Invalid offset value for pagination", error_details={"key": lamb_settings.pagination_key_offset}
         )
 
     # limit
-    limit = dpath_value(params, settings.LAMB_PAGINATION_KEY_LIMIT, int, default=settings.LAMB_PAGINATION_LIMIT_DEFAULT)
+    limit = _raw.limit
     if limit < -1:
         raise InvalidParamValueError(
-            "Invalid limit value for pagination", error_details={"key": settings.LAMB_PAGINATION_KEY_LIMIT}
+            "Invalid limit value for pagination", error_details={"key": lamb_settings.pagination_key_limit}
         )
-    if limit > settings.LAMB_PAGINATION_LIMIT_MAX:
+    if limit > lamb_settings.pagination_limit_max:
         raise InvalidParamValueError(
             "Invalid limit value for pagination - exceed max available",
-            error_details={"key": settings.LAMB_PAGINATION_KEY_LIMIT},
+            error_details={"key": lamb_settings.pagination_key_limit},
         )
 
     # calculate extended values
@@ -276,25 +311,385 @@ def _response_pagination_params(
     )
 
 
+def _extended_page(extended_items: list, offset: int, extended_offset: int, limit: int | None) -> list:
+    """Page items from extended window (offset-1 .. limit+2)"""
+    start = offset - extended_offset
+    if limit is None or limit == -1:
+        return extended_items[start:]
+    return extended_items[start : start + limit]
+
+
+# keyset pagination
+@dataclasses.dataclass(frozen=True)
+class _KeysetKey:
+    name: str
+    expression: Any
+    descending: bool
+    nullable: bool
+
+
+_KEYSET_CURSOR_SALT = "lamb.utils.pagination.cursor"
+
+
+def _keyset_keys(collection: Query | Select) -> tuple[Query | Select, list[_KeysetKey]]:
+    """Discover keyset keys from collection sorting and append primary key sorting if not present"""
+    try:
+        model_class = collection.column_descriptions[0]["entity"]
+        model_inspection = inspect(model_class)
+    except Exception as e:
+        raise ProgrammingError("Keyset pagination supports only model based queries") from e
+
+    # candidates to match sorting expressions
+    candidates = {}
+    for name in _get_instance_sorting_attribute_names(model_inspection) + [
+        model_inspection.get_property_by_column(c).key for c in model_inspection.primary_key
+    ]:
+        attribute = getattr(model_class, name)
+        candidates[name] = attribute.__clause_element__() if hasattr(attribute, "__clause_element__") else attribute
+
+    # parse sorting
+    result = []
+    for clause in collection._order_by_clauses:
+        descending = False
+        nulls_modifier = None
+        element = clause
+        if isinstance(element, sa.UnaryExpression) and element.modifier in (
+            operators.nulls_first_op,
+            operators.nulls_last_op,
+        ):
+            nulls_modifier = element.modifier
+            element = element.element
+        if isinstance(element, sa.UnaryExpression) and element.modifier in (operators.asc_op, operators.desc_op):
+            descending = element.modifier is operators.desc_op
+            element = element.element
+        if nulls_modifier is not None and nulls_modifier is not (
+            operators.nulls_first_op if descending else operators.nulls_last_op
+        ):
+            raise ProgrammingError(
+                "Keyset pagination supports only NULLS LAST for asc and NULLS FIRST for desc sorting"
+            )
+        for name, expression in candidates.items():
+            if element.compare(expression):
+                result.append(
+                    _KeysetKey(
+                        name=name,
+                        expression=expression,
+                        descending=descending,
+                        nullable=getattr(expression, "nullable", True),
+                    )
+                )
+                break
+        else:
+            logger.warning(f"keyset pagination unsupported sorting clause: {clause}")
+            raise ProgrammingError("Keyset pagination supports only sorting by model attributes")
+
+    # explicit nulls ordering for nullable keys to be consistent with seek predicate on any dialect
+    if any(k.nullable for k in result):
+        collection = collection.order_by(None).order_by(
+            *[
+                (desc(k.expression).nulls_first() if k.descending else asc(k.expression).nulls_last())
+                if k.nullable
+                else (desc(k.expression) if k.descending else asc(k.expression))
+                for k in result
+            ]
+        )
+
+    # primary key to make sorting unique
+    applied_names = [k.name for k in result]
+    for column in model_inspection.primary_key:
+        name = model_inspection.get_property_by_column(column).key
+        if name in applied_names:
+            continue
+        collection = collection.order_by(desc(getattr(model_class, name)))
+        result.append(_KeysetKey(name=name, expression=candidates[name], descending=True, nullable=False))
+
+    return collection, result
+
+
+def _keyset_signature(keys: list[_KeysetKey]) -> list[str]:
+    return [f"{k.name}{'-' if k.descending else '+'}" for k in keys]
+
+
+def _keyset_encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if isinstance(value, uuid.UUID):
+        return {"uuid": str(value)}
+    if isinstance(value, enum.Enum):
+        return {"enum": value.name}
+    return value
+
+
+def _keyset_decode_value(value: Any, key: _KeysetKey) -> Any:
+    if not isinstance(value, dict):
+        return value
+    ((tag, raw),) = value.items()
+    if tag == "enum":
+        # member restored with enum class of key column type
+        enum_class = getattr(getattr(key.expression, "type", None), "enum_class", None)
+        if enum_class is None:
+            raise ValueError(f"keyset key is not enum typed: {key.name}")
+        return enum_class[raw]
+    return {
+        "dt": datetime.fromisoformat,
+        "d": date.fromisoformat,
+        "dec": Decimal,
+        "uuid": uuid.UUID,
+    }[tag](raw)
+
+
+def _keyset_item_value(item: Any, name: str) -> Any:
+    # rows of single entity select
+    if isinstance(item, sa.Row) and name not in item._fields:
+        item = item[0]
+    return getattr(item, name)
+
+
+def _keyset_cursor_encode(keys: list[_KeysetKey], item: Any) -> str:
+    payload = {
+        "k": _keyset_signature(keys),
+        "v": [_keyset_encode_value(_keyset_item_value(item, k.name)) for k in keys],
+    }
+    return signing.dumps(payload, salt=_KEYSET_CURSOR_SALT, compress=True)
+
+
+def _keyset_cursor_decode(cursor: str, keys: list[_KeysetKey]) -> list[Any]:
+    try:
+        payload = signing.loads(cursor, salt=_KEYSET_CURSOR_SALT)
+        if payload["k"] != _keyset_signature(keys):
+            raise ValueError("cursor sorting mismatch")
+        return [_keyset_decode_value(v, k) for v, k in zip(payload["v"], keys)]
+    except Exception as e:
+        raise InvalidParamValueError(
+            "Invalid cursor value for pagination", error_details={"key": get_lamb_settings().pagination_key_cursor}
+        ) from e
+
+
+def _keyset_predicate(keys: list[_KeysetKey], values: list[Any]):
+    """Seek predicate for items after cursor values (nulls ordering: NULLS LAST for asc, NULLS FIRST for desc)"""
+    # row values comparison - could use composite index
+    if (
+        len({k.descending for k in keys}) == 1
+        and not any(k.nullable for k in keys)
+        and all(v is not None for v in values)
+    ):
+        left = sa.tuple_(*[k.expression for k in keys])
+        right = sa.tuple_(*[sa.literal(v) for v in values])
+        return left < right if keys[0].descending else left > right
+
+    def _after(key: _KeysetKey, value: Any):
+        if value is None:
+            return key.expression.is_not(None) if key.descending else None
+        if key.descending:
+            return key.expression < value
+        if key.nullable:
+            return sa.or_(key.expression > value, key.expression.is_(None))
+        return key.expression > value
+
+    def _equal(key: _KeysetKey, value: Any):
+        return key.expression.is_(None) if value is None else key.expression == value
+
+    terms = []
+    for index, (key, value) in enumerate(zip(keys, values)):
+        after = _after(key, value)
+        if after is None:
+            continue
+        terms.append(sa.and_(*[_equal(k, v) for k, v in zip(keys[:index], values[:index])], after))
+    return sa.or_(*terms) if terms else sa.false()
+
+
+def _keyset_prepare(collection: Query | Select, params: dict) -> tuple[Query | Select, list[_KeysetKey]]:
+    collection, keys = _keyset_keys(collection)
+    cursor = dpath_value(params, get_lamb_settings().pagination_key_cursor, str, default=None)
+    if cursor:
+        collection = collection.filter(_keyset_predicate(keys, _keyset_cursor_decode(cursor, keys)))
+    return collection, keys
+
+
+def _keyset_page(items: list, keys: list[_KeysetKey], limit: int | None) -> tuple[list, str | None]:
+    """Cut page from items fetched with limit+1 and build next cursor"""
+    if limit is None or len(items) <= limit:
+        return items, None
+    if limit == 0:
+        # no item to continue from - empty page without next cursor
+        return [], None
+    items = items[:limit]
+    return items, _keyset_cursor_encode(keys, items[-1])
+
+
+_PAGINATION_TOTAL_STRATEGIES = ("count", "window", "estimate")
+
+
+class _PlanExplain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of statement - compiled and executed as regular statement, so bind params processed"""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_PlanExplain, "postgresql")
+def _compile_plan_explain(element: _PlanExplain, compiler, **kwargs):
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kwargs)}"
+
+
+def _pagination_estimate(statement: Select, connection: sa.Connection) -> int | None:
+    """Planner based rows count estimation of statement, None if not available
+
+    Unfiltered single table statements are estimated with `pg_class.reltuples`, others with `EXPLAIN (FORMAT JSON)`.
+    """
+    if connection.dialect.name != "postgresql":
+        return None
+    statement = statement.order_by(None)
+
+    # unfiltered table
+    froms = statement.get_final_froms()
+    if (
+        statement.whereclause is None
+        and not statement._group_by_clauses
+        and not statement._having_criteria
+        and not statement._distinct
+        and len(froms) == 1
+        and isinstance(froms[0], sa.Table)
+    ):
+        table_name = connection.dialect.identifier_preparer.format_table(froms[0])
+        reltuples = connection.execute(
+            sa.text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": table_name},
+        ).scalar()
+        # negative value for never analyzed tables
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+
+    # planner estimation
+    plan = connection.execute(_PlanExplain(statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _a_pagination_total(
+    collection: Select,
+    db_session: SAAsyncSession,
+    count_expr: Callable[[Select], Awaitable[int]] | None = None,
+) -> int:
+    # # previous
+    # result[settings.LAMB_PAGINATION_KEY_TOTAL] = await db_session.scalar(
+    #     sa.select(sa.func.count()).select_from(collection)
+    # )
+    # new
+    # - use subquery version for sqlalchemy deprecation compatibility
+    # - removes order_by to omit sorting step not required in count
+    if count_expr is not None:
+        return await count_expr(collection)
+    return await db_session.scalar(sa.select(sa.func.count()).select_from(collection.order_by(None).subquery()))
+
+
+async def _a_pagination_total_estimated(
+    collection: Select,
+    db_session: SAAsyncSession,
+    count_expr: Callable[[Select], Awaitable[int]] | None = None,
+) -> tuple[int, bool]:
+    lamb_settings = get_lamb_settings()
+    connection = await db_session.connection()
+    estimate = await connection.run_sync(functools.partial(_pagination_estimate, collection))
+    if estimate is None or estimate < lamb_settings.pagination_estimate_threshold:
+        return await _a_pagination_total(collection, db_session, count_expr), True
+    return estimate, False
+
+
+async def _a_pagination_total_cache_store(result: dict, key: str, table_names: list[str]):
+    lamb_settings = get_lamb_settings()
+    from lamb.service.redis.pagination import a_set_cached_total
+
+    await a_set_cached_total(
+        key,
+        table_names,
+        result[lamb_settings.pagination_key_total],
+        result.get(lamb_settings.pagination_key_total_exact, True),
+    )
+
+
+async def _a_pagination_total_fill(
+    result: dict,
+    collection: Select,
+    db_session: SAAsyncSession,
+    count_expr: Callable[[Select], Awaitable[int]] | None,
+    total_strategy: str,
+    total_cache_key: str | None,
+    total_cache_tables: list[str] | None,
+):
+    lamb_settings = get_lamb_settings()
+    if total_strategy == "estimate":
+        (
+            result[lamb_settings.pagination_key_total],
+            result[lamb_settings.pagination_key_total_exact],
+        ) = await _a_pagination_total_estimated(collection, db_session, count_expr)
+    else:
+        result[lamb_settings.pagination_key_total] = await _a_pagination_total(collection, db_session, count_expr)
+    if total_cache_key is not None:
+        await _a_pagination_total_cache_store(result, total_cache_key, total_cache_tables)
+
+
+async def _a_pagination_total_fill_concurrent(db_key: str, **kwargs):
+    # own pooled connection to run in parallel with items query
+    from lamb.db.session import get_session_maker
+
+    async with get_session_maker(db_key, pooled=True, sync=False)() as db_session:
+        await _a_pagination_total_fill(db_session=db_session, **kwargs)
+
+
 async def a_response_paginated(
     collection: PV,
     params: dict = None,
     db_session: SAAsyncSession = None,  # alchemy session
     count_expr: Callable[[PV], Awaitable[int]] | None = None,
     db_as_rows: bool = False,
+    stream: bool = False,
+    keyset: bool = False,
+    total_strategy: str | None = None,
+    total_cache: bool = False,
+    concurrent: bool = False,
+    db_key: str = "default",
+    add_extended_query: bool = False,
 ) -> PaginationResult:
+    """Async pagination utility
+
+    :param stream: Fetch `Select` items with server side cursor as async iterator instead of list,
+        should be encoded with `lamb.json.StreamingJsonResponse` (applied automatically by `LambRestApiJsonMiddleware`)
+    :param keyset: Keyset (cursor) pagination for `Select` - items after `LAMB_PAGINATION_KEY_CURSOR` param position
+        according to collection sorting and primary key, offset is ignored and opaque token for next page
+        returned under `LAMB_PAGINATION_KEY_NEXT_CURSOR` key
+    :param total_strategy: Total count strategy for `Select`, by default `LAMB_PAGINATION_TOTAL_STRATEGY`:
+        `count` - separate count query, `window` - `count(*) OVER ()` fetched with page items in single query
+        (falls back to separate count query for empty page), `estimate` - planner estimation for PostgreSQL
+        if not less than `LAMB_PAGINATION_ESTIMATE_THRESHOLD` with `LAMB_PAGINATION_KEY_TOTAL_EXACT` flag in result
+    :param total_cache: Cache total count in Redis for `LAMB_PAGINATION_TOTAL_CACHE_TTL` seconds,
+        invalidation by table name available with `lamb.service.redis.pagination.a_invalidate_cached_totals`
+    :param concurrent: Run separate total query concurrently with items query on own pooled connection of `db_key`
+        database, total would not include uncommitted changes of `db_session` transaction
+    :param db_key: Database key of `db_session` for concurrent total query and total cache key
+    :param add_extended_query: Flag to add to result extended version of `Select` items slice
+        (including one more item from begin and end of slice), page items sliced from it without extra query
+    """
     # prepare
     _p = _response_pagination_params(params=params)
+    lamb_settings = get_lamb_settings()
     offset = _p.offset
     limit = _p.limit
     total_omit = _p.total_omit
 
     # prepare result container
     result = {
-        settings.LAMB_PAGINATION_KEY_TOTAL: None,
-        settings.LAMB_PAGINATION_KEY_OFFSET: offset,
-        settings.LAMB_PAGINATION_KEY_LIMIT: limit,
-        settings.LAMB_PAGINATION_KEY_ITEMS: [],
+        lamb_settings.pagination_key_total: None,
+        lamb_settings.pagination_key_offset: offset,
+        lamb_settings.pagination_key_limit: limit,
+        lamb_settings.pagination_key_items: [],
     }
 
     if isinstance(collection, Select):
@@ -302,37 +697,134 @@ async def a_response_paginated(
         if db_session is None:
             logger.error("db_session cannot be None for Select pagination")
             raise ProgrammingError
+        if stream and (keyset or add_extended_query):
+            logger.error("stream mode could not be used with keyset pagination or extended query")
+            raise ProgrammingError
 
-        if not total_omit:
-            # # previous
-            # result[settings.LAMB_PAGINATION_KEY_TOTAL] = await db_session.scalar(
-            #     sa.select(sa.func.count()).select_from(collection)
-            # )
-            # new
-            # - use subquery version for sqlalchemy deprecation compatibility
-            # - removes order_by to omit sorting step not required in count
-            if count_expr is None:
-                result[settings.LAMB_PAGINATION_KEY_TOTAL] = await db_session.scalar(
-                    sa.select(sa.func.count()).select_from(collection.order_by(None).subquery())
-                )
+        # total strategy: window version not applicable for modes that change page boundaries or consume lazily
+        total_strategy = total_strategy or lamb_settings.pagination_total_strategy
+        if total_strategy not in _PAGINATION_TOTAL_STRATEGIES:
+            raise ImproperlyConfiguredError(f"Unknown pagination total strategy: {total_strategy}")
+        total_required = not total_omit
+
+        # cached total
+        total_cache_key, total_cache_tables = None, None
+        if total_required and total_cache:
+            from lamb.service.redis.pagination import a_get_cached_total, pagination_total_cache_key
+
+            total_cache_key, total_cache_tables = pagination_total_cache_key(
+                collection,
+                db_session.get_bind().dialect,
+                "estimate" if total_strategy == "estimate" else "count",
+                db_key=db_key,
+                count_expr=count_expr,
+            )
+            if (cached_total := await a_get_cached_total(total_cache_key)) is not None:
+                result[lamb_settings.pagination_key_total] = cached_total[0]
+                if total_strategy == "estimate":
+                    result[lamb_settings.pagination_key_total_exact] = cached_total[1]
+                total_required = False
+
+        # empty page could not provide total with window
+        window_total = total_required and total_strategy == "window" and not keyset and not stream and limit != 0
+
+        # separate total query - in parallel on own connection or before items on the same session
+        total_task = None
+        if total_required and not window_total:
+            total_kwargs = {
+                "result": result,
+                "collection": collection,
+                "count_expr": count_expr,
+                "total_strategy": total_strategy,
+                "total_cache_key": total_cache_key,
+                "total_cache_tables": total_cache_tables,
+            }
+            if concurrent:
+                total_task = asyncio.create_task(_a_pagination_total_fill_concurrent(db_key=db_key, **total_kwargs))
             else:
-                result[settings.LAMB_PAGINATION_KEY_TOTAL] = await count_expr(collection)
-
-        collection = collection.offset(offset)
-        if limit:
-            collection = collection.limit(limit)
+                await _a_pagination_total_fill(db_session=db_session, **total_kwargs)
 
-        if not db_as_rows:
-            result[settings.LAMB_PAGINATION_KEY_ITEMS] = (await db_session.scalars(collection)).all()
-        else:
-            result[settings.LAMB_PAGINATION_KEY_ITEMS] = (await db_session.execute(collection)).all()
+        try:
+            if keyset:
+                collection, keys = _keyset_prepare(collection, params)
+                if limit is not None:
+                    collection = collection.limit(limit + 1)
+                if not db_as_rows:
+                    items = (await db_session.scalars(collection)).all()
+                else:
+                    items = (await db_session.execute(collection)).all()
+                result[lamb_settings.pagination_key_offset] = None
+                (
+                    result[lamb_settings.pagination_key_items],
+                    result[lamb_settings.pagination_key_next_cursor],
+                ) = _keyset_page(list(items), keys, limit)
+            else:
+                # extended window always contains page - fetch it once and slice page items
+                original_collection = collection
+                fetch_offset = _p.extend_offset if add_extended_query else offset
+                collection = collection.offset(fetch_offset)
+                if limit is not None:
+                    collection = collection.limit(_p.extend_limit if add_extended_query else limit)
+
+                if window_total:
+                    # single statement: page items with total count of collection in each row
+                    columns_count = len(collection.column_descriptions)
+                    frozen_result = (
+                        await db_session.execute(
+                            collection.add_columns(sa.func.count().over().label("lamb_total_count"))
+                        )
+                    ).freeze()
+                    rows = frozen_result().all()
+                    if len(rows) > 0:
+                        result[lamb_settings.pagination_key_total] = rows[0][-1]
+                    elif fetch_offset == 0:
+                        result[lamb_settings.pagination_key_total] = 0
+                    else:
+                        # page is out of collection - total could not be discovered from window
+                        result[lamb_settings.pagination_key_total] = await _a_pagination_total(
+                            original_collection, db_session, count_expr
+                        )
+                    if total_cache_key is not None:
+                        await _a_pagination_total_cache_store(result, total_cache_key, total_cache_tables)
+                    if not db_as_rows:
+                        result[lamb_settings.pagination_key_items] = frozen_result().scalars().all()
+                    else:
+                        result[lamb_settings.pagination_key_items] = (
+                            frozen_result().columns(*range(columns_count)).all()
+                        )
+                elif stream:
+                    if not db_as_rows:
+                        result[lamb_settings.pagination_key_items] = await db_session.stream_scalars(collection)
+                    else:
+                        result[lamb_settings.pagination_key_items] = await db_session.stream(collection)
+                elif not db_as_rows:
+                    result[lamb_settings.pagination_key_items] = (await db_session.scalars(collection)).all()
+                else:
+                    result[lamb_settings.pagination_key_items] = (await db_session.execute(collection)).all()
+
+                if add_extended_query:
+                    extended_items = result[lamb_settings.pagination_key_items]
+                    result[lamb_settings.pagination_key_items_extended] = extended_items
+                    result[lamb_settings.pagination_key_items] = _extended_page(
+                        extended_items, offset, fetch_offset, limit
+                    )
+        except BaseException:
+            if total_task is not None:
+                # wait cancelled task to release its connection, its own result is not interesting on failure
+                total_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await total_task
+            raise
+
+        if total_task is not None:
+            await total_task
     elif isinstance(collection, list):
-        result[settings.LAMB_PAGINATION_KEY_TOTAL] = len(collection) if not total_omit else None
+        result[lamb_settings.pagination_key_total] = len(collection) if not total_omit else None
 
-        if limit:
-            result[settings.LAMB_PAGINATION_KEY_ITEMS] = collection[offset : offset + limit]
+        if limit is not None:
+            result[lamb_settings.pagination_key_items] = collection[offset : offset + limit]
         else:
-            result[settings.LAMB_PAGINATION_KEY_ITEMS] = collection[offset:]
+            result[lamb_settings.pagination_key_items] = collection[offset:]
     # elif cassandra is not None and isinstance(collection, ModelQuerySet):
     #     # Cassandra
     #     # NOTE: not checked - uncomment and check in case of usage
@@ -353,47 +845,58 @@ def response_paginated(
     request: LambRequest = None,
     params: dict = None,
     add_extended_query: bool = False,
+    keyset: bool = False,
+    total_strategy: str | None = None,
+    total_cache: bool = False,
+    db_session: SASession = None,
+    db_as_rows: bool = False,
+    db_key: str = "default",
 ) -> PaginationResult:
     """Pagination utility
 
     Will search for limit/offset params in `request.GET` object and apply it to data, returning
     dictionary that includes info about real offset, limit, total_count, items.
 
-    :param data: Instance of list or query to be paginated
+    :param data: Instance of list, query or select to be paginated
     :param request: Http request (deprecated version)
     :param params: Dictionary with params of pagination
     :param add_extended_query: Flag to add to result extended version of data slice
-        (including one more item from begin and and of slice)
+        (including one more item from begin and and of slice), for queries page items sliced from extended version
+    :param keyset: Keyset (cursor) pagination for `Query`/`Select` - items after `LAMB_PAGINATION_KEY_CURSOR` param
+        position according to query sorting and primary key, offset is ignored and opaque token for next page
+        returned under `LAMB_PAGINATION_KEY_NEXT_CURSOR` key
+    :param total_strategy: Total count strategy for `Query`/`Select`, by default `LAMB_PAGINATION_TOTAL_STRATEGY`:
+        `estimate` - planner estimation for PostgreSQL if not less than `LAMB_PAGINATION_ESTIMATE_THRESHOLD`
+        with `LAMB_PAGINATION_KEY_TOTAL_EXACT` flag in result, other strategies - separate count query
+    :param total_cache: Cache total count in Redis for `LAMB_PAGINATION_TOTAL_CACHE_TTL` seconds,
+        invalidation by table name available with `lamb.service.redis.pagination.invalidate_cached_totals`
+    :param db_session: Session for `Select` pagination
+    :param db_as_rows: Return `Select` items as rows instead of scalars
+    :param db_key: Database key of `db_session` for total cache key
     """
+    lamb_settings = get_lamb_settings()
     # extract params
-    from lamb.utils.transformers import transform_boolean
-
     if request is not None and params is None:
         params = request.GET
 
-    total_omit = dpath_value(
-        params,
-        settings.LAMB_PAGINATION_KEY_OMIT_TOTAL,
-        str,
-        transform=transform_boolean,
-        default=False,
-    )
+    _raw = _extract_pagination_params(params)
+    total_omit = _raw.total_omit
 
-    offset = dpath_value(params, settings.LAMB_PAGINATION_KEY_OFFSET, int, default=0)
+    offset = _raw.offset
     if offset < 0:
         raise InvalidParamValueError(
-            "Invalid offset value for pagination", error_details=settings.LAMB_PAGINATION_KEY_OFFSET
+            "Invalid offset value for pagination", error_details=lamb_settings.pagination_key_offset
         )
 
-    limit = dpath_value(params, settings.LAMB_PAGINATION_KEY_LIMIT, int, default=settings.LAMB_PAGINATION_LIMIT_DEFAULT)
+    limit = _raw.limit
     if limit < -1:
         raise InvalidParamValueError(
-            "Invalid limit value for pagination", error_details=settings.LAMB_PAGINATION_KEY_LIMIT
+            "Invalid limit value for pagination", error_details=lamb_settings.pagination_key_limit
         )
-    if limit > settings.LAMB_PAGINATION_LIMIT_MAX:
+    if limit > lamb_settings.pagination_limit_max:
         raise InvalidParamValueError(
             "Invalid limit value for pagination - exceed max available",
-            error_details=settings.LAMB_PAGINATION_KEY_LIMIT,
+            error_details=lamb_settings.pagination_key_limit,
         )
 
     # calculate extended values
@@ -412,54 +915,127 @@ def response_paginated(
 
     # prepare result container
     result = OrderedDict()
-    result[settings.LAMB_PAGINATION_KEY_OFFSET] = offset
-    result[settings.LAMB_PAGINATION_KEY_LIMIT] = limit
+    result[lamb_settings.pagination_key_offset] = offset
+    result[lamb_settings.pagination_key_limit] = limit
 
-    if isinstance(data, Query):
+    if isinstance(data, Query | Select):
         # SQL
-        if not total_omit:
-            result[settings.LAMB_PAGINATION_KEY_TOTAL] = data.count()
-        else:
-            result[settings.LAMB_PAGINATION_KEY_TOTAL] = None
+        if isinstance(data, Query):
+            statement = data.statement
+            db_session = data.session
 
-        if limit == -1:
-            result[settings.LAMB_PAGINATION_KEY_ITEMS] = data.offset(offset).all()
+            def _fetch(query: Query) -> list:
+                return query.all()
+
+            def _count() -> int:
+                return data.count()
         else:
-            result[settings.LAMB_PAGINATION_KEY_ITEMS] = data.offset(offset).limit(limit).all()
+            if db_session is None:
+                logger.error("db_session cannot be None for Select pagination")
+                raise ProgrammingError
+            statement = data
+
+            def _fetch(query: Select) -> list:
+                if db_as_rows:
+                    return db_session.execute(query).all()
+                return db_session.scalars(query).all()
+
+            def _count() -> int:
+                return db_session.scalar(sa.select(sa.func.count()).select_from(data.order_by(None).subquery()))
+
+        total_strategy = total_strategy or lamb_settings.pagination_total_strategy
+        if total_strategy not in _PAGINATION_TOTAL_STRATEGIES:
+            raise ImproperlyConfiguredError(f"Unknown pagination total strategy: {total_strategy}")
+
+        total_required = not total_omit
+        result[lamb_settings.pagination_key_total] = None
+
+        # cached total
+        total_cache_key = None
+        if total_required and total_cache:
+            from lamb.service.redis.pagination import (
+                get_cached_total,
+                pagination_total_cache_key,
+                set_cached_total,
+            )
 
-        if add_extended_query:
+            total_cache_key, total_cache_tables = pagination_total_cache_key(
+                statement,
+                db_session.get_bind().dialect,
+                "estimate" if total_strategy == "estimate" else "count",
+                db_key=db_key,
+            )
+            if (cached_total := get_cached_total(total_cache_key)) is not None:
+                result[lamb_settings.pagination_key_total] = cached_total[0]
+                if total_strategy == "estimate":
+                    result[lamb_settings.pagination_key_total_exact] = cached_total[1]
+                total_required = False
+
+        if total_required and total_strategy == "estimate":
+            estimate = _pagination_estimate(statement, db_session.connection())
+            if estimate is None or estimate < lamb_settings.pagination_estimate_threshold:
+                result[lamb_settings.pagination_key_total] = _count()
+                result[lamb_settings.pagination_key_total_exact] = True
+            else:
+                result[lamb_settings.pagination_key_total] = estimate
+                result[lamb_settings.pagination_key_total_exact] = False
+        elif total_required:
+            result[lamb_settings.pagination_key_total] = _count()
+
+        if total_required and total_cache_key is not None:
+            set_cached_total(
+                total_cache_key,
+                total_cache_tables,
+                result[lamb_settings.pagination_key_total],
+                result.get(lamb_settings.pagination_key_total_exact, True),
+            )
+
+        if keyset:
+            data, keys = _keyset_prepare(data, params)
+            items = _fetch(data) if limit == -1 else _fetch(data.limit(limit + 1))
+            result[lamb_settings.pagination_key_offset] = None
+            (
+                result[lamb_settings.pagination_key_items],
+                result[lamb_settings.pagination_key_next_cursor],
+            ) = _keyset_page(list(items), keys, limit if limit != -1 else None)
+        elif add_extended_query:
+            # extended window always contains page - fetch it once and slice page items
             if extended_limit == -1:
-                result[settings.LAMB_PAGINATION_KEY_ITEMS_EXTENDED] = data.offset(extended_offset).all()
+                extended_items = _fetch(data.offset(extended_offset))
             else:
-                result[settings.LAMB_PAGINATION_KEY_ITEMS_EXTENDED] = (
-                    data.offset(extended_offset).limit(extended_limit).all()
-                )
+                extended_items = _fetch(data.offset(extended_offset).limit(extended_limit))
+            result[lamb_settings.pagination_key_items] = _extended_page(extended_items, offset, extended_offset, limit)
+            result[lamb_settings.pagination_key_items_extended] = extended_items
+        elif limit == -1:
+            result[lamb_settings.pagination_key_items] = _fetch(data.offset(offset))
+        else:
+            result[lamb_settings.pagination_key_items] = _fetch(data.offset(offset).limit(limit))
     elif cassandra is not None and isinstance(data, ModelQuerySet):
         # Cassandra
 
-        result[settings.LAMB_PAGINATION_KEY_TOTAL] = data.count() if not total_omit else None
+        result[lamb_settings.pagination_key_total] = data.count() if not total_omit else None
         if limit == -1:
-            result[settings.LAMB_PAGINATION_KEY_ITEMS] = data.all()[offset:]
+            result[lamb_settings.pagination_key_items] = data.all()[offset:]
         else:
-            result[settings.LAMB_PAGINATION_KEY_ITEMS] = data.all()[offset : offset + limit]
+            result[lamb_settings.pagination_key_items] = data.all()[offset : offset + limit]
     elif isinstance(data, list):
         # List
 
         if not total_omit:
-            result[settings.LAMB_PAGINATION_KEY_TOTAL] = len(data)
+            result[lamb_settings.pagination_key_total] = len(data)
         else:
-            result[settings.LAMB_PAGINATION_KEY_TOTAL] = None
+            result[lamb_settings.pagination_key_total] = None
 
         if limit == -1:
-            result[settings.LAMB_PAGINATION_KEY_ITEMS] = data[offset:]
+            result[lamb_settings.pagination_key_items] = data[offset:]
         else:
-            result[settings.LAMB_PAGINATION_KEY_ITEMS] = data[offset : offset + limit]
+            result[lamb_settings.pagination_key_items] = data[offset : offset + limit]
 
         if add_extended_query:
             if extended_limit == -1:
-                result[settings.LAMB_PAGINATION_KEY_ITEMS_EXTENDED] = data[offset:]
+                result[lamb_settings.pagination_key_items_extended] = data[offset:]
             else:
-                result[settings.LAMB_PAGINATION_KEY_ITEMS_EXTENDED] = data[
+                result[lamb_settings.pagination_key_items_extended] = data[
                     extended_offset : extended_offset + extended_limit
                 ]
     else:
@@ -471,9 +1047,19 @@ def response_paginated(
 Sorter = tuple[str, Callable]
 
 
-def _get_instance_sorting_attribute_names(ins: object) -> list[str]:
-    # TODO: add support for instance and model class params
-    # TODO: cache results
+@dataclasses.dataclass(frozen=True)
+class _SortingIndex:
+    attribute_names: frozenset[str]
+    indexed_names: frozenset[str]
+
+
+_SORTING_INDEX_REGISTRY: dict[type, _SortingIndex] = {}
+_SORTING_FULL_REGEX = re.compile(r"^\w+{\w+}$")
+_SORTING_SHORT_REGEX = re.compile(r"^\w+$")
+_SORTING_INDEX_AWARE_MODES = ("warn", "strict")
+
+
+def _build_sorting_index(ins) -> _SortingIndex:
     # discover sortable attributes
     sortable_attributes = set()
 
@@ -485,7 +1071,7 @@ def _get_instance_sorting_attribute_names(ins: object) -> list[str]:
         set([ormd for ormd in ins.all_orm_descriptors if type(ormd) == hybrid_property])  # noqa: E721
     )
 
-    result = []
+    attribute_names = set()
     for ormd in sortable_attributes:
         if isinstance(ormd, Column):
             orm_attr_name = ormd.name
@@ -496,21 +1082,45 @@ def _get_instance_sorting_attribute_names(ins: object) -> list[str]:
         else:
             logger.warning(f"Unsupported orm_descriptor type: {ormd, ormd.__class__}")
             raise ServerError("Could not serialize data")
-        result.append(orm_attr_name)
+        attribute_names.add(orm_attr_name)
+
+    # discover columns that could be served by index: leading columns of indexes, primary and unique keys
+    leading_columns = set()
+    for table in ins.mapper.tables:
+        for constraint in list(table.indexes) + list(table.constraints):
+            if isinstance(constraint, sa.Index | sa.PrimaryKeyConstraint | sa.UniqueConstraint):
+                columns = list(constraint.columns)
+                if len(columns) > 0:
+                    leading_columns.add(columns[0])
+    indexed_names = {
+        prop.key for prop in ins.mapper.column_attrs.values() if any(c in leading_columns for c in prop.columns[:1])
+    }
 
-    return result
+    return _SortingIndex(attribute_names=frozenset(attribute_names), indexed_names=frozenset(indexed_names))
+
+
+def _get_sorting_index(ins) -> _SortingIndex:
+    """Sorting index of model - built once per model class"""
+    try:
+        return _SORTING_INDEX_REGISTRY[ins.class_]
+    except KeyError:
+        result = _SORTING_INDEX_REGISTRY[ins.class_] = _build_sorting_index(ins)
+        logger.debug(f"sorting index built for {ins.class_.__name__}: {result}")
+        return result
+
+
+def _get_instance_sorting_attribute_names(ins: object) -> list[str]:
+    return list(_get_sorting_index(ins).attribute_names)
 
 
 def _sorting_parse_sorter(raw_sorting_descriptor: str, model_inspection) -> Sorter:
     """Parse single sorting descriptor"""
     # check against regex and extract field and function
-    full_regex = re.compile(r"^\w+{\w+}$")
-    short_regex = re.compile(r"^\w+$")
-    if full_regex.match(raw_sorting_descriptor) is not None:
+    if _SORTING_FULL_REGEX.match(raw_sorting_descriptor) is not None:
         index = raw_sorting_descriptor.index("{")
         field = raw_sorting_descriptor[:index]
         sort_functor = raw_sorting_descriptor[index + 1 : -1]
-    elif short_regex.match(raw_sorting_descriptor) is not None:
+    elif _SORTING_SHORT_REGEX.match(raw_sorting_descriptor) is not None:
         field = raw_sorting_descriptor
         sort_functor = "desc"
     else:
@@ -520,7 +1130,7 @@ def _sorting_parse_sorter(raw_sorting_descriptor: str, model_inspection) -> Sort
         )
 
     # check against meta data
-    sortable_attributes = _get_instance_sorting_attribute_names(model_inspection)
+    sortable_attributes = _get_sorting_index(model_inspection).attribute_names
     field = field.lower()
     if field not in sortable_attributes:
         raise InvalidParamValueError(
@@ -540,24 +1150,43 @@ def _sorting_parse_sorter(raw_sorting_descriptor: str, model_inspection) -> Sort
     return field, sort_functor
 
 
+@functools.lru_cache(maxsize=1024)
+def _sorting_parse_descriptors_cached(raw_sorting_descriptors: str, model_inspection) -> tuple[Sorter, ...]:
+    raw_sorting_descriptors = unquote(raw_sorting_descriptors)  # dirty hack for invalid arg transfer
+    raw_sorting_descriptors = raw_sorting_descriptors.lower()
+
+    # parse data
+    sorting_descriptors_list = raw_sorting_descriptors.split(",")
+    sorting_descriptors_list = [sd for sd in sorting_descriptors_list if len(sd) > 0]
+    return tuple(_sorting_parse_sorter(sd, model_inspection) for sd in sorting_descriptors_list)
+
+
 def _sorting_parse_descriptors(raw_sorting_descriptors: str | None, model_inspection) -> list[Sorter]:
-    """Parse list of sorting descriptors"""
+    """Parse list of sorting descriptors, results are cached per raw descriptors string and model"""
     # early return and check params
     if raw_sorting_descriptors is None:
         return []
     if not isinstance(raw_sorting_descriptors, str):
         logger.warning(f"Invalid sorting descriptors type received: {raw_sorting_descriptors}")
         raise InvalidParamTypeError("Invalid sorting descriptors type")
-    raw_sorting_descriptors = unquote(raw_sorting_descriptors)  # dirty hack for invalid arg transfer
-    raw_sorting_descriptors = raw_sorting_descriptors.lower()
+    return list(_sorting_parse_descriptors_cached(raw_sorting_descriptors, model_inspection))
 
-    # parse data
-    sorting_descriptors_list = raw_sorting_descriptors.split(",")
-    sorting_descriptors_list = [sd for sd in sorting_descriptors_list if len(sd) > 0]
-    result = []
-    for sd in sorting_descriptors_list:
-        result.append(_sorting_parse_sorter(sd, model_inspection))
-    return result
+
+def _sorting_check_indexed(sorters: list[Sorter], model_inspection, mode: str):
+    """Check sorters to be served by database index"""
+    if mode not in _SORTING_INDEX_AWARE_MODES:
+        raise ImproperlyConfiguredError(f"Unknown sorting index aware mode: {mode}")
+
+    indexed_names = _get_sorting_index(model_inspection).indexed_names
+    for field, _ in sorters:
+        if field in indexed_names:
+            continue
+        if mode == "strict":
+            raise InvalidParamValueError(
+                f"Invalid sorting_field value {field}. Sorting allowed only by indexed fields",
+                error_details={"key_path": "sorting", "field": field, "allowed": sorted(indexed_names)},
+            )
+        logger.warning(f"sorting by not indexed field: {model_inspection.class_.__name__}.{field}")
 
 
 def _sorting_apply_sorters(
@@ -565,8 +1194,10 @@ def _sorting_apply_sorters(
     query: Query,
     model_class: DeclarativeMeta,
     check_duplicate: bool = True,
+    applied_sort_fields: list[str] | None = None,
 ) -> Query:
-    applied_sort_fields: list[str] = list()
+    if applied_sort_fields is None:
+        applied_sort_fields = []
     for _sorting_field, _sorting_functor in sorters:
         if _sorting_field in applied_sort_fields and check_duplicate:
             logger.debug(f"skip duplicate sorting field: {_sorting_field}")
@@ -597,6 +1228,10 @@ def response_sorted(
         to query. By default final step of sorting - is to sort via primary key of model class.
     :param start_sorting: Initial sorting step - if provided in kwargs it would be parsed as descriptor and applied
         to query before all other descriptors.
+    :param index_aware: Check client sorting fields to be leading columns of database indexes, by default
+        `LAMB_SORTING_INDEX_AWARE`: `warn` - log warning, `strict` - raise `InvalidParamValueError`, None - disabled
+    :param relevance: Expression to sort by descending after start sorting if client sorting not provided, default
+        sorting is applied after it (e.g. `PostgresqlFastTextSearchFilter.rank_expression(params)`)
     """
     # check params
     if not isinstance(params, dict):
@@ -618,11 +1253,15 @@ def response_sorted(
     all_sorters.extend(start_sorters)
 
     # discover and apply client sorters
+    raw_client_sorting = dpath_value(params, get_lamb_settings().sorting_key, str, default=None)
     client_sorters = _sorting_parse_descriptors(
-        raw_sorting_descriptors=dpath_value(params, settings.LAMB_SORTING_KEY, str, default=default_sorting),
+        raw_sorting_descriptors=raw_client_sorting if raw_client_sorting is not None else default_sorting,
         model_inspection=model_inspection,
     )
     logger.debug(f"sorters parsed client_sorters: {client_sorters}")
+    index_aware = kwargs.get("index_aware", get_lamb_settings().sorting_index_aware)
+    if index_aware is not None and raw_client_sorting is not None:
+        _sorting_check_indexed(client_sorters, model_inspection, index_aware)
     all_sorters.extend(client_sorters)
 
     # discover and apply final sorters
@@ -647,24 +1286,40 @@ def response_sorted(
 
     # apply sorters
     all_sorters.extend(final_sorters)
-    query = _sorting_apply_sorters(sorters=all_sorters, query=query, model_class=model_class, check_duplicate=True)
+    relevance = kwargs.get("relevance")
+    if relevance is not None and raw_client_sorting is None:
+        applied_sort_fields = []
+        query = _sorting_apply_sorters(
+            sorters=start_sorters, query=query, model_class=model_class, applied_sort_fields=applied_sort_fields
+        )
+        query = query.order_by(relevance.desc())
+        query = _sorting_apply_sorters(
+            sorters=all_sorters[len(start_sorters) :],
+            query=query,
+            model_class=model_class,
+            applied_sort_fields=applied_sort_fields,
+        )
+    else:
+        query = _sorting_apply_sorters(sorters=all_sorters, query=query, model_class=model_class, check_duplicate=True)
 
     return query
 
 
 def response_filtered(
     query: SV,
-    filters: list[object],
+    filters: list[object] | object,
     request: LambRequest = None,
     params: dict = None,
 ) -> SV:
+    """Apply filters to sqlalchemy query instance
+
+    Filters could be provided as list or as precompiled `lamb.utils.filters.FilterSet` - list would be compiled on
+    each call, so for endpoints with many filters it is better to construct `FilterSet` once on module level.
+    """
     # TODO: fix typing for filters
     # TODO: auto discover request params if not provided
-    # import lamb.utils.filters
-    # from lamb.utils.filters import Filter
-    # filters: List[Filter] = filters
     # check params override
-    from lamb.utils.filters import Filter
+    from lamb.utils.filters import FilterSet
 
     if request is not None and params is None:
         params = request.GET
@@ -673,22 +1328,71 @@ def response_filtered(
         logger.warning(f"Invalid query data type: {query}")
         raise ServerError("Improperly configured query item for filtering")
 
-    for f in filters:
-        if not isinstance(f, Filter):
-            logger.warning(f"Invalid filters item data type: {f}")
-            raise ServerError("Improperly configured filters for filtering")
+    if not isinstance(filters, FilterSet):
+        filters = FilterSet(filters)
 
     # apply filters
-    for f in filters:
-        query = f.apply_to_query(query=query, params=params)
+    return filters.apply_to_query(query=query, params=params)
 
-    return query
+
+def response_projected(
+    query: SV,
+    model_class: DeclarativeMeta,
+    params: dict | None = None,
+    request: LambRequest | None = None,
+) -> SV:
+    """Apply fields selection to sqlalchemy query instance and response encoding
+
+    Comma separated attribute names under `LAMB_RESPONSE_FIELDS_KEY` are validated against response attributes of
+    model class. Selection attached to request and respected by `ResponseEncodableMixin.response_encode`. If all
+    selected attributes are columns (or synonyms of columns) query would load only them and primary key.
+
+    :param query: SQLAlchemy query instance
+    :param model_class: Model class for response attributes introspection
+    :param params: Dictionary that contains params of fields selection
+    :param request: Http request to attach selection for encoding
+    """
+    from lamb.json.mixins import parse_response_fields
+
+    if request is not None and params is None:
+        params = request.GET
+
+    if not isinstance(query, Query | Select):
+        logger.warning(f"Invalid query data type: {query}")
+        raise ServerError("Improperly configured query item for projection")
+
+    fields = parse_response_fields(
+        model_class, dpath_value(params, get_lamb_settings().response_fields_key, str, default=None)
+    )
+    if fields is None:
+        return query
+
+    # attach to request for encoding
+    if request is not None:
+        if getattr(request, "lamb_response_fields", None) is None:
+            request.lamb_response_fields = {}
+        request.lamb_response_fields[model_class] = fields
+
+    # projection pushdown - only for plain columns cause of unknown dependencies of other attributes
+    mapper = inspect(model_class)
+    load_attributes = []
+    for field in fields:
+        if field in mapper.synonyms:
+            field = mapper.synonyms[field].name
+        if field not in mapper.column_attrs:
+            logger.debug(f"projection pushdown skipped for non column attribute: {model_class.__name__}.{field}")
+            return query
+        load_attributes.append(getattr(model_class, field))
+
+    return query.options(load_only(*load_attributes))
 
 
 # content/response encoding
 CONTENT_ENCODING_JSON = "application/json"
 CONTENT_ENCODING_XML = "application/xml"
 CONTENT_ENCODING_MULTIPART = "multipart/form-data"
+CONTENT_ENCODING_MSGPACK = "application/msgpack"
+CONTENT_ENCODING_CBOR = "application/cbor"
 
 
 def _get_encoding_for_header(request: HttpRequest, header: str) -> str:
@@ -713,6 +1417,10 @@ def _get_encoding_for_header(request: HttpRequest, header: str) -> str:
         "application/xml": CONTENT_ENCODING_XML,
         "text/xml": CONTENT_ENCODING_XML,
         "multipart/form-data": CONTENT_ENCODING_MULTIPART,
+        "application/msgpack": CONTENT_ENCODING_MSGPACK,
+        "application/x-msgpack": CONTENT_ENCODING_MSGPACK,
+        "application/vnd.msgpack": CONTENT_ENCODING_MSGPACK,
+        "application/cbor": CONTENT_ENCODING_CBOR,
     }
     result = header_value
     for key, value in prefix_mapping.items():
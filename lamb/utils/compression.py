@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import logging
+import zlib
+from collections.abc import AsyncIterator, Callable, Iterator
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import patch_vary_headers
+
+from lamb.conf import get_lamb_settings, on_lamb_settings_refresh
+from lamb.exc import ImproperlyConfiguredError
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+__all__ = ["CompressionCodec", "compress_response", "get_compression_codecs", "negotiate_compression"]
+
+logger = logging.getLogger(__name__)
+
+
+class CompressionCodec:
+    """Abstract content coding
+
+    Provides one-shot compression for plain responses and incremental compressor for streaming responses.
+    Incremental compressor flushes data on each chunk to make it available for client immediately.
+    """
+
+    name: str
+    default_level: int
+
+    def compress(self, data: bytes, level: int) -> bytes:
+        raise NotImplementedError
+
+    def compressor(self, level: int) -> Callable[[bytes | None], bytes]:
+        """Incremental compressor: call with chunk to compress or with None to finish stream"""
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.name}>"
+
+
+class GzipCodec(CompressionCodec):
+    name = "gzip"
+    default_level = 6
+
+    def compress(self, data: bytes, level: int) -> bytes:
+        _compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return _compressor.compress(data) + _compressor.flush()
+
+    def compressor(self, level: int) -> Callable[[bytes | None], bytes]:
+        _compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+        def _process(chunk: bytes | None) -> bytes:
+            if chunk is None:
+                return _compressor.flush()
+            return _compressor.compress(chunk) + _compressor.flush(zlib.Z_SYNC_FLUSH)
+
+        return _process
+
+
+class BrotliCodec(CompressionCodec):
+    name = "br"
+    default_level = 4
+
+    def compress(self, data: bytes, level: int) -> bytes:
+        return brotli.compress(data, quality=level)
+
+    def compressor(self, level: int) -> Callable[[bytes | None], bytes]:
+        _compressor = brotli.Compressor(quality=level)
+
+        def _process(chunk: bytes | None) -> bytes:
+            if chunk is None:
+                return _compressor.finish()
+            return _compressor.process(chunk) + _compressor.flush()
+
+        return _process
+
+
+class ZstdCodec(CompressionCodec):
+    name = "zstd"
+    default_level = 3
+
+    def compress(self, data: bytes, level: int) -> bytes:
+        return zstandard.ZstdCompressor(level=level).compress(data)
+
+    def compressor(self, level: int) -> Callable[[bytes | None], bytes]:
+        _compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+        def _process(chunk: bytes | None) -> bytes:
+            if chunk is None:
+                return _compressor.flush()
+            return _compressor.compress(chunk) + _compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+        return _process
+
+
+_CODECS: dict[str, tuple[type[CompressionCodec], object | None]] = {
+    "zstd": (ZstdCodec, zstandard),
+    "br": (BrotliCodec, brotli),
+    "gzip": (GzipCodec, zlib),
+}
+
+_COMPRESSIBLE_CONTENT_TYPES = ("application/json", "application/xml", "application/javascript", "text/")
+
+_codecs_cache: list[CompressionCodec] | None = None
+
+
+def get_compression_codecs() -> list[CompressionCodec]:
+    """Codecs enabled by LAMB_RESPONSE_COMPRESSION in server preference order, unavailable ones are skipped"""
+    global _codecs_cache
+
+    if _codecs_cache is None:
+        result = []
+        for name in settings.LAMB_RESPONSE_COMPRESSION or []:
+            name = name.lower()
+            if name not in _CODECS:
+                raise ImproperlyConfiguredError(f"Unknown LAMB_RESPONSE_COMPRESSION codec: {name}")
+            codec_class, module = _CODECS[name]
+            if module is None:
+                logger.warning(f"LAMB_RESPONSE_COMPRESSION: codec {name} skipped - module not installed")
+                continue
+            result.append(codec_class())
+        logger.debug(f"LAMB_RESPONSE_COMPRESSION: codecs would be used -> {result}")
+        _codecs_cache = result
+
+    return _codecs_cache
+
+
+@on_lamb_settings_refresh
+def _reset_codecs():
+    global _codecs_cache
+
+    _codecs_cache = None
+
+
+def _get_level(codec: CompressionCodec) -> int:
+    return get_lamb_settings().response_compression_levels.get(codec.name, codec.default_level)
+
+
+def negotiate_compression(request: HttpRequest) -> CompressionCodec | None:
+    """Choose codec for request according to Accept-Encoding header q-values and server preference order"""
+    codecs = get_compression_codecs()
+    if not codecs:
+        return None
+
+    header = request.META.get("HTTP_ACCEPT_ENCODING", "")
+    if not header:
+        return None
+
+    # parse q-values
+    accepted: dict[str, float] = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name] = q
+
+    # choose codec: highest q-value, ties resolved by server order
+    result, result_q = None, 0.0
+    wildcard_q = accepted.get("*", 0.0)
+    for codec in codecs:
+        q = accepted.get(codec.name, wildcard_q)
+        if q > result_q:
+            result, result_q = codec, q
+    return result
+
+
+def _compress_sequence(codec: CompressionCodec, level: int, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    _process = codec.compressor(level)
+    for chunk in chunks:
+        if chunk:
+            yield _process(chunk)
+    yield _process(None)
+
+
+async def _acompress_sequence(
+    codec: CompressionCodec, level: int, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    _process = codec.compressor(level)
+    async for chunk in chunks:
+        if chunk:
+            yield _process(chunk)
+    yield _process(None)
+
+
+def compress_response(request: HttpRequest, response: HttpResponseBase) -> HttpResponseBase:
+    """Compress response body according to LAMB_RESPONSE_COMPRESSION settings and request Accept-Encoding
+
+    - plain responses compressed only if longer than LAMB_RESPONSE_COMPRESSION_MIN_SIZE and result is shorter
+    - streaming responses compressed chunk by chunk
+    - only textual content types compressed
+    """
+    # early return
+    if not get_compression_codecs():
+        return response
+    if response.has_header("Content-Encoding"):
+        return response
+    if not response.get("Content-Type", "").startswith(_COMPRESSIBLE_CONTENT_TYPES):
+        return response
+    if not response.streaming and len(response.content) < get_lamb_settings().response_compression_min_size:
+        return response
+
+    patch_vary_headers(response, ("Accept-Encoding",))
+
+    codec = negotiate_compression(request)
+    if codec is None:
+        return response
+    level = _get_level(codec)
+
+    if response.streaming:
+        if response.is_async:
+            response.streaming_content = _acompress_sequence(codec, level, response.streaming_content)
+        else:
+            response.streaming_content = _compress_sequence(codec, level, response.streaming_content)
+        del response.headers["Content-Length"]
+    else:
+        compressed_content = codec.compress(response.content, level)
+        if len(compressed_content) >= len(response.content):
+            return response
+        response.content = compressed_content
+        response.headers["Content-Length"] = str(len(compressed_content))
+
+    # strong ETag is not valid for transformed representation
+    etag = response.get("ETag")
+    if etag and etag.startswith('"'):
+        response.headers["ETag"] = "W/" + etag
+    response.headers["Content-Encoding"] = codec.name
+    logger.debug(f"response compressed: {codec.name}, level={level}")
+
+    return response
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 import contextlib
-import copy
+import dataclasses
+import functools
 import logging
 import os
-from collections.abc import Callable, Mapping
-from functools import reduce
-from operator import getitem
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import Any, Union
 
 # import dpath.util
@@ -22,7 +21,7 @@ from lamb.ext.lxml import __lxml_hints_reverse_map__
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["dpath_value", "adapt_dict_impl"]
+__all__ = ["dpath_value", "adapt_dict_impl", "ParamField", "ParamsExtractor"]
 
 
 DictObject = dict | EtreeElement | Etree | Mapping | Settings
@@ -58,41 +57,15 @@ def dpath_value(
 
     """
 
-    # utils
-    def _type_convert(_result):
-        if type(_result) is req_type:
-            return _result
-        try:
-            _result = req_type(_result)
-            return _result
-        except (ValueError, TypeError) as _e:
-            raise exc.InvalidParamTypeError(
-                f"Invalid data type for param '{key_path}'", error_details={"key_path": key_path}
-            ) from _e
-
     # prepare key_path
     if not isinstance(key_path, str | list | tuple):
         raise exc.ServerError
 
-    _key_path = copy.copy(key_path)
-
     # query
     try:
         # custom dispatch
         try:
-            if isinstance(dict_object, os._Environ):
-                result = _impl_environ(dict_object, key_path=_key_path, **kwargs)
-            elif isinstance(dict_object, dict):
-                result = _impl_dict(dict_object, key_path=_key_path, **kwargs)
-            elif isinstance(dict_object, Settings):
-                result = _impl_django_conf(dict_object, key_path=_key_path, **kwargs)
-            elif isinstance(dict_object, QueryDict):
-                result = _impl_query_dict(dict_object, key_path=_key_path, **kwargs)
-            elif isinstance(dict_object, Etree | EtreeElement):
-                result = _impl_etree(dict_object, key_path=_key_path, **kwargs)
-            else:
-                # last mile - attempt as dict
-                result = _impl_dict(dict_object, key_path=_key_path, **kwargs)
+            result = _get_impl(dict_object)(dict_object, key_path=key_path, **kwargs)
         except IndexError as e:
             raise exc.InvalidBodyStructureError(f"Could not locate key: {key_path}") from e
 
@@ -106,8 +79,13 @@ def dpath_value(
                 )
 
         # apply type convert
-        if req_type is not None:
-            result = _type_convert(result)
+        if req_type is not None and type(result) is not req_type:
+            try:
+                result = req_type(result)
+            except (ValueError, TypeError) as _e:
+                raise exc.InvalidParamTypeError(
+                    f"Invalid data type for param '{key_path}'", error_details={"key_path": key_path}
+                ) from _e
 
         # apply transform
         if transform is not None:
@@ -123,19 +101,240 @@ def dpath_value(
             raise exc.ServerError("Failed to parse params due unknown error") from e
 
 
+# bulk extraction
+_NO_DEFAULT = object()
+
+
+@dataclasses.dataclass(frozen=True)
+class ParamField:
+    """Extraction schema item, arguments have the same meaning as for `dpath_value`
+
+    `default_factory` could be used instead of `default` for values that should be created per extraction.
+    """
+
+    name: str
+    key_path: KeyPath
+    req_type: Callable | None = None
+    transform: Callable | None = None
+    default: Any = _NO_DEFAULT
+    allow_none: bool = False
+    default_factory: Callable[[], Any] | None = None
+
+    @property
+    def has_default(self) -> bool:
+        return self.default is not _NO_DEFAULT or self.default_factory is not None
+
+    def get_default(self) -> Any:
+        if self.default_factory is not None:
+            return self.default_factory()
+        return self.default
+
+
+def _plain_key(key_path: KeyPath) -> str | None:
+    """Key that could be looked up in dict directly with the same result for any dict engine"""
+    if not isinstance(key_path, str) or len(key_path) == 0 or "/" in key_path:
+        return None
+    if any(c in key_path for c in _GLOB_CHARS):
+        return None
+    with contextlib.suppress(ValueError):
+        int(key_path)
+        return None
+    return key_path
+
+
+class ParamsExtractor:
+    """Compiled extraction schema
+
+    Extracts all fields from container (`dict`, `QueryDict`, `request.META` or any container supported by
+    `dpath_value`) in one pass and returns instance of dataclass with fields named as schema items. Plain keys are
+    looked up directly in dict containers, other key paths and containers go through `dpath_value`. Errors and
+    defaults processing is the same as for separate `dpath_value` calls.
+
+    Usage::
+
+        pagination_extractor = ParamsExtractor(
+            [
+                ("offset", "offset", int, None, 0),
+                ("limit", "limit", int, None, 100),
+                ParamField("total_omit", "total_omit", str, transform=transform_boolean, default=False),
+            ],
+            name="PaginationParams",
+        )
+
+        params = pagination_extractor(request.GET)
+        params.offset, params.limit
+
+    """
+
+    fields: tuple[ParamField, ...]
+    result_class: type
+
+    def __init__(self, fields: Iterable[ParamField | tuple], name: str = "Params"):
+        self.fields = tuple(f if isinstance(f, ParamField) else ParamField(*f) for f in fields)
+        self.result_class = dataclasses.make_dataclass(
+            name,
+            [(f.name, f.req_type if isinstance(f.req_type, type) else Any) for f in self.fields],
+            frozen=True,
+        )
+        self._plan = tuple((f, _plain_key(f.key_path)) for f in self.fields)
+
+    def _extract_field(self, container: Any, field: ParamField) -> Any:
+        kwargs = {"default": field.get_default()} if field.has_default else {}
+        return dpath_value(
+            container, field.key_path, field.req_type, allow_none=field.allow_none, transform=field.transform, **kwargs
+        )
+
+    def __call__(self, container: Any) -> Any:
+        values = {}
+        direct = isinstance(container, dict)
+        for field, key in self._plan:
+            if not direct or key is None:
+                values[field.name] = self._extract_field(container, field)
+                continue
+
+            try:
+                result = container.get(key, _MISSING)
+                if result is _MISSING:
+                    raise exc.InvalidBodyStructureError(f"Could not locate key: {key}")
+                if result is None:
+                    if field.allow_none:
+                        values[field.name] = None
+                        continue
+                    raise exc.InvalidParamTypeError(
+                        f"Invalid data type for param: {key}", error_details={"key_path": key}
+                    )
+                if field.req_type is not None and type(result) is not field.req_type:
+                    try:
+                        result = field.req_type(result)
+                    except (ValueError, TypeError) as _e:
+                        raise exc.InvalidParamTypeError(
+                            f"Invalid data type for param '{key}'", error_details={"key_path": key}
+                        ) from _e
+                if field.transform is not None:
+                    result = field.transform(result)
+                values[field.name] = result
+            except Exception as e:
+                if field.has_default:
+                    values[field.name] = field.get_default()
+                elif isinstance(e, exc.ApiError):
+                    raise
+                else:
+                    raise exc.ServerError("Failed to parse params due unknown error") from e
+
+        return self.result_class(**values)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.result_class.__name__} {[f.name for f in self.fields]}>"
+
+
 # dict engine utils
-def _impl_dict_dpath(dict_object: dict[Any, Any], key_path: KeyPath, **_) -> Any:
+_MISSING = object()
+_LEAF_TYPES = (bytes, str, int, float, bool, type(None))
+_GLOB_CHARS = ("*", "?", "[")
+
+
+class _AccessorFallback(Exception):
+    """Container is not supported by compiled accessor"""
+
+
+def _dpath_values(dict_object: dict[Any, Any], key_path: KeyPath) -> Any:
     items: list[Any] = dpath.values(dict_object, key_path)
     result = items[0]
     return result
 
 
+def _accessor_cache_key(key_path: KeyPath) -> str | tuple:
+    if isinstance(key_path, str):
+        return key_path
+    return tuple(key_path)
+
+
+def _dpath_step(segment: Any) -> tuple[Any, Any, int | None] | None:
+    """Lookup variants of path segment with dpath matching semantic: (mapping key, alternative key, sequence index)
+
+    dpath compares integer keys and indices with integer value of segment, so `"1"` matches both `"1"` and `1`.
+    Returns None for segments that require glob matching.
+    """
+    if isinstance(segment, bool):
+        return None
+    if isinstance(segment, int):
+        return segment, None, segment
+    if not isinstance(segment, str) or len(segment) == 0 or any(c in segment for c in _GLOB_CHARS):
+        return None
+    try:
+        index = int(segment)
+    except ValueError:
+        index = None
+    return segment, index, index
+
+
+def _dpath_walk(obj: Any, steps: tuple[tuple[Any, Any, int | None], ...]) -> Any:
+    for key, alt_key, index in steps:
+        if isinstance(obj, _LEAF_TYPES):
+            raise IndexError("Path not exist")
+        if isinstance(obj, Mapping):
+            value = obj.get(key, _MISSING)
+            if value is _MISSING and alt_key is not None:
+                with contextlib.suppress(TypeError):
+                    value = obj.get(alt_key, _MISSING)
+            if value is _MISSING:
+                raise IndexError("Path not exist")
+            obj = value
+        elif isinstance(obj, Sequence):
+            if index is None or not -len(obj) <= index < len(obj):
+                raise IndexError("Path not exist")
+            obj = obj[index]
+        else:
+            raise _AccessorFallback
+    return obj
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_dpath_accessor(key_path: str | tuple) -> Callable[[Any], Any]:
+    """Getter specialized for key_path with dpath semantic, dpath itself used only for glob paths"""
+    segments = key_path.lstrip("/").split("/") if isinstance(key_path, str) else key_path
+    steps = tuple(_dpath_step(segment) for segment in segments)
+    if len(steps) == 0 or any(step is None for step in steps):
+        logger.debug(f"dpath_value: glob accessor compiled for {key_path}")
+        return functools.partial(_dpath_values, key_path=key_path)
+
+    def _accessor(obj):
+        try:
+            return _dpath_walk(obj, steps)
+        except _AccessorFallback:
+            return _dpath_values(obj, key_path)
+
+    if len(steps) == 1 and isinstance(steps[0][0], str):
+        key = steps[0][0]
+
+        def _accessor_plain(obj):
+            if type(obj) is dict:
+                value = obj.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+            return _accessor(obj)
+
+        return _accessor_plain
+
+    return _accessor
+
+
+def _impl_dict_dpath(dict_object: dict[Any, Any], key_path: KeyPath, **_) -> Any:
+    try:
+        accessor = _compile_dpath_accessor(_accessor_cache_key(key_path))
+    except TypeError:  # unhashable key_path components
+        return _dpath_values(dict_object, key_path)
+    return accessor(dict_object)
+
+
 def _impl_dict_reduce(dict_object: dict[Any, Any], key_path: KeyPath, **_) -> Any:
     # TODO: candidate to remove - traverse speed same
     try:
         if isinstance(key_path, str):
-            key_path = [key_path]
-        return reduce(getitem, key_path, dict_object)
+            return dict_object[key_path]
+        for key in key_path:
+            dict_object = dict_object[key]
+        return dict_object
     except Exception as e:
         raise IndexError("Path not exist") from e
 
@@ -151,6 +350,7 @@ def adapt_dict_impl():
     engine_value = dpath_value(settings, "LAMB_DPATH_DICT_ENGINE", str, default=None)
 
     global _impl_dict
+    _impl_dispatch_cache.clear()
     logger.debug(f"dpath_value settings value is: {engine_value}")
     if engine_value is None or engine_value == "dpath":
         _impl_dict = _impl_dict_dpath
@@ -162,6 +362,37 @@ def adapt_dict_impl():
         raise exc.ImproperlyConfiguredError(f"Unknown dict dpath implementation: {settings.LAMB_DPATH_DICT_ENGINE}")
 
 
+# container dispatch
+_impl_dispatch_cache: dict[type, Callable] = {}
+
+
+def _get_impl(dict_object: Any) -> Callable:
+    """Implementation for container, resolved once per container type"""
+    object_type = type(dict_object)
+    impl = _impl_dispatch_cache.get(object_type)
+    if impl is not None:
+        return impl
+
+    if isinstance(dict_object, os._Environ):
+        impl = _impl_environ
+    elif isinstance(dict_object, dict):
+        impl = _impl_dict
+    elif isinstance(dict_object, Settings):
+        impl = _impl_django_conf
+    elif isinstance(dict_object, QueryDict):
+        impl = _impl_query_dict
+    elif isinstance(dict_object, Etree | EtreeElement):
+        impl = _impl_etree
+    else:
+        # last mile - attempt as dict
+        impl = _impl_dict
+
+    # proxies (LazySettings etc.) could wrap different containers - cache only plain types
+    if object_type is dict_object.__class__:
+        _impl_dispatch_cache[object_type] = impl
+    return impl
+
+
 # other sources
 def _impl_etree(element: EtreeElement | Etree, key_path: str, namespaces: dict | None = None, **_) -> Any:
     """Etree/EtreeElement implementation
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
 import contextlib
+import json
 import logging
+import math
 from collections.abc import Callable
 from datetime import date, datetime
 from functools import partial
-from typing import Any, TypeVar
+from typing import Any, ClassVar, TypeVar
 
 import sqlalchemy as sa
 from django.conf import settings
 from django.http import QueryDict
 from sqlalchemy import Float, func
-from sqlalchemy.dialects.postgresql import DOMAIN
+from sqlalchemy.dialects.postgresql import ARRAY, DOMAIN, JSONB, TSVECTOR
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm.attributes import QueryableAttribute
 from sqlalchemy.orm.query import Query
 from sqlalchemy.sql.functions import Function
+from sqlalchemy.sql.visitors import InternalTraversal
 
 from lamb.exc import (
     ApiError,
@@ -33,7 +37,9 @@ from lamb.utils.transformers import (
 )
 
 __all__ = [
+    "ArrayIn",
     "Filter",
+    "FilterSet",
     "FieldValueFilter",
     "ColumnValueFilter",
     "DateFilter",
@@ -49,6 +55,63 @@ logger = logging.getLogger(__name__)
 # abstract
 T = TypeVar("T")
 
+# compare -> param key path suffix
+_COMPARE_SUFFIXES = {
+    "__eq__": "",
+    "__ne__": ".exclude",
+    "__gt__": ".greater",
+    "__ge__": ".min",
+    "__lt__": ".less",
+    "__le__": ".max",
+}
+_RANGE_COMPARES = ("__lt__", "__le__", "__ge__", "__gt__")
+
+
+def _extract_param_raw(params: dict, key_path: str) -> str | None:
+    """Raw comma separated value of param, multiple QueryDict values are joined"""
+    if isinstance(params, QueryDict):
+        result = params.getlist(key_path, default=None)
+        if len(result) > 0:
+            return ",".join([str(r) for r in result])
+        return None
+    return dpath_value(params, key_path, str, default=None)
+
+
+class ArrayIn(sa.ColumnElement):
+    """Membership criteria bound as single array param
+
+    Compiled as `column = ANY(:values)` (or `column != ALL(:values)` if negated) on PostgreSQL and as regular
+    `IN (...)` on other dialects. Unlike expanding `IN` SQL does not depend on values count, so statement stays
+    the same for SQLAlchemy compiled cache and server side prepared statements.
+    """
+
+    inherit_cache = True
+    type = sa.Boolean()
+
+    _traverse_internals: ClassVar[list[tuple[str, InternalTraversal]]] = [
+        ("in_clause", InternalTraversal.dp_clauseelement),
+        ("array_clause", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, column: QueryableAttribute | sa.ColumnElement, values: list, negate: bool = False):
+        array_param = sa.bindparam(None, value=list(values), type_=ARRAY(column.type))
+        if negate:
+            self.in_clause = ~column.in_(values)
+            self.array_clause = column != sa.all_(array_param)
+        else:
+            self.in_clause = column.in_(values)
+            self.array_clause = column == sa.any_(array_param)
+
+
+@compiles(ArrayIn)
+def _compile_array_in(element: ArrayIn, compiler, **kwargs):
+    return compiler.process(element.in_clause, **kwargs)
+
+
+@compiles(ArrayIn, "postgresql")
+def _compile_array_in_postgresql(element: ArrayIn, compiler, **kwargs):
+    return compiler.process(element.array_clause, **kwargs)
+
 
 # TODO: migrate to dataclasses
 class Filter:
@@ -57,6 +120,7 @@ class Filter:
     arg_name: str
     req_type: type
     req_type_transformer: Callable | None
+    key_paths: tuple[str, ...]
 
     def __init__(self, arg_name: str, req_type: type, req_type_transformer: Callable = None):
         # check params
@@ -74,6 +138,7 @@ class Filter:
         self.arg_name = arg_name
         self.req_type = req_type
         self.req_type_transformer = req_type_transformer
+        self.key_paths = (arg_name,)
 
     def get_param_value(self, params: dict, key_path: str = None) -> list[object] | None:
         """Extracts and convert param value from dictionary"""
@@ -81,21 +146,15 @@ class Filter:
         if key_path is None:
             key_path = self.arg_name
 
-        # extract value
-        if isinstance(params, QueryDict):
-            result = params.getlist(key_path, default=None)
-            if len(result) > 0:
-                result = [str(r) for r in result]
-                result = ",".join(result)
-            else:
-                result = None
-        else:
-            result = dpath_value(params, key_path, str, default=None)
-        if result is None:
+        return self.parse_param_value(_extract_param_raw(params, key_path), key_path)
+
+    def parse_param_value(self, raw_value: str | None, key_path: str) -> list[object] | None:
+        """Convert raw comma separated param value"""
+        if raw_value is None:
             return None
 
         # split values
-        result = result.split(",")
+        result = raw_value.split(",")
 
         # remove duplicates
         result = list(set(result))
@@ -122,6 +181,10 @@ class Filter:
         # return result
         return result
 
+    def parse_params(self, params: dict) -> dict[str, list[object] | None]:
+        """Converted values of all filter key paths"""
+        return {key_path: self.get_param_value(params, key_path=key_path) for key_path in self.key_paths}
+
     def vary_param_value_equal(self, value: T) -> T:
         return value
 
@@ -134,8 +197,15 @@ class Filter:
     def vary_param_value_min(self, value: T) -> T:
         return value
 
+    def get_clauses(self, values: dict[str, list[object] | None]) -> list[sa.ColumnElement]:
+        """Filter criteria for converted values of key paths, should be empty if all values are None"""
+        return []
+
     def apply_to_query(self, query: Query, params: dict = None, **kwargs) -> Query:
         """Apply filter to query"""
+        clauses = self.get_clauses(self.parse_params(params))
+        if clauses:
+            query = query.filter(*clauses)
         return query
 
 
@@ -144,6 +214,8 @@ class FieldValueFilter(Filter):
 
     comparing_field: QueryableAttribute
     allowed_compares: list[str]
+    array_in: bool
+    _compare_key_paths: dict[str, str]
 
     def __init__(
         self,
@@ -152,6 +224,7 @@ class FieldValueFilter(Filter):
         comparing_field: QueryableAttribute,
         req_type_transformer: Callable = None,
         allowed_compares: list[str] | None = None,
+        array_in: bool | None = None,
     ):
         allowed_compares = allowed_compares or ["__eq__", "__ne__", "__ge__", "__le__"]
         super().__init__(arg_name, req_type, req_type_transformer)
@@ -171,84 +244,81 @@ class FieldValueFilter(Filter):
         # store attributes
         self.comparing_field = comparing_field
         self.allowed_compares = allowed_compares
+        self.array_in = array_in if array_in is not None else settings.LAMB_FILTERS_ARRAY_IN
+        self._compare_key_paths = {c: arg_name + _COMPARE_SUFFIXES[c] for c in allowed_compares}
+        self.key_paths = tuple(self._compare_key_paths.values())
+
+    def _in(self, values: list, negate: bool = False) -> sa.ColumnElement:
+        if self.array_in:
+            return ArrayIn(self.comparing_field, values, negate=negate)
+        if negate:
+            return ~self.comparing_field.in_(values)
+        return self.comparing_field.in_(values)
+
+    def get_clauses(self, values: dict[str, list[object] | None]) -> list[sa.ColumnElement]:
+        result = []
 
-    # def apply_to_query(self, query: Query, request: LambRequest = None, params: Dict = None) -> Query:
-    def apply_to_query(self, query: Query, params, **kwargs) -> Query:
         # check for equality
-        if "__eq__" in self.allowed_compares:
-            param_value = self.get_param_value(params, key_path=self.arg_name)
-            if param_value is not None:
-                if len(param_value) > 1:
-                    try:  # check for null value in values
-                        param_value.remove(None)
-                    except ValueError:
-                        query = query.filter(self.comparing_field.in_(param_value))
-                    else:
-                        # IN (...) OR IS NULL
-                        query = query.filter(
-                            sa.or_(self.comparing_field.in_(param_value), self.comparing_field.__eq__(None))
-                        )
+        param_value = values.get(self._compare_key_paths.get("__eq__"))
+        if param_value is not None:
+            if len(param_value) > 1:
+                try:  # check for null value in values
+                    param_value.remove(None)
+                except ValueError:
+                    result.append(self._in(param_value))
                 else:
-                    query = query.filter(self.comparing_field.__eq__(param_value[0]))
+                    # IN (...) OR IS NULL
+                    result.append(sa.or_(self._in(param_value), self.comparing_field.__eq__(None)))
+            else:
+                result.append(self.comparing_field.__eq__(param_value[0]))
 
         # check for non equality
-        if "__ne__" in self.allowed_compares:
-            param_value = self.get_param_value(params, key_path=self.arg_name + ".exclude")
-            if param_value is not None:
-                if len(param_value) > 1:
-                    try:  # check for null value in values
-                        param_value.remove(None)
-                    except ValueError:
-                        query = query.filter(~self.comparing_field.in_(param_value))
-                    else:
-                        # IN (...) AND IS NOT NULL
-                        query = query.filter(
-                            sa.and_(~self.comparing_field.in_(param_value), self.comparing_field.__ne__(None))
-                        )
+        param_value = values.get(self._compare_key_paths.get("__ne__"))
+        if param_value is not None:
+            if len(param_value) > 1:
+                try:  # check for null value in values
+                    param_value.remove(None)
+                except ValueError:
+                    result.append(self._in(param_value, negate=True))
                 else:
-                    query = query.filter(self.comparing_field.__ne__(param_value[0]))
+                    # IN (...) AND IS NOT NULL
+                    result.append(sa.and_(self._in(param_value, negate=True), self.comparing_field.__ne__(None)))
+            else:
+                result.append(self.comparing_field.__ne__(param_value[0]))
 
         # check for greater
-        if "__gt__" in self.allowed_compares:
-            param_value = self.get_param_value(params, key_path=self.arg_name + ".greater")
-            if param_value is not None:
-                if len(param_value) > 1:
-                    raise InvalidParamValueError(f"Invalid param '{self.arg_name}' type for greater compare")
-                param_value = param_value[0]
-                param_value = self.vary_param_value_min(value=param_value)
-                query = query.filter(self.comparing_field.__gt__(param_value))
+        param_value = values.get(self._compare_key_paths.get("__gt__"))
+        if param_value is not None:
+            if len(param_value) > 1:
+                raise InvalidParamValueError(f"Invalid param '{self.arg_name}' type for greater compare")
+            param_value = self.vary_param_value_min(value=param_value[0])
+            result.append(self.comparing_field.__gt__(param_value))
 
         # check for greater or equal
-        if "__ge__" in self.allowed_compares:
-            param_value = self.get_param_value(params, key_path=self.arg_name + ".min")
-            if param_value is not None:
-                if len(param_value) > 1:
-                    raise InvalidParamValueError(f"Invalid param '{self.arg_name}' type for greater/equal compare")
-                param_value = param_value[0]
-                param_value = self.vary_param_value_min(value=param_value)
-                query = query.filter(self.comparing_field.__ge__(param_value))
+        param_value = values.get(self._compare_key_paths.get("__ge__"))
+        if param_value is not None:
+            if len(param_value) > 1:
+                raise InvalidParamValueError(f"Invalid param '{self.arg_name}' type for greater/equal compare")
+            param_value = self.vary_param_value_min(value=param_value[0])
+            result.append(self.comparing_field.__ge__(param_value))
 
         # check for lower
-        if "__lt__" in self.allowed_compares:
-            param_value = self.get_param_value(params, key_path=self.arg_name + ".less")
-            if param_value is not None:
-                if len(param_value) > 1:
-                    raise InvalidParamValueError(f"Invalid param '{self.arg_name}' type for lower compare")
-                param_value = param_value[0]
-                param_value = self.vary_param_value_max(value=param_value)
-                query = query.filter(self.comparing_field.__lt__(param_value))
+        param_value = values.get(self._compare_key_paths.get("__lt__"))
+        if param_value is not None:
+            if len(param_value) > 1:
+                raise InvalidParamValueError(f"Invalid param '{self.arg_name}' type for lower compare")
+            param_value = self.vary_param_value_max(value=param_value[0])
+            result.append(self.comparing_field.__lt__(param_value))
 
         # check for lower or equal
-        if "__le__" in self.allowed_compares:
-            param_value = self.get_param_value(params, key_path=self.arg_name + ".max")
-            if param_value is not None:
-                if len(param_value) > 1:
-                    raise InvalidParamValueError(f"Invalid param '{self.arg_name}' type for lower/equal compare")
-                param_value = param_value[0]
-                param_value = self.vary_param_value_max(value=param_value)
-                query = query.filter(self.comparing_field.__le__(param_value))
+        param_value = values.get(self._compare_key_paths.get("__le__"))
+        if param_value is not None:
+            if len(param_value) > 1:
+                raise InvalidParamValueError(f"Invalid param '{self.arg_name}' type for lower/equal compare")
+            param_value = self.vary_param_value_max(value=param_value[0])
+            result.append(self.comparing_field.__le__(param_value))
 
-        return query
+        return result
 
     def __str__(self):
         return f"<{self.__class__.__name__}: arg={self.arg_name}, type={self.req_type}, field={self.comparing_field}, tf={self.req_type_transformer}, compares={self.allowed_compares}>"
@@ -341,12 +411,41 @@ class EnumFilter(ColumnValueFilter):
 class PostgresqlFastTextSearchFilter(Filter):
     """
     Fast text search for PostgreSQL filter.
-    # TODO: add description
+
+    Document could be provided as:
+    - `tsvector_column` (or single `TSVECTOR` column in `columns`) - stored/generated column, no tokenization on search
+    - `tsvector_expr` - arbitrary expression, should match expression index to be fast
+    - `columns` - text columns concatenated into `to_tsvector(reconfig, ...)` expression
+
+    Search strings shorter than `trigram_threshold` could be matched as prefix of `trigram_columns` with `ILIKE`
+    (served by `pg_trgm` GIN index) instead of full text search.
+
+    Usage::
+
+        class Book(DeclarativeBase):
+            title: Mapped[str_v]
+            search_ts: Mapped[str_ts] = mapped_column(
+                Computed("to_tsvector('russian', coalesce(title, ''))", persisted=True)
+            )
+
+            __table_args__ = (
+                Index("book_search_ts", search_ts, postgresql_using="gin"),
+                Index("book_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+            )
+
+
+        book_search = PostgresqlFastTextSearchFilter(tsvector_column=Book.search_ts, trigram_columns=[Book.title])
+
+        query = response_filtered(query, [book_search], params=params)
+        query = response_sorted(query, Book, params, relevance=book_search.rank_expression(params))
+
     """
 
     _tsquery_func: Callable
     _tsvector_expr: Callable
     _reconfig: str
+    _trigram_columns: list[QueryableAttribute]
+    _trigram_threshold: int
 
     def __init__(
         self,
@@ -355,19 +454,31 @@ class PostgresqlFastTextSearchFilter(Filter):
         tsquery_func: Callable[[str], Function] = None,
         reconfig="russian",
         arg_name="search_text",
+        tsvector_column: QueryableAttribute | None = None,
+        trigram_columns: QueryableAttribute | list[QueryableAttribute] | None = None,
+        trigram_threshold: int = 3,
     ):
         super().__init__(arg_name=arg_name, req_type=str, req_type_transformer=None)
 
         self._reconfig = reconfig
 
         # parse tsvector_expr
+        if columns is not None and not isinstance(columns, list | tuple):
+            columns = [columns]
+        if (
+            tsvector_column is None
+            and columns is not None
+            and len(columns) == 1
+            and isinstance(columns[0].type, TSVECTOR)
+        ):
+            tsvector_column = columns[0]
+
         if tsvector_expr is not None:
             self._tsvector_expr = tsvector_expr
+        elif tsvector_column is not None:
+            self._tsvector_expr = tsvector_column
         elif columns is not None:
             # construct tsvector_expr based on columns
-            if not isinstance(columns, list | tuple):
-                columns = [columns]
-
             _expr = func.COALESCE(columns[0], "")
             for c in columns[1:]:
                 _expr = _expr + " " + func.COALESCE(c, "")
@@ -385,22 +496,47 @@ class PostgresqlFastTextSearchFilter(Filter):
         else:
             self._tsquery_func = tsquery_func
 
-    def apply_to_query(self, query: Query, params: dict, **kwargs) -> Query:
-        # extract param
-        param_value = self.get_param_value(params=params)
+        # short queries fallback
+        if trigram_columns is not None and not isinstance(trigram_columns, list | tuple):
+            trigram_columns = [trigram_columns]
+        self._trigram_columns = list(trigram_columns or [])
+        self._trigram_threshold = trigram_threshold
+
+    def _search_string(self, values: dict[str, list[object] | None]) -> str | None:
+        param_value = values.get(self.arg_name)
         if param_value is None:
-            return query
+            return None
 
-        # apply search
         param_value = ",".join(param_value) if len(param_value) > 0 else param_value[0]
 
         # do not search over empty
         if len(param_value) == 0:
-            return query
+            return None
+        return param_value
+
+    def _is_trigram_search(self, search_string: str) -> bool:
+        return len(self._trigram_columns) > 0 and len(search_string.strip()) < self._trigram_threshold
+
+    def get_clauses(self, values: dict[str, list[object] | None]) -> list[sa.ColumnElement]:
+        # extract param
+        search_string = self._search_string(values)
+        if search_string is None:
+            return []
+
+        # short query as prefix
+        if self._is_trigram_search(search_string):
+            pattern = search_string.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            return [sa.or_(*[c.ilike(pattern, escape="\\") for c in self._trigram_columns])]
 
         # apply to columns
-        query = query.filter(self._tsvector_expr.op("@@")(self._tsquery_func(param_value)))
-        return query
+        return [self._tsvector_expr.op("@@")(self._tsquery_func(search_string))]
+
+    def rank_expression(self, params: dict, normalization: int = 0) -> sa.ColumnElement | None:
+        """`ts_rank` of document for search string from params, None if search is not applied or done by prefix"""
+        search_string = self._search_string(self.parse_params(params))
+        if search_string is None or self._is_trigram_search(search_string):
+            return None
+        return func.ts_rank(self._tsvector_expr, self._tsquery_func(search_string), normalization)
 
 
 class JsonFilterDescriptor:
@@ -422,10 +558,46 @@ class JsonFilterDescriptor:
 
 
 class JsonDataFilter(ColumnValueFilter):
-    def __init__(self, *args, **kwargs):
+    """Json column filter with descriptors in form of `key.path<compare>value`
+
+    On `JSONB` columns equality descriptors are converted to containment criteria (`data @> '{"key": value}'`)
+    that could be served by GIN index (`jsonb_ops` or `jsonb_path_ops`). Range descriptors compare
+    `(data ->> key)::float` or, if declared in `range_expressions` by key path, exactly the expression of
+    user defined index.
+
+    Usage::
+
+        class Item(DeclarativeBase):
+            data = Column(JSONB)
+
+            __table_args__ = (
+                Index("item_data_gin", data, postgresql_using="gin", postgresql_ops={"data": "jsonb_path_ops"}),
+                Index("item_data_price", data["price"].astext.cast(Numeric)),
+            )
+
+
+        JsonDataFilter(Item.data, range_expressions={"price": Item.data["price"].astext.cast(Numeric)})
+
+    """
+
+    containment: bool
+    range_expressions: dict[str, sa.ColumnElement]
+
+    def __init__(
+        self,
+        *args,
+        containment: bool | None = None,
+        range_expressions: dict[str, sa.ColumnElement] | None = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.req_type = str
         self.req_type_transformer = kwargs.get("req_type_transformer")
+        self.key_paths = (self.arg_name,)
+        if containment is None:
+            containment = isinstance(self.comparing_field.type, JSONB)
+        self.containment = containment
+        self.range_expressions = range_expressions or {}
 
     @staticmethod
     def _parse_descriptor(raw_descriptor):
@@ -478,35 +650,172 @@ class JsonDataFilter(ColumnValueFilter):
         # return results
         return result
 
-    # def apply_to_query(self, query, request):
-    def apply_to_query(self, query: Query, params: dict, **kwargs) -> Query:
+    def _containment_clause(self, descriptor: JsonFilterDescriptor) -> sa.ColumnElement | None:
+        """Containment equivalent of `field ->> key_path = value` or None if not applicable
+
+        Text compare matches both string and scalar json values, so for values that are canonical json text of number
+        or boolean (the same text `->>` returns for stored scalar, e.g. `1`, `1.5`, `true`, but not `01` or `1e2`)
+        both variants are checked. Null values and array indices are not covered by containment.
+        """
+        if not self.containment or descriptor.value is None:
+            return None
+        if any(not isinstance(c, str) for c in descriptor.key_path):
+            return None
+
+        candidates = [descriptor.value]
+        with contextlib.suppress(ValueError):
+            parsed = json.loads(descriptor.value)
+            canonical = json.dumps(parsed) == descriptor.value
+            if isinstance(parsed, bool | int | float) and math.isfinite(parsed) and canonical:
+                candidates.append(parsed)
+
+        clauses = []
+        for candidate in candidates:
+            document = candidate
+            for key_path_component in reversed(descriptor.key_path):
+                document = {key_path_component: document}
+            clauses.append(self.comparing_field.contains(document))
+        return sa.or_(*clauses) if len(clauses) > 1 else clauses[0]
+
+    def get_clauses(self, values: dict[str, list[object] | None]) -> list[sa.ColumnElement]:
         # early return
-        param_value = self.get_param_value(params, key_path=self.arg_name)
+        param_value = values.get(self.arg_name)
         if param_value is None:
-            return query
+            return []
 
         # apply filters
+        result = []
         for raw_descriptor in param_value:
             descriptor = JsonDataFilter._parse_descriptor(raw_descriptor)
 
+            # equality as containment
+            if descriptor.comparing_function == "__eq__":
+                clause = self._containment_clause(descriptor)
+                if clause is not None:
+                    result.append(clause)
+                    continue
+
             # construct comparator
             field = self.comparing_field
             for key_path_component in descriptor.key_path:
                 field = field[key_path_component]
 
+            # range compares on declared expression
+            range_expression = self.range_expressions.get(".".join(str(c) for c in descriptor.key_path))
+            if range_expression is not None and descriptor.comparing_function in _RANGE_COMPARES:
+                result.append(getattr(range_expression, descriptor.comparing_function)(descriptor.value))
+                continue
+
             if descriptor.comparing_function == "__eq__":
-                query = query.filter(field.astext.__eq__(descriptor.value))
+                result.append(field.astext.__eq__(descriptor.value))
             elif descriptor.comparing_function == "__ne__":
-                query = query.filter(field.astext.__ne__(descriptor.value))
+                result.append(field.astext.__ne__(descriptor.value))
             elif descriptor.comparing_function == "__lt__":
-                query = query.filter(field.astext.cast(Float).__lt__(descriptor.value))
+                result.append(field.astext.cast(Float).__lt__(descriptor.value))
             elif descriptor.comparing_function == "__le__":
-                query = query.filter(field.astext.cast(Float).__le__(descriptor.value))
+                result.append(field.astext.cast(Float).__le__(descriptor.value))
             elif descriptor.comparing_function == "__ge__":
-                query = query.filter(field.astext.cast(Float).__ge__(descriptor.value))
+                result.append(field.astext.cast(Float).__ge__(descriptor.value))
             elif descriptor.comparing_function == "__gt__":
-                query = query.filter(field.astext.cast(Float).__gt__(descriptor.value))
+                result.append(field.astext.cast(Float).__gt__(descriptor.value))
             else:
                 raise InvalidParamValueError(f"Unsupported comparing function {descriptor.comparing_function}")
 
+        return result
+
+
+def _is_compilable(f: Filter) -> bool:
+    """Filter criteria could be built with get_clauses
+
+    - apply_to_query is not overridden below get_clauses
+    - params extraction hooks skipped by compiled params pass (get_param_value, parse_params) are not overridden
+    """
+    cls = type(f)
+    mro = cls.__mro__
+    apply_owner = next(c for c in mro if "apply_to_query" in c.__dict__)
+    clauses_owner = next(c for c in mro if "get_clauses" in c.__dict__)
+    if not issubclass(clauses_owner, apply_owner):
+        return False
+    return cls.get_param_value is Filter.get_param_value and cls.parse_params is Filter.parse_params
+
+
+class FilterSet:
+    """Compiled list of filters
+
+    Key paths of all filters are collected once on init. On apply params are read in one pass, filters without
+    provided params are skipped before any conversion and criteria of the rest are combined into single `WHERE`.
+    Filters that override `apply_to_query` only or params extraction (`get_param_value`, `parse_params`) are applied
+    after in the usual way.
+
+    Usage::
+
+        actor_filters = FilterSet(
+            [
+                ColumnValueFilter(Actor.actor_id),
+                DatetimeFilter(Actor.created_at),
+            ]
+        )
+
+
+        def get(self, request):
+            query = response_filtered(select(Actor), actor_filters, request=request)
+
+    """
+
+    filters: list[Filter]
+    _compiled: list[tuple[Filter, tuple[str, ...]]]
+    _fallback: list[Filter]
+    _key_paths: frozenset[str]
+
+    def __init__(self, filters: list[Filter]):
+        for f in filters:
+            if not isinstance(f, Filter):
+                logger.warning(f"Invalid filters item data type: {f}")
+                raise ServerError("Improperly configured filters for filtering")
+
+        self.filters = list(filters)
+        self._compiled = [(f, f.key_paths) for f in self.filters if _is_compilable(f)]
+        self._fallback = [f for f in self.filters if not _is_compilable(f)]
+        self._key_paths = frozenset(key_path for _, key_paths in self._compiled for key_path in key_paths)
+
+    def _extract_raw(self, params: dict) -> dict[str, str]:
+        if params is None:
+            return {}
+        if isinstance(params, QueryDict):
+            return {
+                key: ",".join([str(v) for v in values])
+                for key, values in params.lists()
+                if key in self._key_paths and len(values) > 0
+            }
+        result = {}
+        for key_path in self._key_paths:
+            value = dpath_value(params, key_path, str, default=None)
+            if value is not None:
+                result[key_path] = value
+        return result
+
+    def get_clauses(self, params: dict) -> list[sa.ColumnElement]:
+        """Criteria of compilable filters for params"""
+        raw_values = self._extract_raw(params)
+        result = []
+        if not raw_values:
+            return result
+
+        for f, key_paths in self._compiled:
+            if not any(key_path in raw_values for key_path in key_paths):
+                continue
+            values = {key_path: f.parse_param_value(raw_values.get(key_path), key_path) for key_path in key_paths}
+            result.extend(f.get_clauses(values))
+        return result
+
+    def apply_to_query(self, query: Query, params: dict | None = None, **kwargs) -> Query:
+        clauses = self.get_clauses(params)
+        if clauses:
+            query = query.filter(*clauses)
+
+        for f in self._fallback:
+            query = f.apply_to_query(query=query, params=params, **kwargs)
         return query
+
+    def __str__(self):
+        return f"<{self.__class__.__name__}: filters={[str(f) for f in self.filters]}>"
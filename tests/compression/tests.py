@@ -0,0 +1,45 @@
+import gzip
+
+from django.test import SimpleTestCase, override_settings
+from django.test.client import RequestFactory
+from django.http import HttpResponse, StreamingHttpResponse
+
+# Lamb Framework
+from lamb.utils import compression
+
+CONTENT = b'{"items": [' + b",".join(b'{"key": "value"}' for _ in range(500)) + b"]}"
+
+
+@override_settings(LAMB_RESPONSE_COMPRESSION=["zstd", "br", "gzip"], LAMB_RESPONSE_COMPRESSION_MIN_SIZE=1024)
+class CompressionTestCase(SimpleTestCase):
+    def _request(self, accept_encoding):
+        return RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+
+    def test_negotiate(self):
+        for header, expected in [
+            ("gzip", "gzip"),
+            ("gzip, br", "br"),
+            ("gzip;q=1.0, br;q=0.5", "gzip"),
+            ("br;q=0, *;q=0.1", "zstd" if compression.zstandard else "gzip"),
+            ("identity", None),
+        ]:
+            with self.subTest(header):
+                codec = compression.negotiate_compression(self._request(header))
+                self.assertEqual(codec.name if codec else None, expected)
+
+    def test_compress_plain(self):
+        response = HttpResponse(CONTENT, content_type="application/json")
+        response = compression.compress_response(self._request("gzip"), response)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), CONTENT)
+
+    def test_small_not_compressed(self):
+        response = HttpResponse(b"{}", content_type="application/json")
+        response = compression.compress_response(self._request("gzip"), response)
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_compress_streaming(self):
+        response = StreamingHttpResponse(iter([CONTENT[:100], CONTENT[100:]]), content_type="application/json")
+        response = compression.compress_response(self._request("gzip"), response)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), CONTENT)
@@ -0,0 +1,85 @@
+import json
+
+from django.test import SimpleTestCase, override_settings
+from django.test.client import RequestFactory
+
+# Lamb Framework
+from lamb import exc
+from lamb.conf import get_lamb_settings, refresh_lamb_settings
+from lamb.json import JsonResponse, response
+from lamb.json.binary import negotiate_binary_encoding
+from lamb.json.encoder import JsonEncoder
+from lamb.utils.compression import get_compression_codecs
+from lamb.utils.transformers import transform_boolean
+
+
+class Point:
+    pass
+
+
+class PointEncoder(JsonEncoder):
+    pass
+
+
+PointEncoder.register(Point, lambda obj, request: "point")
+
+
+class LambSettingsTestCase(SimpleTestCase):
+    def test_snapshot_cached(self):
+        before = get_lamb_settings()
+        self.assertIs(get_lamb_settings(), before)
+        self.assertIsNot(refresh_lamb_settings(), before)
+        self.assertEqual(get_lamb_settings(), before)
+
+    def test_imported_values(self):
+        lamb_settings = get_lamb_settings()
+        self.assertIs(lamb_settings.response_encoder_class, JsonEncoder)
+        self.assertIsNone(lamb_settings.error_override_processor)
+
+    def test_refreshed_on_setting_changed(self):
+        before = get_lamb_settings()
+        with override_settings(
+            LAMB_PAGINATION_LIMIT_MAX=10,
+            LAMB_ERROR_OVERRIDE_PROCESSOR="lamb.utils.transformers.transform_boolean",
+        ):
+            self.assertEqual(get_lamb_settings().pagination_limit_max, 10)
+            self.assertIs(get_lamb_settings().error_override_processor, transform_boolean)
+        self.assertEqual(get_lamb_settings().pagination_limit_max, before.pagination_limit_max)
+        self.assertIsNone(get_lamb_settings().error_override_processor)
+
+    def test_unrelated_setting_keeps_snapshot(self):
+        before = get_lamb_settings()
+        with override_settings(USE_TZ=True):
+            self.assertIs(get_lamb_settings(), before)
+
+    def test_failed_import_raises_on_use(self):
+        with override_settings(LAMB_ERROR_OVERRIDE_PROCESSOR="lamb.unknown.processor"):
+            processor = get_lamb_settings().error_override_processor
+            with self.assertRaises(exc.ImproperlyConfiguredError):
+                processor(exc.ServerError())
+
+    def test_derived_caches_follow_override(self):
+        # encoder
+        with self.assertRaises(Exception):
+            JsonResponse({"point": Point()})
+        with override_settings(LAMB_RESPONSE_ENCODER="tests.conf.tests.PointEncoder"):
+            self.assertEqual(json.loads(JsonResponse({"point": Point()}).content), {"point": "point"})
+
+        # json engine
+        _ = JsonResponse({}).content
+        with override_settings(LAMB_RESPONSE_JSON_ENGINE="json"):
+            self.assertIs(response._JSON_DUMP_IMPL.__wrapped__, response._impl_json)
+
+        # compression
+        self.assertEqual(get_compression_codecs(), [])
+        with override_settings(LAMB_RESPONSE_COMPRESSION=["gzip"]):
+            self.assertEqual([c.name for c in get_compression_codecs()], ["gzip"])
+        self.assertEqual(get_compression_codecs(), [])
+
+        # binary encodings
+        factory = RequestFactory()
+        with override_settings(LAMB_RESPONSE_BINARY_ENCODINGS=[]):
+            self.assertIsNone(negotiate_binary_encoding(factory.get("/", HTTP_ACCEPT="application/cbor")))
+        with override_settings(LAMB_RESPONSE_BINARY_ENCODINGS=["cbor"]):
+            self.assertEqual(negotiate_binary_encoding(factory.get("/", HTTP_ACCEPT="application/cbor")).name, "cbor")
+            self.assertIsNone(negotiate_binary_encoding(factory.get("/", HTTP_ACCEPT="application/msgpack")))
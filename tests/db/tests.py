@@ -0,0 +1,97 @@
+import math
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase
+from sqlalchemy import create_engine
+
+# Lamb Framework
+from lamb.db.config import REPLICA_STRATEGY_LEAST_CONNECTIONS, Config, InvalidDatabaseConfigError, ReplicaConfig
+from lamb.db.replica import ReplicaRouter
+
+
+class ReplicaConfigTestCase(SimpleTestCase):
+    def test_replica_config(self):
+        config = Config(
+            driver="postgresql+psycopg2",
+            host="primary",
+            port=5432,
+            db_name="db",
+            username="user",
+            replicas=[{"host": "replica1"}, ReplicaConfig(host="replica2", port=5433, weight=2)],
+        )
+        self.assertEqual(config.replicas[0], ReplicaConfig(host="replica1"))
+        replica = config.replica_(1)
+        self.assertEqual(
+            (replica.host, replica.port, replica.db_name, replica.username), ("replica2", 5433, "db", "user")
+        )
+        self.assertIsNone(replica.replicas)
+        self.assertIn("replica2:5433", replica.connection_string_(sync=True, pooled=True))
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidDatabaseConfigError):
+            Config(driver="sqlite", replicas=[{"weight": 0}])
+        with self.assertRaises(InvalidDatabaseConfigError):
+            Config(driver="sqlite", replicas=[{}], replica_strategy="unknown")
+
+
+class ReplicaRouterTestCase(SimpleTestCase):
+    def _router(self, count: int = 2, **kwargs) -> ReplicaRouter:
+        config = Config(driver="sqlite", replicas=[{} for _ in range(count)], **kwargs)
+        engines = [create_engine("sqlite://") for _ in range(count)]
+        return ReplicaRouter(config, engines, sync=True)
+
+    def test_weighted(self):
+        router = self._router()
+        self.assertEqual({router.choose() for _ in range(100)}, {0, 1})
+
+    def test_least_connections(self):
+        router = self._router(replica_strategy=REPLICA_STRATEGY_LEAST_CONNECTIONS)
+        self.assertEqual(router.choose(), 0)
+        with router._engines[0].connect():
+            self.assertEqual(router.choose(), 1)
+        self.assertEqual(router.choose(), 0)
+
+    def _choose_checked(self, router: ReplicaRouter) -> int | None:
+        # lag is checked in background - replica is not used until first check finished
+        self.assertIsNone(router.choose())
+        for check in list(router._lag_checks.values()):
+            check.join()
+        return router.choose()
+
+    def test_lag_guard(self):
+        self.assertEqual(self._choose_checked(self._router(1, replica_max_lag=10, replica_lag_query="SELECT 1")), 0)
+        self.assertIsNone(self._choose_checked(self._router(1, replica_max_lag=10, replica_lag_query="SELECT 100")))
+        self.assertIsNone(self._choose_checked(self._router(1, replica_max_lag=10, replica_lag_query="SELECT bad")))
+
+    def test_lag_check_unexpected_error(self):
+        router = self._router(1, replica_max_lag=10, replica_lag_query="SELECT 1")
+        with mock.patch.object(router._engines[0], "connect", side_effect=ZeroDivisionError):
+            with self.assertLogs("lamb.db.replica", "ERROR") as logs:
+                router._check_lag(0)
+        self.assertIsNotNone(logs.records[0].exc_info)
+        self.assertEqual(router._lag, [math.inf])
+
+    def test_lag_check_single_in_flight(self):
+        router = self._router(1, replica_max_lag=10, replica_lag_query="SELECT 1", replica_lag_check_interval=0)
+        started = []
+        release = threading.Event()
+        check_lag = router._check_lag
+
+        def _check_lag(index):
+            started.append(index)
+            release.wait(5)
+            check_lag(index)
+
+        router._check_lag = _check_lag
+        for _ in range(5):
+            self.assertIsNone(router.choose())
+        self.assertEqual(started, [0])
+
+        release.set()
+        router._lag_checks[0].join()
+        self.assertEqual(router.choose(), 0)
+
+    def test_lag_guard_without_query(self):
+        # no default lag query for sqlite - guard disabled
+        self.assertEqual(self._router(1, replica_max_lag=10).choose(), 0)
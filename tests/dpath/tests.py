@@ -4,11 +4,13 @@ from datetime import date
 from functools import partial
 
 from django.conf import settings
+from django.test import SimpleTestCase
 
 # Lamb Framework
 from lamb import exc
 from lamb.utils import dpath_value
-from lamb.utils.dpath import adapt_dict_impl
+from lamb.utils import dpath as dpath_module
+from lamb.utils.dpath import ParamField, ParamsExtractor, adapt_dict_impl
 
 # noinspection PyUnresolvedReferences
 from lxml import etree
@@ -139,6 +141,84 @@ class ReduceTest(DictionaryTestMixin, LambTestCase):
     _engine = "reduce"
 
 
+class DpathAccessorTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        settings.LAMB_DPATH_DICT_ENGINE = "dpath"
+        adapt_dict_impl()
+
+    def test_dpath_semantic(self):
+        data = {"a": {"b": [{"c": 1}, {"c": 2}]}, "d": {1: "int key"}, "e.f": 3}
+        self.assertEqual(dpath_value(data, "a/b/1/c"), 2)
+        self.assertEqual(dpath_value(data, "/a/b/-1/c"), 2)
+        self.assertEqual(dpath_value(data, ["a", "b", 0, "c"]), 1)
+        self.assertEqual(dpath_value(data, "d/1"), "int key")
+        self.assertEqual(dpath_value(data, "e.f"), 3)
+        self.assertEqual(dpath_value(data, "a/b/5/c", default=None), None)
+        self.assertEqual(dpath_value(data, "e.f/g", default=None), None)
+
+    def test_glob(self):
+        data = {"a": {"b": [{"c": 1}]}}
+        self.assertEqual(dpath_value(data, "a/*/0/c"), 1)
+        self.assertEqual(dpath_value(data, "**/c"), 1)
+
+    def test_compiled_once(self):
+        dpath_module._compile_dpath_accessor.cache_clear()
+        for _ in range(3):
+            dpath_value({"key": 1}, "key")
+            dpath_value({"other": 1}, "key", default=None)
+        self.assertEqual(dpath_module._compile_dpath_accessor.cache_info().misses, 1)
+
+
+class ParamsExtractorTest(SimpleTestCase):
+    def setUp(self):
+        from lamb.utils.transformers import transform_boolean
+
+        self.extractor = ParamsExtractor(
+            [
+                ("offset", "offset", int, None, 0),
+                ("limit", "limit", int),
+                ParamField("flag", "flag", str, transform=transform_boolean, default=False),
+                ParamField("nested", "a/b", int, default=None),
+                ParamField("nullable", "nullable", str, allow_none=True, default_factory=list),
+            ],
+            name="TestParams",
+        )
+
+    def test_dict(self):
+        result = self.extractor({"limit": "10", "flag": "true", "a": {"b": "3"}, "nullable": None})
+        self.assertEqual(type(result).__name__, "TestParams")
+        self.assertEqual(
+            (result.offset, result.limit, result.flag, result.nested, result.nullable), (0, 10, True, 3, None)
+        )
+
+    def test_query_dict(self):
+        from django.http import QueryDict
+
+        result = self.extractor(QueryDict("limit=1&limit=5&offset=2"))
+        self.assertEqual(
+            (result.offset, result.limit, result.flag, result.nested, result.nullable), (2, 5, False, None, [])
+        )
+
+    def test_errors_same_as_dpath_value(self):
+        for data, exc_class in [({}, exc.InvalidBodyStructureError), ({"limit": "x"}, exc.InvalidParamTypeError)]:
+            with self.assertRaises(exc_class):
+                dpath_value(data, "limit", int)
+            with self.assertRaises(exc_class):
+                self.extractor(data)
+        self.assertEqual(self.extractor({"limit": 1, "offset": "bad"}).offset, 0)
+
+    def test_fallback_container(self):
+        extractor = ParamsExtractor([("value", "LAMB_TEST_PARAMS_EXTRACTOR", int, None, -1)])
+        self.assertEqual(extractor(os.environ).value, -1)
+        os.environ["LAMB_TEST_PARAMS_EXTRACTOR"] = "42"
+        try:
+            self.assertEqual(extractor(os.environ).value, 42)
+        finally:
+            del os.environ["LAMB_TEST_PARAMS_EXTRACTOR"]
+
+
 class EtreeTestCase(LambTestCase):
     def test_simple_path_on_tree(self):
         self.assertEqual(dpath_value(XML_DOC, "actor[2]/character[1]"), "Sir Robin")
@@ -2,11 +2,16 @@ import re
 
 # SQLAlchemy
 import sqlalchemy
+from django.http import QueryDict
+from django.test import SimpleTestCase
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm.query import Query
 
 # Lamb Framework
 from lamb.db.session import DeclarativeBase
-from lamb.utils.filters import FieldValueFilter
+from lamb.utils import response_sorted
+from lamb.utils.filters import FieldValueFilter, FilterSet, JsonDataFilter, PostgresqlFastTextSearchFilter
 
 from tests.testcases import LambTestCase
 
@@ -15,6 +20,16 @@ class Actor(DeclarativeBase):
     __tablename__ = "actor"
 
     actor_id = sqlalchemy.Column(sqlalchemy.SMALLINT, primary_key=True)
+    rating = sqlalchemy.Column(sqlalchemy.INTEGER)
+
+
+item = sqlalchemy.table(
+    "item",
+    sqlalchemy.column("item_id", sqlalchemy.INTEGER),
+    sqlalchemy.column("data", JSONB),
+    sqlalchemy.column("title", sqlalchemy.VARCHAR),
+    sqlalchemy.column("search_ts", TSVECTOR),
+)
 
 
 class FieldValueFilterTestCase(LambTestCase):
@@ -61,3 +76,157 @@ class FieldValueFilterTestCase(LambTestCase):
                 value_filter = FieldValueFilter("actor_id", str, Actor.actor_id, allowed_compares=[compare])
                 result = value_filter.apply_to_query(Query(Actor), {param: "1,null,3"})
                 assert re.search(r"WHERE actor.actor_id " + operator, str(result)), str(result)
+
+
+class FilterSetTestCase(SimpleTestCase):
+    def setUp(self):
+        self.filters = [
+            FieldValueFilter("actor_id", int, Actor.actor_id),
+            FieldValueFilter("rating", int, Actor.rating, allowed_compares=["__gt__", "__lt__"]),
+        ]
+
+    def _compile(self, query):
+        return str(query.statement.compile(dialect=postgresql.dialect()))
+
+    def test_same_as_filters(self):
+        params = QueryDict("actor_id=1&actor_id=2&actor_id.exclude=3&rating.greater=4&unknown=5")
+        expected = Query(Actor)
+        for f in self.filters:
+            expected = f.apply_to_query(expected, params)
+        result = FilterSet(self.filters).apply_to_query(Query(Actor), params)
+        self.assertEqual(self._compile(result), self._compile(expected))
+        self.assertIn("actor.rating >", self._compile(result))
+
+    def test_skip_absent(self):
+        filter_set = FilterSet(self.filters)
+        self.assertEqual(filter_set.get_clauses(QueryDict("unknown=1")), [])
+        self.assertEqual(len(filter_set.get_clauses({"rating.less": 3})), 1)
+
+    def test_fallback(self):
+        class CustomFilter(FieldValueFilter):
+            def apply_to_query(self, query, params, **kwargs):
+                return query.filter(Actor.rating.is_(None))
+
+        filter_set = FilterSet([*self.filters, CustomFilter("custom", int, Actor.rating)])
+        result = filter_set.apply_to_query(Query(Actor), {"actor_id": "1"})
+        self.assertIn("actor.rating IS NULL", self._compile(result))
+        self.assertIn("actor.actor_id =", self._compile(result))
+
+    def test_fallback_get_param_value(self):
+        class CustomFilter(FieldValueFilter):
+            def get_param_value(self, params, key_path=None):
+                if key_path == self.arg_name:
+                    return [5]
+                return super().get_param_value(params, key_path=key_path)
+
+        custom_filter = CustomFilter("custom", int, Actor.rating)
+        filter_set = FilterSet([*self.filters, custom_filter])
+        self.assertEqual(filter_set._fallback, [custom_filter])
+        result = filter_set.apply_to_query(Query(Actor), {"actor_id": "1"})
+        self.assertIn("actor.rating =", self._compile(result))
+        self.assertIn("actor.actor_id =", self._compile(result))
+
+
+class ArrayInTestCase(SimpleTestCase):
+    def _compile(self, value_filter, params):
+        query = value_filter.apply_to_query(sqlalchemy.select(Actor.actor_id), params)
+        return str(query.compile(dialect=postgresql.dialect()))
+
+    def test_postgresql(self):
+        value_filter = FieldValueFilter("actor_id", int, Actor.actor_id)
+        statement = self._compile(value_filter, {"actor_id": "1,2"})
+        self.assertIn("actor.actor_id = ANY (%(param_1)s::SMALLINT[])", statement)
+        self.assertEqual(statement, self._compile(value_filter, {"actor_id": "1,2,3,4"}))
+        self.assertIn(
+            "actor.actor_id != ALL (%(param_1)s::SMALLINT[]) AND actor.actor_id IS NOT NULL",
+            self._compile(value_filter, {"actor_id.exclude": "1,2,null"}),
+        )
+
+    def test_disabled(self):
+        value_filter = FieldValueFilter("actor_id", int, Actor.actor_id, array_in=False)
+        self.assertIn(
+            "actor.actor_id IN (__[POSTCOMPILE_actor_id_1])", self._compile(value_filter, {"actor_id": "1,2"})
+        )
+
+
+class JsonDataFilterTestCase(SimpleTestCase):
+    def _compile(self, json_filter, descriptor):
+        query = json_filter.apply_to_query(sqlalchemy.select(item.c.item_id), {"data": descriptor})
+        return str(query.compile(dialect=postgresql.dialect()))
+
+    def test_containment(self):
+        json_filter = JsonDataFilter(item.c.data)
+        self.assertIn("WHERE item.data @> %(data_1)s::JSONB", self._compile(json_filter, "info.kind==a"))
+        self.assertIn(
+            "WHERE (item.data @> %(data_1)s::JSONB) OR (item.data @> %(data_2)s::JSONB)",
+            self._compile(json_filter, "price==5"),
+        )
+        self.assertEqual(
+            [c.right.value for c in json_filter.get_clauses({"data": ["price==5"]})[0].clauses],
+            [{"price": "5"}, {"price": 5}],
+        )
+        self.assertEqual(
+            [c.right.value for c in json_filter.get_clauses({"data": ["active==true"]})[0].clauses],
+            [{"active": "true"}, {"active": True}],
+        )
+
+    def test_containment_non_canonical_number(self):
+        # `->>` returns canonical text of stored number, so these values never match numbers
+        json_filter = JsonDataFilter(item.c.data)
+        for value in "05", "1e2", "-0":
+            with self.subTest(value):
+                self.assertEqual(
+                    json_filter.get_clauses({"data": [f"price=={value}"]})[0].right.value, {"price": value}
+                )
+
+    def test_not_containable(self):
+        json_filter = JsonDataFilter(item.c.data)
+        for descriptor in "kind==null", "tags.0==a", "kind!=a":
+            with self.subTest(descriptor):
+                self.assertNotIn("@>", self._compile(json_filter, descriptor))
+        self.assertNotIn("@>", self._compile(JsonDataFilter(item.c.data, containment=False), "kind==a"))
+
+    def test_range_expressions(self):
+        expression = item.c.data["price"].astext.cast(sqlalchemy.Numeric)
+        json_filter = JsonDataFilter(item.c.data, range_expressions={"price": expression})
+        self.assertIn("WHERE CAST((item.data ->> %(data_1)s) AS NUMERIC) >=", self._compile(json_filter, "price>=5"))
+        self.assertIn("WHERE CAST((item.data ->> %(data_1)s) AS FLOAT) >=", self._compile(json_filter, "rating>=5"))
+
+
+class PostgresqlFastTextSearchFilterTestCase(SimpleTestCase):
+    def _compile(self, query):
+        return str(query.compile(dialect=postgresql.dialect()))
+
+    def test_stored_tsvector(self):
+        for search_filter in [
+            PostgresqlFastTextSearchFilter(item.c.search_ts),
+            PostgresqlFastTextSearchFilter(tsvector_column=item.c.search_ts),
+        ]:
+            with self.subTest(search_filter):
+                query = search_filter.apply_to_query(sqlalchemy.select(item.c.item_id), {"search_text": "cats"})
+                self.assertIn("WHERE item.search_ts @@ websearch_to_tsquery(", self._compile(query))
+        query = PostgresqlFastTextSearchFilter(item.c.title).apply_to_query(
+            sqlalchemy.select(item.c.item_id), {"search_text": "cats"}
+        )
+        self.assertIn("WHERE to_tsvector(", self._compile(query))
+
+    def test_trigram_fallback(self):
+        search_filter = PostgresqlFastTextSearchFilter(item.c.search_ts, trigram_columns=item.c.title)
+        clause = search_filter.get_clauses({"search_text": ["c_"]})[0]
+        self.assertIn("item.title ILIKE %(title_1)s ESCAPE", self._compile(clause))
+        self.assertEqual(clause.right.value, "c\\_%")
+        self.assertIsNone(search_filter.rank_expression({"search_text": "c_"}))
+        self.assertIn("@@", self._compile(search_filter.get_clauses({"search_text": ["cats"]})[0]))
+
+    def test_rank(self):
+        search_filter = PostgresqlFastTextSearchFilter(item.c.search_ts)
+        self.assertIsNone(search_filter.rank_expression({}))
+        rank = search_filter.rank_expression({"search_text": "cats"})
+        self.assertIn("ts_rank(item.search_ts, websearch_to_tsquery(", self._compile(rank))
+
+        query = response_sorted(sqlalchemy.select(Actor.actor_id), Actor, {}, relevance=Actor.rating)
+        self.assertIn("ORDER BY actor.rating DESC, actor.actor_id DESC", self._compile(query))
+        query = response_sorted(
+            sqlalchemy.select(Actor.actor_id), Actor, {"sorting": "actor_id{asc}"}, relevance=Actor.rating
+        )
+        self.assertIn("ORDER BY actor.actor_id ASC", self._compile(query))
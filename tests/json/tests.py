@@ -0,0 +1,239 @@
+import json
+import uuid
+import dataclasses
+from decimal import Decimal
+from datetime import date, datetime, timezone
+
+from django.test import SimpleTestCase
+from django.test.client import RequestFactory
+from django.test.utils import override_settings
+
+# Lamb Framework
+from lamb import exc
+from lamb.conf import get_lamb_settings
+from lamb.json import JsonEncoder, response
+from lamb.json.binary import BinaryResponse, CborEncoding, negotiate_binary_encoding
+from lamb.json.mixins import ResponseEncodableMixin, parse_response_fields
+
+
+@dataclasses.dataclass
+class Plain:
+    value: int = 1
+
+
+@dataclasses.dataclass
+class Hidden(ResponseEncodableMixin):
+    visible: str = "visible"
+    secret: str = "secret"
+
+    def response_encode(self, request=None):
+        return {"visible": self.visible}
+
+
+DATA = {
+    "datetime": datetime(2020, 1, 1, tzinfo=timezone.utc),
+    "date": date(2020, 5, 6),
+    "uuid": uuid.UUID("44ffdf34-9ac1-49c8-a3e2-e3b729c0863f"),
+    "decimal": Decimal("1.5"),
+    "plain": Plain(),
+    "hidden": Hidden(),
+    "text": "текст",
+    1: "int key",
+}
+
+
+class JsonEngineTestCase(SimpleTestCase):
+    def _dump(self, impl, data=DATA, indent=None):
+        encoder = get_lamb_settings().response_encoder_class(None, None)
+        return json.loads(impl(data=data, encoder=encoder, indent=indent))
+
+    def test_engines_equal_output(self):
+        expected = self._dump(response._impl_json)
+        for impl, module in [(response._impl_orjson, response.orjson), (response._impl_ujson, response.ujson)]:
+            if module is None:
+                continue
+            with self.subTest(impl.__name__):
+                self.assertEqual(self._dump(impl), expected)
+                self.assertEqual(self._dump(impl, indent=2), expected)
+
+    def test_protocol_dataclass_not_encoded_natively(self):
+        if response.orjson is None:
+            self.skipTest("orjson not installed")
+        result = self._dump(response._impl_orjson)
+        self.assertEqual(result["hidden"], {"visible": "visible"})
+        self.assertEqual(result["datetime"], 1577836800)
+
+    def test_orjson_non_finite_floats_as_null(self):
+        if response.orjson is None:
+            self.skipTest("orjson not installed")
+        data = {"nan": float("nan"), "inf": float("inf")}
+        self.assertEqual(self._dump(response._impl_orjson, data=data), {"nan": None, "inf": None})
+
+    def test_encode_object_returns_str(self):
+        self.assertIsInstance(response.JsonResponse.encode_object({"key": "value"}), str)
+
+
+class Point(ResponseEncodableMixin):
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    @classmethod
+    def response_attributes(cls):
+        return ["x", "y"]
+
+
+class Label(ResponseEncodableMixin):
+    def __init__(self, text):
+        self.text = text
+
+    def response_encode(self, request=None):
+        return self.text
+
+
+class ResponseEncodableMixinTestCase(SimpleTestCase):
+    def test_response_encode(self):
+        self.assertEqual(Point(1, 2).response_encode(), {"x": 1, "y": 2})
+
+    def test_response_encode_many(self):
+        items = [Point(1, 2), Label("label"), Point(3, 4)]
+        self.assertEqual(
+            ResponseEncodableMixin.response_encode_many(items),
+            [{"x": 1, "y": 2}, "label", {"x": 3, "y": 4}],
+        )
+
+    def test_not_configured_raises(self):
+        with self.assertRaises(NotImplementedError):
+            ResponseEncodableMixin().response_encode()
+
+    def test_response_fields(self):
+        self.assertEqual(parse_response_fields(Point, "y, x"), ("x", "y"))
+        self.assertIsNone(parse_response_fields(Point, None))
+        with self.assertRaises(exc.InvalidParamValueError):
+            parse_response_fields(Point, "x,z")
+
+        request = RequestFactory().get("/")
+        request.lamb_response_fields = {Point: ("y",)}
+        self.assertEqual(Point(1, 2).response_encode(request), {"y": 2})
+        self.assertEqual(Point(1, 2).response_encode(), {"x": 1, "y": 2})
+
+
+class Money:
+    def __init__(self, amount):
+        self.amount = amount
+
+
+class Coins(Money):
+    pass
+
+
+class JsonEncoderTestCase(SimpleTestCase):
+    def test_register(self):
+        class Encoder(JsonEncoder):
+            pass
+
+        Encoder.register(Money, lambda obj, request: f"{obj.amount} RUB")
+        self.assertEqual(json.dumps([Money(1), Coins(2)], cls=Encoder), '["1 RUB", "2 RUB"]')
+        with self.assertRaises(TypeError):
+            json.dumps(Money(1), cls=JsonEncoder)
+
+    def test_protocol_resolved_once(self):
+        class Encoder(JsonEncoder):
+            pass
+
+        json.dumps([Point(1, 2), Point(3, 4)], cls=Encoder)
+        self.assertIn(Point, Encoder._dispatch_cache)
+        self.assertEqual(json.dumps(Point(1, 2), cls=Encoder), '{"x": 1, "y": 2}')
+
+
+class StreamingJsonResponseTestCase(SimpleTestCase):
+    def test_iterator(self):
+        result = response.StreamingJsonResponse((Point(i, i) for i in range(5)), batch_size=2)
+        self.assertEqual(json.loads(b"".join(result)), [{"x": i, "y": i} for i in range(5)])
+
+    def test_nested_iterator(self):
+        data = {"total_count": 3, "items": iter([1, 2, 3]), "empty": iter([])}
+        result = response.StreamingJsonResponse(data, batch_size=2)
+        self.assertEqual(json.loads(b"".join(result)), {"total_count": 3, "items": [1, 2, 3], "empty": []})
+
+    def test_is_streamable(self):
+        self.assertTrue(response.StreamingJsonResponse.is_streamable({"items": iter([])}))
+        self.assertFalse(response.StreamingJsonResponse.is_streamable({"items": []}))
+
+
+class JsonResponseETagTestCase(SimpleTestCase):
+    def test_content_etag(self):
+        result = response.JsonResponse({"key": "value"}, request=RequestFactory().get("/"), etag=True)
+        self.assertEqual(result.status_code, 200)
+
+        request = RequestFactory().get("/", HTTP_IF_NONE_MATCH=f"W/{result['ETag']}")
+        result = response.JsonResponse({"key": "value"}, request=request, etag=True)
+        self.assertEqual(result.status_code, 304)
+        self.assertEqual(result.content, b"")
+
+    def test_version_etag_skips_encoding(self):
+        class NotEncodable:
+            pass
+
+        request = RequestFactory().get("/", HTTP_IF_NONE_MATCH='"v1"')
+        result = response.JsonResponse(NotEncodable(), request=request, etag="v1")
+        self.assertEqual(result.status_code, 304)
+        self.assertEqual(result["ETag"], '"v1"')
+
+
+class BinaryResponseTestCase(SimpleTestCase):
+    def test_msgpack(self):
+        import msgpack
+
+        data = {"point": Point(1, 2), "amount": Decimal("1.5"), "items": [1, "a"]}
+        result = BinaryResponse(data)
+        self.assertEqual(result["Content-Type"], "application/msgpack")
+        self.assertEqual(msgpack.unpackb(result.content), json.loads(response.JsonResponse(data).content))
+
+    def test_cbor(self):
+        import cbor2
+
+        result = BinaryResponse({"point": Point(1, 2)}, encoding=CborEncoding())
+        self.assertEqual(cbor2.loads(result.content), {"point": {"x": 1, "y": 2}})
+
+    def test_cbor_tagged_types_use_encoder(self):
+        import cbor2
+
+        data = {
+            "created": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "day": date(2024, 1, 2),
+            "amount": Decimal("1.5"),
+            "uid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "items": (1, Point(1, 2)),
+        }
+        result = BinaryResponse(data, encoding=CborEncoding())
+        self.assertEqual(cbor2.loads(result.content), json.loads(response.JsonResponse(data).content))
+
+    def test_vary_and_version_etag(self):
+        result = BinaryResponse({"key": "value"}, request=RequestFactory().get("/"), etag="v1")
+        self.assertEqual(result["Vary"], "Accept")
+        self.assertEqual(result["ETag"], '"v1-msgpack"')
+
+        result = BinaryResponse({"key": "value"}, encoding=CborEncoding(), etag='W/"v1"')
+        self.assertEqual(result["ETag"], 'W/"v1-cbor"')
+
+        # json representation version is not matched
+        request = RequestFactory().get("/", HTTP_IF_NONE_MATCH='"v1"')
+        result = BinaryResponse({"key": "value"}, request=request, etag="v1")
+        self.assertEqual(result.status_code, 200)
+
+        request = RequestFactory().get("/", HTTP_IF_NONE_MATCH='"v1-msgpack"')
+        result = BinaryResponse({"key": "value"}, request=request, etag="v1")
+        self.assertEqual(result.status_code, 304)
+        self.assertEqual(result["Vary"], "Accept")
+
+    @override_settings(LAMB_RESPONSE_BINARY_ENCODINGS=["msgpack", "cbor"])
+    def test_negotiate(self):
+        factory = RequestFactory()
+        self.assertEqual(negotiate_binary_encoding(factory.get("/", HTTP_ACCEPT="application/x-msgpack")).name, "msgpack")
+        self.assertIsNone(negotiate_binary_encoding(factory.get("/", HTTP_ACCEPT="application/json")))
+        self.assertIsNone(negotiate_binary_encoding(factory.get("/")))
+
+    def test_negotiate_disabled_by_default(self):
+        request = RequestFactory().get("/", HTTP_ACCEPT="application/msgpack")
+        self.assertIsNone(negotiate_binary_encoding(request))
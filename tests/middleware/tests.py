@@ -1,6 +1,22 @@
+import asyncio
+import json
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse, StreamingHttpResponse
 from django.test import SimpleTestCase
 from django.test.utils import override_settings
-from django.test.client import Client
+from django.test.client import Client, RequestFactory
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+# Lamb Framework
+from lamb import exc
+from lamb.db.context import LazySessionMap
+from lamb.middleware.db import LambSQLAlchemyMiddleware
+from lamb.middleware import execution_time
+from lamb.middleware.execution_time import LambExecutionTimeMiddleware
+from lamb.middleware.rest import LambRestApiJsonMiddleware
 
 
 @override_settings(ROOT_URLCONF="tests.middleware.urls")
@@ -14,3 +30,238 @@ class MiddlewareTest(SimpleTestCase):
         client = Client()
         result = client.get("/unknown/")
         self.assertEquals(result.status_code, 500)
+
+
+class NativeMiddlewareTest(SimpleTestCase):
+    def _request(self):
+        from django.urls import ResolverMatch
+
+        request = RequestFactory().get("/items/")
+        request.resolver_match = ResolverMatch(lambda r: None, (), {}, app_names=["tests"])
+        request.lamb_device_info = None
+        return request
+
+    def test_rest_sync(self):
+        middleware = LambRestApiJsonMiddleware(lambda request: {"key": "value"})
+        self.assertFalse(middleware.async_mode)
+        response = middleware(self._request())
+        self.assertEqual(json.loads(response.content), {"key": "value"})
+
+    def test_rest_async(self):
+        async def get_response(request):
+            return {"key": "value"}
+
+        middleware = LambRestApiJsonMiddleware(get_response)
+        self.assertTrue(middleware.async_mode)
+        response = async_to_sync(middleware)(self._request())
+        self.assertEqual(json.loads(response.content), {"key": "value"})
+
+    @override_settings(LAMB_RESPONSE_BINARY_ENCODINGS=["msgpack", "cbor"])
+    def test_rest_exception(self):
+        middleware = LambRestApiJsonMiddleware(lambda request: None)
+        response = middleware.process_exception(self._request(), exc.InvalidParamValueError("invalid"))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response["Vary"], "Accept")
+
+    @override_settings(LAMB_RESPONSE_BINARY_ENCODINGS=["msgpack", "cbor"])
+    def test_rest_vary_accept(self):
+        middleware = LambRestApiJsonMiddleware(lambda request: {"key": "value"})
+        response = middleware(self._request())
+        self.assertEqual(response["Content-Type"], "application/json; charset=utf8")
+        self.assertEqual(response["Vary"], "Accept")
+
+        request = self._request()
+        request.META["HTTP_ACCEPT"] = "application/msgpack"
+        response = middleware(request)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(response["Vary"], "Accept")
+
+    def test_rest_binary_disabled_by_default(self):
+        middleware = LambRestApiJsonMiddleware(lambda request: {"key": "value"})
+        request = self._request()
+        request.META["HTTP_ACCEPT"] = "application/msgpack"
+        response = middleware(request)
+        self.assertEqual(response["Content-Type"], "application/json; charset=utf8")
+        self.assertFalse(response.has_header("Vary"))
+
+    def test_rest_old_style_override(self):
+        class _Middleware(LambRestApiJsonMiddleware):
+            def process_response(self, request, response):
+                return response
+
+        with self.assertRaisesRegex(ValueError, r"found process_response\(\)\. Move logic to .*after_response"):
+            _Middleware(lambda request: {"key": "value"})
+
+    def test_execution_time_async_store_in_background(self):
+        stored = []
+
+        class _Middleware(LambExecutionTimeMiddleware):
+            async def _astore(self, metric):
+                await asyncio.sleep(0)
+                stored.append(metric)
+
+        async def get_response(request):
+            return HttpResponse(b"ok")
+
+        async def _run():
+            request = self._request()
+            response = await _Middleware(get_response)(request)
+            self.assertEqual(stored, [])
+            await execution_time.a_flush_execution_time_metrics()
+            self.assertEqual(execution_time._store_tasks, set())
+            return request, response
+
+        request, response = async_to_sync(_run)()
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(request.lamb_execution_meter)
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(stored[0].status_code, 200)
+
+    def test_execution_time_flush_cancels_on_timeout(self):
+        cancelled = []
+
+        class _Middleware(LambExecutionTimeMiddleware):
+            async def _astore(self, metric):
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(metric)
+                    raise
+
+        async def get_response(request):
+            return HttpResponse(b"ok")
+
+        async def _run():
+            await _Middleware(get_response)(self._request())
+            await asyncio.sleep(0)
+            await execution_time.a_flush_execution_time_metrics(timeout=0)
+            self.assertEqual(execution_time._store_tasks, set())
+
+        with self.assertLogs(execution_time.logger, "WARNING"):
+            async_to_sync(_run)()
+        self.assertEqual(len(cancelled), 1)
+
+    def test_execution_time_store_errors_logged(self):
+        middleware = LambExecutionTimeMiddleware(lambda request: HttpResponse(b"ok"))
+        with mock.patch.object(execution_time, "lamb_db_context", side_effect=OperationalError("", {}, Exception())):
+            with self.assertLogs(execution_time.logger, "ERROR") as logs:
+                middleware._store(None)
+        self.assertIsNone(logs.records[0].exc_info)
+        with mock.patch.object(execution_time, "lamb_db_context", side_effect=KeyError("default")):
+            with self.assertLogs(execution_time.logger, "ERROR") as logs:
+                middleware._store(None)
+        self.assertIsNotNone(logs.records[0].exc_info)
+
+    def test_execution_time_sync(self):
+        stored = []
+
+        class _Middleware(LambExecutionTimeMiddleware):
+            def _store(self, metric):
+                stored.append(metric)
+
+        middleware = _Middleware(lambda request: HttpResponse(b"ok", status=201))
+        request = self._request()
+        middleware.process_exception(request, ValueError())
+        middleware(request)
+        self.assertEqual([m.status_code for m in stored], [201])
+
+
+@override_settings(LAMB_DB_CONFIG={"default": {}, "other": {}})
+class LazySessionMapTest(SimpleTestCase):
+    def test_sync_untouched(self):
+        created = []
+
+        def get_response(request):
+            created.append(request.lamb_db_session_map.created_keys)
+            return HttpResponse(b"ok")
+
+        request = RequestFactory().get("/")
+        LambSQLAlchemyMiddleware(get_response)(request)
+        self.assertEqual(created, [()])
+        self.assertEqual(list(request.lamb_db_session_map), ["default", "other"])
+        self.assertIn("other", request.lamb_db_session_map)
+
+    def test_sync_default_only(self):
+        created = []
+
+        def get_response(request):
+            self.assertIs(request.lamb_db_session_map["default"], request.lamb_db_session_map["default"])
+            self.assertIsInstance(request.lamb_db_session, Session)
+            created.append(request.lamb_db_session_map.created_keys)
+            return HttpResponse(b"ok")
+
+        request = RequestFactory().get("/")
+        LambSQLAlchemyMiddleware(get_response)(request)
+        self.assertEqual(created, [("default",)])
+        self.assertEqual(request.lamb_db_session_map.created_keys, ())
+
+    def test_async_closed_after_streaming(self):
+        async def content():
+            yield b"ok"
+
+        async def get_response(request):
+            _ = request.lamb_db_session_map["default"]
+            return StreamingHttpResponse(content())
+
+        db_session = mock.Mock()
+        db_session.close = mock.AsyncMock()
+
+        async def _run():
+            request = RequestFactory().get("/")
+            response = await LambSQLAlchemyMiddleware(get_response)(request)
+            self.assertEqual(request.lamb_db_session_map.created_keys, ("default",))
+            db_session.close.assert_not_awaited()
+            self.assertEqual([chunk async for chunk in response.streaming_content], [b"ok"])
+            self.assertEqual(request.lamb_db_session_map.created_keys, ())
+            db_session.close.assert_awaited_once()
+
+        with mock.patch("lamb.db.context.lamb_db_session_maker", return_value=db_session) as session_maker:
+            async_to_sync(_run)()
+        session_maker.assert_called_once_with(pooled=True, db_key="default", sync=False)
+
+    def test_unknown_key(self):
+        with self.assertRaises(KeyError):
+            LazySessionMap(["default"])["unknown"]
+
+    def test_read_fallback_to_primary(self):
+        router = mock.Mock()
+        router.choose.return_value = None
+        with (
+            mock.patch("lamb.db.context.get_replica_router", return_value=router),
+            mock.patch("lamb.db.context.lamb_db_session_maker") as session_maker,
+        ):
+            session_map = LazySessionMap(["default"])
+            self.assertIs(session_map.read(), session_map["default"])
+            self.assertIs(session_map.read(), session_map["default"])
+            session_map.close()
+        session_maker.assert_called_once_with(pooled=True, db_key="default", sync=True)
+        session_maker.return_value.close.assert_called_once_with()
+
+    def test_close_all_on_error(self):
+        with mock.patch("lamb.db.context.lamb_db_session_maker") as session_maker:
+            sessions = [mock.Mock(), mock.Mock()]
+            sessions[0].close.side_effect = ConnectionError
+            session_maker.side_effect = sessions
+            session_map = LazySessionMap(["default", "other"])
+            session_map["default"], session_map["other"]
+            with self.assertRaises(ConnectionError):
+                session_map.close()
+        sessions[1].close.assert_called_once_with()
+        self.assertEqual(session_map.created_keys, ())
+
+    def test_read_replica(self):
+        router = mock.Mock()
+        router.choose.return_value = 1
+        with (
+            mock.patch("lamb.db.context.get_replica_router", return_value=router),
+            mock.patch("lamb.db.context.get_session_maker") as get_session_maker,
+            mock.patch("lamb.db.context.lamb_db_session_maker"),
+        ):
+            session_map = LazySessionMap(["default"])
+            read_session = session_map.read()
+            self.assertIs(session_map.read(), read_session)
+            self.assertIsNot(read_session, session_map["default"])
+            session_map.close()
+        router.choose.assert_called_once_with()
+        get_session_maker.assert_called_once_with(db_key="default", pooled=True, sync=True, replica=1)
+        read_session.close.assert_called_once_with()
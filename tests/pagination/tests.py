@@ -0,0 +1,354 @@
+import asyncio
+import enum
+from datetime import datetime, timedelta
+from unittest import mock
+
+import sqlalchemy
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session, declarative_base
+from sqlalchemy.pool import StaticPool
+
+# Lamb Framework
+from lamb import exc
+from lamb.service.redis.pagination import (
+    a_invalidate_cached_totals,
+    invalidate_cached_totals,
+    pagination_total_cache_key,
+)
+from lamb.utils import (
+    _pagination_estimate,
+    _sorting_parse_descriptors_cached,
+    a_response_paginated,
+    response_paginated,
+    response_sorted,
+)
+
+Base = declarative_base()
+
+
+class Event(Base):
+    __tablename__ = "event"
+
+    event_id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    rank = sqlalchemy.Column(sqlalchemy.Integer, nullable=True)
+    created_at = sqlalchemy.Column(sqlalchemy.DateTime, nullable=False, index=True)
+
+
+class TaskStatus(enum.Enum):
+    NEW = 3
+    ACTIVE = 1
+    DONE = 2
+
+
+class Task(Base):
+    __tablename__ = "task"
+
+    task_id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+    status = sqlalchemy.Column(sqlalchemy.Enum(TaskStatus), nullable=False)
+
+
+class PaginationTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.engine = sqlalchemy.create_engine("sqlite://")
+        Base.metadata.create_all(cls.engine)
+        with Session(cls.engine) as session:
+            start = datetime(2020, 1, 1)
+            session.add_all(
+                [
+                    Event(event_id=i, rank=i % 3 if i % 4 else None, created_at=start + timedelta(hours=i % 5))
+                    for i in range(1, 24)
+                ]
+            )
+            session.add_all([Task(task_id=i, status=list(TaskStatus)[i % 3]) for i in range(1, 8)])
+            session.commit()
+
+    def setUp(self):
+        self.session = Session(self.engine)
+
+    def tearDown(self):
+        self.session.close()
+
+    def _paginate(self, sorting: str, cursor: str = None):
+        params = {"limit": "4", "sorting": sorting}
+        if cursor is not None:
+            params["cursor"] = cursor
+        query = response_sorted(self.session.query(Event), Event, params)
+        return response_paginated(query, params=params, keyset=True)
+
+    def test_walk(self):
+        for sorting in ["created_at{asc}", "rank{asc},created_at{desc}", "rank{desc}", ""]:
+            with self.subTest(sorting):
+                expected = [
+                    e.event_id
+                    for e in response_paginated(
+                        response_sorted(self.session.query(Event), Event, {"sorting": sorting}),
+                        params={"limit": "-1"},
+                        keyset=True,
+                    )["items"]
+                ]
+                result, cursor = [], None
+                while True:
+                    page = self._paginate(sorting, cursor)
+                    self.assertEqual(page["total_count"], 23)
+                    result.extend(e.event_id for e in page["items"])
+                    cursor = page["next_cursor"]
+                    if cursor is None:
+                        break
+                self.assertEqual(result, expected)
+                self.assertEqual(len(result), 23)
+
+    def test_walk_enum_key(self):
+        query = sqlalchemy.select(Task).order_by(Task.status)
+        expected = [t.task_id for t in self.session.scalars(query.order_by(Task.task_id.desc()))]
+        result, cursor = [], None
+        for _ in range(len(expected)):
+            params = {"limit": "2"} if cursor is None else {"limit": "2", "cursor": cursor}
+            page = response_paginated(query, params=params, db_session=self.session, keyset=True)
+            result.extend(t.task_id for t in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(result, expected)
+
+    def test_keyset_zero_limit(self):
+        for data in [self.session.query(Event).order_by(Event.event_id), sqlalchemy.select(Event).order_by(Event.rank)]:
+            with self.subTest(data):
+                result = response_paginated(data, params={"limit": "0"}, db_session=self.session, keyset=True)
+                self.assertEqual(result["items"], [])
+                self.assertIsNone(result["next_cursor"])
+                self.assertEqual(result["total_count"], 23)
+
+    def test_invalid_cursor(self):
+        cursor = self._paginate("created_at{asc}")["next_cursor"]
+        with self.assertRaises(exc.InvalidParamValueError):
+            self._paginate("created_at{desc}", cursor)
+        with self.assertRaises(exc.InvalidParamValueError):
+            self._paginate("created_at{asc}", cursor[:-2])
+
+    def test_extended(self):
+        query = sqlalchemy.select(Event).order_by(Event.event_id)
+        for params, ids, extended_ids in [
+            ({"limit": "3", "offset": "2"}, [3, 4, 5], [2, 3, 4, 5, 6]),
+            ({"limit": "3"}, [1, 2, 3], [1, 2, 3, 4]),
+            ({"limit": "3", "offset": "21"}, [22, 23], [21, 22, 23]),
+            ({"limit": "-1", "offset": "21"}, [22, 23], [21, 22, 23]),
+        ]:
+            with self.subTest(params):
+                result = response_paginated(query, params=params, db_session=self.session, add_extended_query=True)
+                self.assertEqual(result["total_count"], 23)
+                self.assertEqual([e.event_id for e in result["items"]], ids)
+                self.assertEqual([e.event_id for e in result["items_extended"]], extended_ids)
+
+
+class AsyncPaginationTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+        async def _prepare():
+            async with cls.engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+                await connection.execute(
+                    sqlalchemy.insert(Event),
+                    [{"event_id": i, "rank": i, "created_at": datetime(2020, 1, 1)} for i in range(1, 11)],
+                )
+
+        async_to_sync(_prepare)()
+
+    @classmethod
+    def tearDownClass(cls):
+        async_to_sync(cls.engine.dispose)()
+        super().tearDownClass()
+
+    def _paginate(self, params: dict, **kwargs):
+        async def _run():
+            async with AsyncSession(self.engine) as session:
+                return await a_response_paginated(
+                    sqlalchemy.select(Event).order_by(Event.event_id), params=params, db_session=session, **kwargs
+                )
+
+        return async_to_sync(_run)()
+
+    def test_window_total(self):
+        for params, total, ids in [
+            ({"limit": "3", "offset": "2"}, 10, [3, 4, 5]),
+            ({"limit": "3", "offset": "20"}, 10, []),
+        ]:
+            with self.subTest(params):
+                result = self._paginate(params, total_strategy="window")
+                self.assertEqual(result["total_count"], total)
+                self.assertEqual([e.event_id for e in result["items"]], ids)
+
+    def test_window_total_rows(self):
+        result = self._paginate({"limit": "2"}, total_strategy="window", db_as_rows=True)
+        self.assertEqual(result["total_count"], 10)
+        self.assertEqual(result["items"][0]._fields, ("Event",))
+
+    def test_estimate_total_exact_fallback(self):
+        # planner estimation available only for PostgreSQL
+        result = self._paginate({"limit": "2"}, total_strategy="estimate")
+        self.assertEqual(result["total_count"], 10)
+        self.assertTrue(result["total_exact"])
+
+    def test_zero_limit(self):
+        for kwargs in [{"keyset": True}, {}, {"total_strategy": "window"}]:
+            with self.subTest(kwargs):
+                statements = []
+                sync_engine = self.engine.sync_engine
+
+                def listener(connection, cursor, statement, *args):
+                    statements.append(statement)
+
+                sqlalchemy.event.listen(sync_engine, "before_cursor_execute", listener)
+                try:
+                    result = self._paginate({"limit": "0"}, **kwargs)
+                finally:
+                    sqlalchemy.event.remove(sync_engine, "before_cursor_execute", listener)
+                self.assertEqual(result["items"], [])
+                self.assertEqual(result["total_count"], 10)
+                self.assertIsNone(result.get("next_cursor"))
+                self.assertTrue(all("LIMIT" in s for s in statements if "count" not in s.lower()))
+
+    def _session_maker_patch(self):
+        return mock.patch("lamb.db.session.get_session_maker", return_value=lambda: AsyncSession(self.engine))
+
+    def test_concurrent_total(self):
+        with self._session_maker_patch() as session_maker:
+            result = self._paginate({"limit": "3", "offset": "2"}, concurrent=True, db_key="other")
+        session_maker.assert_called_once_with("other", pooled=True, sync=False)
+        self.assertEqual(result["total_count"], 10)
+        self.assertEqual([e.event_id for e in result["items"]], [3, 4, 5])
+
+    def test_concurrent_total_keyset(self):
+        with self._session_maker_patch():
+            result = self._paginate({"limit": "3"}, concurrent=True, keyset=True)
+        self.assertEqual(result["total_count"], 10)
+        self.assertEqual([e.event_id for e in result["items"]], [1, 2, 3])
+        self.assertIsNotNone(result["next_cursor"])
+
+    def test_concurrent_total_cancelled_on_items_failure(self):
+        events = []
+
+        async def count_expr(collection):
+            events.append("started")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                # cleanup that takes a while - should be finished before failure propagation
+                await asyncio.sleep(0.01)
+                events.append("cancelled")
+                raise
+            return 0
+
+        async def _run():
+            async with AsyncSession(self.engine) as session:
+                try:
+                    await a_response_paginated(
+                        sqlalchemy.select(sqlalchemy.table("unknown", sqlalchemy.column("id"))),
+                        params={"limit": "3"},
+                        db_session=session,
+                        count_expr=count_expr,
+                        concurrent=True,
+                    )
+                finally:
+                    events.append("raised")
+
+        with self._session_maker_patch(), self.assertRaises(sqlalchemy.exc.OperationalError):
+            async_to_sync(_run)()
+        self.assertEqual(events, ["started", "cancelled", "raised"])
+
+    def test_extended(self):
+        result = self._paginate({"limit": "3", "offset": "2"}, add_extended_query=True, total_strategy="window")
+        self.assertEqual(result["total_count"], 10)
+        self.assertEqual([e.event_id for e in result["items"]], [3, 4, 5])
+        self.assertEqual([e.event_id for e in result["items_extended"]], [2, 3, 4, 5, 6])
+
+
+class TotalCacheKeyTestCase(SimpleTestCase):
+    def test_cache_key(self):
+        dialect = postgresql.dialect()
+        base = sqlalchemy.select(Event).where(Event.rank == 1)
+        key, tables = pagination_total_cache_key(base, dialect, "count")
+        self.assertEqual(tables, ["event"])
+        self.assertEqual(
+            key, pagination_total_cache_key(base.order_by(Event.rank).offset(10).limit(5), dialect, "count")[0]
+        )
+        self.assertNotEqual(
+            key, pagination_total_cache_key(sqlalchemy.select(Event).where(Event.rank == 2), dialect, "count")[0]
+        )
+        self.assertNotEqual(key, pagination_total_cache_key(base, dialect, "estimate")[0])
+        self.assertNotEqual(key, pagination_total_cache_key(base, dialect, "count", db_key="other")[0])
+
+        async def count_expr(collection):
+            return 0
+
+        self.assertNotEqual(key, pagination_total_cache_key(base, dialect, "count", count_expr=count_expr)[0])
+
+
+class TotalCacheInvalidateTestCase(SimpleTestCase):
+    def test_single_key_deletes(self):
+        r = mock.MagicMock()
+        r.smembers.return_value = {b"lamb:pagination:total:a", b"lamb:pagination:total:b"}
+        with mock.patch("lamb.service.redis.pagination._redis_conf") as redis_conf:
+            redis_conf.return_value.redis.return_value = r
+            invalidate_cached_totals("event")
+
+        r.delete.assert_not_called()
+        pipe = r.pipeline.return_value
+        self.assertTrue(all(len(call.args) == 1 for call in pipe.delete.call_args_list))
+        self.assertEqual(
+            {call.args[0] for call in pipe.delete.call_args_list},
+            {"lamb:pagination:total:table:event", b"lamb:pagination:total:a", b"lamb:pagination:total:b"},
+        )
+        pipe.execute.assert_called_once_with()
+
+    def test_single_key_deletes_async(self):
+        r = mock.MagicMock()
+        r.smembers = mock.AsyncMock(return_value={b"lamb:pagination:total:a"})
+        r.pipeline.return_value.execute = mock.AsyncMock()
+        with mock.patch("lamb.service.redis.pagination._redis_conf") as redis_conf:
+            redis_conf.return_value.aredis = mock.AsyncMock(return_value=r)
+            async_to_sync(a_invalidate_cached_totals)("event")
+
+        pipe = r.pipeline.return_value
+        self.assertEqual(
+            [call.args for call in pipe.delete.call_args_list],
+            [("lamb:pagination:total:table:event",), (b"lamb:pagination:total:a",)],
+        )
+        pipe.execute.assert_awaited_once_with()
+
+
+class EstimateTestCase(SimpleTestCase):
+    def test_explain_processes_bind_params(self):
+        connection = mock.Mock(dialect=postgresql.psycopg2.dialect())
+        connection.execute.return_value.scalar.return_value = [{"Plan": {"Plan Rows": 5}}]
+        statement = sqlalchemy.select(Task).where(Task.status.in_([TaskStatus.ACTIVE, TaskStatus.DONE]))
+
+        self.assertEqual(_pagination_estimate(statement, connection), 5)
+        (explain,), _ = connection.execute.call_args
+        compiled = explain.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+        self.assertTrue(str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT"))
+        self.assertIn("IN ('ACTIVE', 'DONE')", str(compiled))
+
+
+class SortingTestCase(SimpleTestCase):
+    def test_cached_descriptors(self):
+        _sorting_parse_descriptors_cached.cache_clear()
+        for _ in range(3):
+            query = response_sorted(sqlalchemy.select(Event), Event, {"sorting": "rank{asc}"})
+        self.assertEqual(_sorting_parse_descriptors_cached.cache_info().misses, 2)  # client and primary key sorting
+        self.assertIn("ORDER BY event.rank ASC, event.event_id DESC", str(query))
+
+    def test_index_aware(self):
+        response_sorted(sqlalchemy.select(Event), Event, {"sorting": "created_at"}, index_aware="strict")
+        response_sorted(sqlalchemy.select(Event), Event, {}, default_sorting="rank", index_aware="strict")
+        with self.assertLogs("lamb.utils", level="WARNING"):
+            response_sorted(sqlalchemy.select(Event), Event, {"sorting": "rank"}, index_aware="warn")
+        with self.assertRaises(exc.InvalidParamValueError):
+            response_sorted(sqlalchemy.select(Event), Event, {"sorting": "rank"}, index_aware="strict")